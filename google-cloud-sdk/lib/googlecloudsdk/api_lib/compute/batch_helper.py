@@ -18,7 +18,12 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+from concurrent import futures
+import heapq
 import json
+import random
+import threading
+import time
 
 from apitools.base.py import batch
 from apitools.base.py import exceptions
@@ -26,12 +31,27 @@ from apitools.base.py import exceptions
 from googlecloudsdk.api_lib.compute import operation_quota_utils
 from googlecloudsdk.api_lib.compute import utils
 from googlecloudsdk.api_lib.util import apis
+from googlecloudsdk.core import log
 from googlecloudsdk.core import properties
+from googlecloudsdk.core import transport
+
+from six.moves import http_client as httplib
 
 # Upper bound on batch size
 # https://cloud.google.com/compute/docs/api/how-tos/batch
 _BATCH_SIZE_LIMIT = 1000
 
+# Attempts per request in concurrent mode, like BatchApiRequest.Execute().
+_MAX_ATTEMPTS = 5
+
+# Jittered exponential backoff of throttled requests, in seconds.
+_INITIAL_RETRY_DELAY = 1
+_MAX_RETRY_DELAY = 32
+
+# Responses that ask the client to slow down.
+_THROTTLED_STATUS_CODES = frozenset(
+    [httplib.TOO_MANY_REQUESTS, httplib.SERVICE_UNAVAILABLE])
+
 
 class BatchChecker(object):
   """Class to conveniently curry the prompted_service_tokens cache."""
@@ -75,14 +95,212 @@ class BatchChecker(object):
                              is_batch_request=True)
 
 
-def MakeRequests(requests, http, batch_url=None):
+class ThreadLocalHttp(object):
+  """Authorized HTTP transports, one per thread.
+
+  The transport of an API client is not thread safe, so threads that make
+  requests concurrently each need their own.
+  """
+
+  def __init__(self):
+    self._local = threading.local()
+
+  def Get(self):
+    """Returns the transport of the calling thread."""
+    http = getattr(self._local, 'http', None)
+    if http is None:
+      # pylint: disable=g-import-not-at-top, Only import credentials when
+      # they are needed.
+      from googlecloudsdk.core.credentials import transports
+      http = transports.GetApitoolsTransport(
+          response_encoding=transport.ENCODING)
+      self._local.http = http
+    return http
+
+
+class _AdaptiveConcurrency(object):
+  """Additive increase, multiplicative decrease concurrency limit.
+
+  Attributes:
+    limit: int, The current number of batches that may be in flight.
+  """
+
+  def __init__(self, max_limit):
+    self._max_limit = max_limit
+    self.limit = max_limit
+
+  def Update(self, throttled):
+    """Adjusts the limit after a batch completes.
+
+    Args:
+      throttled: bool, True if the API asked the client to slow down.
+    """
+    if throttled:
+      self.limit = max(1, self.limit // 2)
+    elif self.limit < self._max_limit:
+      self.limit += 1
+
+
+def _RetryDelay(attempt):
+  """Returns the jittered delay before the given retry attempt."""
+  delay = min(_MAX_RETRY_DELAY, _INITIAL_RETRY_DELAY * 2 ** (attempt - 1))
+  return delay * random.uniform(0.5, 1.5)
+
+
+def _StatusCode(api_call):
+  """Returns the HTTP status code of a failed api call, None otherwise."""
+  if isinstance(api_call.exception, exceptions.HttpError):
+    return api_call.exception.status_code
+  return None
+
+
+def _ErrorMessage(api_call):
+  """Returns the (status code, message) error of a failed api call."""
+  # TODO(b/33771874): Use HttpException to decode error payloads.
+  error_message = None
+  if isinstance(api_call.exception, exceptions.HttpError):
+    try:
+      data = json.loads(api_call.exception.content)
+      if utils.JsonErrorHasDetails(data):
+        error_message = (api_call.exception.status_code,
+                         BuildMessageForErrorWithDetails(data))
+      else:
+        error_message = (api_call.exception.status_code,
+                         data.get('error', {}).get('message'))
+    except ValueError:
+      pass
+    if not error_message:
+      error_message = (api_call.exception.status_code,
+                       api_call.exception.content)
+  else:
+    error_message = (None, api_call.exception.message)
+  return error_message
+
+
+def _ExecuteBatch(requests, http, batch_url, retryable_codes,
+                  batch_request_callback, max_retries=5):
+  """Executes requests as batch requests and returns their api calls."""
+  batch_request = batch.BatchApiRequest(batch_url=batch_url,
+                                        retryable_codes=retryable_codes)
+  for service, method, request in requests:
+    batch_request.Add(service, method, request)
+
+  return batch_request.Execute(
+      http, max_retries=max_retries, max_batch_size=_BATCH_SIZE_LIMIT,
+      batch_request_callback=batch_request_callback)
+
+
+def _ExecuteConcurrently(requests, batch_url, retryable_codes, max_concurrency,
+                         response_callback=None):
+  """Executes requests as concurrent batch requests.
+
+  The requests are split into batches that are sent on up to max_concurrency
+  threads. Each batch is sent once; requests that are throttled (429, 503) or
+  retryable are sent again in a later batch after a jittered exponential
+  backoff, instead of delaying their whole batch. The number of batches in
+  flight is halved whenever a batch has throttled requests and grows back by
+  one for every batch that has none.
+
+  Args:
+    requests: A list of (service, method, request object) tuples.
+    batch_url: The URL to which to send the requests.
+    retryable_codes: The list of HTTP status codes to retry.
+    max_concurrency: int, The maximum number of batches in flight.
+    response_callback: Called as response_callback(index, api_call) in the
+      calling thread as soon as the request at index completes.
+
+  Returns:
+    The list of completed api calls, in request order.
+  """
+  batch_size = min(
+      _BATCH_SIZE_LIMIT, -(-len(requests) // max_concurrency))
+  concurrency = _AdaptiveConcurrency(max_concurrency)
+  http = ThreadLocalHttp()
+  # TODO(b/36030477) this shouldn't be necessary in the future when batch and
+  # non-batch error handling callbacks are unified
+  batch_checker = BatchChecker(set())
+  batch_checker_lock = threading.Lock()
+
+  def _BatchCheck(http_response, exception):
+    # API enablement prompts from concurrent batches must not interleave.
+    with batch_checker_lock:
+      batch_checker.BatchCheck(http_response, exception)
+
+  def _Execute(indexes):
+    return _ExecuteBatch([requests[i] for i in indexes], http.Get(),
+                         batch_url, retryable_codes, _BatchCheck,
+                         max_retries=1)
+
+  api_calls = [None] * len(requests)
+  attempts = [0] * len(requests)
+  ready = list(range(len(requests)))
+  ready.reverse()
+  # (retry time, request index) of the requests waiting for their backoff.
+  delayed = []
+  in_flight = {}
+  executor = futures.ThreadPoolExecutor(max_workers=max_concurrency)
+  try:
+    while ready or delayed or in_flight:
+      now = time.time()
+      while delayed and delayed[0][0] <= now:
+        ready.append(heapq.heappop(delayed)[1])
+      while ready and len(in_flight) < concurrency.limit:
+        indexes = [ready.pop() for _ in range(min(batch_size, len(ready)))]
+        in_flight[executor.submit(_Execute, indexes)] = indexes
+      timeout = max(0, delayed[0][0] - now) if delayed else None
+      if not in_flight:
+        time.sleep(timeout)
+        continue
+      done, _ = futures.wait(
+          in_flight, timeout=timeout, return_when=futures.FIRST_COMPLETED)
+      for future in done:
+        indexes = in_flight.pop(future)
+        throttled = False
+        for index, api_call in zip(indexes, future.result()):
+          attempts[index] += 1
+          request_throttled = (
+              _StatusCode(api_call) in _THROTTLED_STATUS_CODES)
+          throttled = throttled or request_throttled
+          if ((request_throttled or not api_call.terminal_state) and
+              attempts[index] < _MAX_ATTEMPTS):
+            heapq.heappush(
+                delayed, (time.time() + _RetryDelay(attempts[index]), index))
+            continue
+          api_calls[index] = api_call
+          if response_callback:
+            response_callback(index, api_call)
+        concurrency.Update(throttled)
+        if throttled:
+          log.debug('Batch requests throttled, concurrency reduced to %d.',
+                    concurrency.limit)
+  finally:
+    for future in in_flight:
+      future.cancel()
+    executor.shutdown(wait=False)
+  return api_calls
+
+
+def _BatchConcurrency():
+  """Returns the compute/batch_concurrency property, 1 if it is not set."""
+  return properties.VALUES.compute.batch_concurrency.GetInt() or 1
+
+
+def MakeRequests(requests, http, batch_url=None, response_callback=None):
   """Makes batch requests.
 
+  With the compute/batch_concurrency property set to more than 1 the requests
+  are sent as concurrent batch requests, see _ExecuteConcurrently().
+
   Args:
     requests: A list of tuples. Each tuple must be of the form
         (service, method, request object).
     http: An HTTP object.
     batch_url: The URL to which to send the requests.
+    response_callback: If not None, called as response_callback(index,
+      response, error) for each request when it completes, where index is the
+      index of the request in requests and error is the (status code, message)
+      error of a failed request or None. In concurrent mode this happens as
+      each request completes instead of after all of them.
 
   Returns:
     A tuple where the first element is a list of all objects returned
@@ -95,17 +313,25 @@ def MakeRequests(requests, http, batch_url=None):
     # retryable codes for the batch request. If we should not prompt, then
     # we keep retryable_codes empty, so the request fails.
     retryable_codes.append(apis.API_ENABLEMENT_ERROR_EXPECTED_STATUS_CODE)
-  batch_request = batch.BatchApiRequest(batch_url=batch_url,
-                                        retryable_codes=retryable_codes)
-  for service, method, request in requests:
-    batch_request.Add(service, method, request)
 
-  # TODO(b/36030477) this shouldn't be necessary in the future when batch and
-  # non-batch error handling callbacks are unified
-  batch_checker = BatchChecker(set())
-  responses = batch_request.Execute(
-      http, max_batch_size=_BATCH_SIZE_LIMIT,
-      batch_request_callback=batch_checker.BatchCheck)
+  def _Callback(index, api_call):
+    error = _ErrorMessage(api_call) if api_call.is_error else None
+    response_callback(index, api_call.response, error)
+
+  max_concurrency = _BatchConcurrency()
+  if max_concurrency > 1 and len(requests) > 1:
+    responses = _ExecuteConcurrently(
+        requests, batch_url, retryable_codes, max_concurrency,
+        response_callback=_Callback if response_callback else None)
+  else:
+    # TODO(b/36030477) this shouldn't be necessary in the future when batch and
+    # non-batch error handling callbacks are unified
+    batch_checker = BatchChecker(set())
+    responses = _ExecuteBatch(
+        requests, http, batch_url, retryable_codes, batch_checker.BatchCheck)
+    if response_callback:
+      for index, response in enumerate(responses):
+        _Callback(index, response)
 
   objects = []
   errors = []
@@ -114,26 +340,7 @@ def MakeRequests(requests, http, batch_url=None):
     objects.append(response.response)
 
     if response.is_error:
-      # TODO(b/33771874): Use HttpException to decode error payloads.
-      error_message = None
-      if isinstance(response.exception, exceptions.HttpError):
-        try:
-          data = json.loads(response.exception.content)
-          if utils.JsonErrorHasDetails(data):
-            error_message = (response.exception.status_code,
-                             BuildMessageForErrorWithDetails(data))
-          else:
-            error_message = (response.exception.status_code,
-                             data.get('error', {}).get('message'))
-        except ValueError:
-          pass
-        if not error_message:
-          error_message = (response.exception.status_code,
-                           response.exception.content)
-      else:
-        error_message = (None, response.exception.message)
-
-      errors.append(error_message)
+      errors.append(_ErrorMessage(response))
 
   return objects, errors
 
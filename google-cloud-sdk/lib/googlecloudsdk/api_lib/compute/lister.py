@@ -923,30 +923,27 @@ class ZonalLister(object):
     scope_set = frontend.scope_set
     filter_expr = frontend.filter
     if isinstance(scope_set, ZoneSet):
-      for project, zones in six.iteritems(
-          _GroupByProject(sorted(list(scope_set)))):
-        for item in GetZonalResourcesDicts(
-            service=self.service,
-            project=project,
-            requested_zones=[zone_ref.zone for zone_ref in zones],
-            filter_expr=filter_expr,
-            http=self.client.apitools_client.http,
-            batch_url=self.client.batch_url,
-            errors=errors):
-          yield item
+      request_groups = [
+          FormatListRequests(self.service, project,
+                             [zone_ref.zone for zone_ref in zones], 'zone',
+                             filter_expr)
+          for project, zones in six.iteritems(
+              _GroupByProject(sorted(list(scope_set))))
+      ]
     else:
       # scopeSet is AllScopes
       # generate AggregatedList
-      for project_ref in sorted(list(scope_set.projects)):
-        for item in GetZonalResourcesDicts(
-            service=self.service,
-            project=project_ref.project,
-            requested_zones=[],
-            filter_expr=filter_expr,
-            http=self.client.apitools_client.http,
-            batch_url=self.client.batch_url,
-            errors=errors):
-          yield item
+      request_groups = [
+          FormatListRequests(self.service, project_ref.project, [], 'zone',
+                             filter_expr)
+          for project_ref in sorted(list(scope_set.projects))
+      ]
+    for item in request_helper.ListJsonGroups(
+        request_groups,
+        http=self.client.apitools_client.http,
+        batch_url=self.client.batch_url,
+        errors=errors):
+      yield item
     if errors:
       if _AllowPartialError():
         utils.WarnIfPartialRequestFail(errors)
@@ -994,30 +991,27 @@ class RegionalLister(object):
     scope_set = frontend.scope_set
     filter_expr = frontend.filter
     if isinstance(scope_set, RegionSet):
-      for project, regions in six.iteritems(
-          _GroupByProject(sorted(list(scope_set)))):
-        for item in GetRegionalResourcesDicts(
-            service=self.service,
-            project=project,
-            requested_regions=[region_ref.region for region_ref in regions],
-            filter_expr=filter_expr,
-            http=self.client.apitools_client.http,
-            batch_url=self.client.batch_url,
-            errors=errors):
-          yield item
+      request_groups = [
+          FormatListRequests(self.service, project,
+                             [region_ref.region for region_ref in regions],
+                             'region', filter_expr)
+          for project, regions in six.iteritems(
+              _GroupByProject(sorted(list(scope_set))))
+      ]
     else:
       # scopeSet is AllScopes
       # generate AggregatedList
-      for project_ref in sorted(list(scope_set.projects)):
-        for item in GetRegionalResourcesDicts(
-            service=self.service,
-            project=project_ref.project,
-            requested_regions=[],
-            filter_expr=filter_expr,
-            http=self.client.apitools_client.http,
-            batch_url=self.client.batch_url,
-            errors=errors):
-          yield item
+      request_groups = [
+          FormatListRequests(self.service, project_ref.project, [], 'region',
+                             filter_expr)
+          for project_ref in sorted(list(scope_set.projects))
+      ]
+    for item in request_helper.ListJsonGroups(
+        request_groups,
+        http=self.client.apitools_client.http,
+        batch_url=self.client.batch_url,
+        errors=errors):
+      yield item
 
     if errors:
       if _AllowPartialError():
@@ -1063,15 +1057,17 @@ class GlobalLister(object):
     errors = []
     scope_set = frontend.scope_set
     filter_expr = frontend.filter
-    for project_ref in sorted(list(scope_set)):
-      for item in GetGlobalResourcesDicts(
-          service=self.service,
-          project=project_ref.project,
-          filter_expr=filter_expr,
-          http=self.client.apitools_client.http,
-          batch_url=self.client.batch_url,
-          errors=errors):
-        yield item
+    request_groups = [
+        FormatListRequests(self.service, project_ref.project, None, None,
+                           filter_expr)
+        for project_ref in sorted(list(scope_set))
+    ]
+    for item in request_helper.ListJsonGroups(
+        request_groups,
+        http=self.client.apitools_client.http,
+        batch_url=self.client.batch_url,
+        errors=errors):
+      yield item
     if errors:
       utils.RaiseException(errors, ListException)
 
@@ -18,9 +18,13 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+from concurrent import futures
 import copy
+import heapq
 import json
 
+from apitools.base.py import exceptions
+from apitools.base.py import http_wrapper
 from googlecloudsdk.api_lib.compute import batch_helper
 from googlecloudsdk.api_lib.compute import single_request_helper
 from googlecloudsdk.api_lib.compute import utils
@@ -29,8 +33,12 @@ from googlecloudsdk.core import log
 from googlecloudsdk.core import properties
 
 import six
+from six.moves import http_client as httplib
 from six.moves import zip  # pylint: disable=redefined-builtin
 
+# The number of list pages, in flight or not yet consumed, per list thread.
+_PAGES_PER_LIST_THREAD = 2
+
 
 def _RequestsAreListRequests(requests):
   """Checks if all requests are of list requests."""
@@ -218,6 +226,166 @@ def _ForceBatchRequest():
   return properties.VALUES.compute.force_batch_request.GetBool()
 
 
+def _ListConcurrency():
+  """Returns the compute/list_concurrency property, 1 if it is not set."""
+  return properties.VALUES.compute.list_concurrency.GetInt() or 1
+
+
+class _PageFetcher(object):
+  """Fetches single list pages as JSON, one HTTP transport per thread."""
+
+  def __init__(self):
+    self._http = batch_helper.ThreadLocalHttp()
+
+  def Fetch(self, service, method, request):
+    """Fetches one list page.
+
+    Args:
+      service: The service the request is sent to.
+      method: str, The list method name.
+      request: The list request message.
+
+    Returns:
+      A (items, next_page_token, errors) tuple for the page. HTTP errors are
+      returned in errors instead of being raised, like batch_helper does.
+    """
+    errors = []
+    client = service.client
+    method_config = service.GetMethodConfig(method)
+    http_request = service.PrepareHttpRequest(method_config, request)
+    opts = {
+        'retries': client.num_retries,
+        'max_retry_wait': client.max_retry_wait,
+    }
+    if client.check_response_func:
+      opts['check_response_func'] = client.check_response_func
+    if client.retry_func:
+      opts['retry_func'] = client.retry_func
+    http_response = http_wrapper.MakeRequest(
+        self._http.Get(), http_request, **opts)
+    if http_response.status_code == httplib.NO_CONTENT:
+      return [], None, errors
+    if http_response.status_code != httplib.OK:
+      # pylint: disable=protected-access, Same error messages as single
+      # requests.
+      errors.append(single_request_helper._GenerateErrorMessage(
+          exceptions.HttpError.FromResponse(http_response)))
+      return [], None, errors
+    items, next_page_token = _HandleJsonList(
+        http_response.content, service, method, errors)
+    return items, next_page_token, errors
+
+
+def ListJsonConcurrently(request_groups, errors, max_workers=None,
+                         ordered=None):
+  """Pages through groups of list requests concurrently.
+
+  Every request is an independent stream of pages, fetched on a bounded pool
+  of threads. At most _PAGES_PER_LIST_THREAD pages per thread are in flight or
+  waiting to be consumed, so memory stays bounded when the caller consumes
+  items slower than they arrive.
+
+  In ordered mode items are yielded in the same order as ListJson() called on
+  each group in turn: all groups in order, and within a group the first page
+  of every request in order, then the second pages, and so on. In unordered
+  mode the items of each page are yielded as soon as the page arrives.
+
+  Args:
+    request_groups: A list of request lists. Each request is a (service,
+      method, request message) tuple, see ListJson().
+    errors: A list for capturing errors. If any response contains an error, it
+      is added to this list.
+    max_workers: int, The maximum number of concurrent page requests. Defaults
+      to the compute/list_concurrency property.
+    ordered: bool, Yield items in the ordered mode described above. Defaults
+      to the inverse of the compute/list_unordered property.
+
+  Yields:
+    Resources in dicts as they are received from the server.
+  """
+  if max_workers is None:
+    max_workers = _ListConcurrency()
+  if ordered is None:
+    ordered = not properties.VALUES.compute.list_unordered.GetBool()
+  max_pages = max_workers * _PAGES_PER_LIST_THREAD
+
+  # Pages not yet requested, keyed by (group, page number, request index), the
+  # ordered mode consumption order. A page is only known once the previous
+  # page of its request has been consumed.
+  pending = []
+  for group_index, requests in enumerate(request_groups):
+    for request_index, (service, method, request) in enumerate(requests):
+      heapq.heappush(
+          pending, ((group_index, 0, request_index), service, method, request))
+
+  fetcher = _PageFetcher()
+  executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+  # Maps the future of each requested page to its pending entry.
+  requested = {}
+
+  def _Request(entry):
+    future = executor.submit(fetcher.Fetch, *entry[1:])
+    requested[future] = entry
+
+  try:
+    while pending or requested:
+      while pending and len(requested) < max_pages:
+        _Request(heapq.heappop(pending))
+      if ordered:
+        if pending and (not requested or
+                        pending[0][0] < min(e[0] for e in requested.values())):
+          # The next page in order was not known when the pool was filled.
+          _Request(heapq.heappop(pending))
+        future = min(requested, key=lambda f: requested[f][0])
+      else:
+        done, _ = futures.wait(requested, return_when=futures.FIRST_COMPLETED)
+        future = min(done, key=lambda f: requested[f][0])
+      (group_index, page, request_index), service, method, request = (
+          requested.pop(future))
+      items, next_page_token, page_errors = future.result()
+      errors.extend(page_errors)
+      if next_page_token:
+        next_request = copy.deepcopy(request)
+        next_request.pageToken = next_page_token
+        heapq.heappush(pending, ((group_index, page + 1, request_index),
+                                 service, method, next_request))
+      for item in items:
+        yield item
+  finally:
+    # The caller may stop early, drop the pages it will never consume.
+    for future in requested:
+      future.cancel()
+    executor.shutdown(wait=False)
+
+
+def ListJsonGroups(request_groups, http, batch_url, errors):
+  """Makes the list requests of each group, groups in order.
+
+  Groups are typically the requests of one project. With the
+  compute/list_concurrency property set all groups are paged concurrently by
+  ListJsonConcurrently(), otherwise each group is listed by ListJson() in
+  turn.
+
+  Args:
+    request_groups: A list of request lists, see ListJson().
+    http: An httplib2.Http-like object.
+    batch_url: The handler for making batch requests.
+    errors: A list for capturing errors. If any response contains an error, it
+      is added to this list.
+
+  Yields:
+    Resources in dicts as they are received from the server.
+  """
+  request_groups = [requests for requests in request_groups if requests]
+  if _ListConcurrency() > 1:
+    for item in ListJsonConcurrently(request_groups, errors):
+      yield item
+    return
+  for requests in request_groups:
+    for item in ListJson(requests, http, batch_url, errors):
+      yield item
+
+
 def ListJson(requests, http, batch_url, errors):
   """Makes a series of list and/or aggregatedList batch requests.
 
@@ -241,6 +409,10 @@ def ListJson(requests, http, batch_url, errors):
   Yields:
     Resources in dicts as they are received from the server.
   """
+  if _ListConcurrency() > 1:
+    for item in ListJsonConcurrently([requests], errors):
+      yield item
+    return
   # This is compute-specific helper. It is assumed at this point that all
   # requests are being sent to the same client (for example Compute).
   with requests[0][0].client.JsonResponseModel():
@@ -322,8 +494,14 @@ def MakeRequests(
         service=service, method=method, request_body=request_body
     )
   else:
+    # Concurrent batches report each response as its batch completes, so the
+    # tracker keeps moving while the remaining batches are in flight.
+    def _TickProgress(unused_index, unused_response, unused_error):
+      progress_tracker.Tick()
+
     responses, new_errors = batch_helper.MakeRequests(
-        requests=requests, http=http, batch_url=batch_url)
+        requests=requests, http=http, batch_url=batch_url,
+        response_callback=_TickProgress if progress_tracker else None)
   errors.extend(new_errors)
 
   operation_service = None
@@ -18,6 +18,8 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+import collections
+
 from apitools.base.py import exceptions as apitools_exceptions
 
 from googlecloudsdk.api_lib.compute import batch_helper
@@ -31,6 +33,9 @@ from googlecloudsdk.core import properties
 _POLLING_TIMEOUT_SEC = 60 * 30
 _MAX_TIME_BETWEEN_POLLS_SEC = 5
 _SERVICE_UNAVAILABLE_RETRY_COUNT = 3
+# Operation names are ORed into the list filter, which must fit in the request
+# URL.
+_MAX_OPERATIONS_PER_LIST = 50
 
 # The set of possible operation types is {insert, delete, update,
 # *.insert, *.delete, *.update} + all verbs. For example,
@@ -422,6 +427,85 @@ class OperationData(object):
         pass
 
 
+def _OperationsListThreshold():
+  """Returns the compute/operations_list_threshold property, 0 to disable."""
+  return properties.VALUES.compute.operations_list_threshold.GetInt() or 0
+
+
+def _OperationScope(data):
+  """Returns the key of the operations list scope of data, None if unlistable.
+
+  Args:
+    data: OperationData, The pending operation.
+
+  Returns:
+    A (operation_service, project, zone, region) tuple for operations that
+    can be polled with the operations list method, None otherwise.
+  """
+  if not data.project or data.IsGlobalOrganizationOperation():
+    return None
+  if 'List' not in data.operation_service.GetMethodsList():
+    return None
+  return (data.operation_service, data.project, data.operation.zone,
+          data.operation.region)
+
+
+def _OperationsListRequest(operations_data):
+  """Generates an operations list request that returns the given operations.
+
+  Args:
+    operations_data: [OperationData], Pending operations in the same scope.
+
+  Returns:
+    The apitools list request message.
+  """
+  data = operations_data[0]
+  request = data.operation_service.GetRequestType('List')(
+      project=data.project,
+      # The value is an RE2 expression that must match the entire name.
+      filter='name eq "{0}"'.format(
+          '|'.join(d.operation.name for d in operations_data)),
+      maxResults=_MAX_OPERATIONS_PER_LIST)
+  if data.operation.zone:
+    request.zone = path_simplifier.Name(data.operation.zone)
+  elif data.operation.region:
+    request.region = path_simplifier.Name(data.operation.region)
+  return request
+
+
+def _GroupOperationsForList(pending_operations, unlistable_scopes, threshold):
+  """Groups pending operations that can share operations list requests.
+
+  Args:
+    pending_operations: [OperationData], The operations to poll.
+    unlistable_scopes: set, Scopes whose list requests failed before.
+    threshold: int, The minimum number of operations in a scope to list it.
+
+  Returns:
+    A (list_groups, remaining) tuple where list_groups is a list of
+    OperationData lists, one per list request, and remaining is the list of
+    OperationData to poll individually.
+  """
+  if not threshold:
+    return [], pending_operations
+  scopes = collections.OrderedDict()
+  remaining = []
+  for data in pending_operations:
+    scope = _OperationScope(data)
+    if scope is None or scope in unlistable_scopes:
+      remaining.append(data)
+    else:
+      scopes.setdefault(scope, []).append(data)
+  list_groups = []
+  for group in scopes.values():
+    if len(group) < threshold:
+      remaining.extend(group)
+      continue
+    for i in range(0, len(group), _MAX_OPERATIONS_PER_LIST):
+      list_groups.append(group[i:i + _MAX_OPERATIONS_PER_LIST])
+  return list_groups, remaining
+
+
 def WaitForOperations(
     operations_data,
     http,
@@ -447,6 +531,12 @@ def WaitForOperations(
     log_result: Whether the Operation Waiter should print the result in past
       tense of each request.
 
+  If the compute/operations_list_threshold property is set and enough
+  operations are pending in one zone, region or global scope, they are polled
+  with a single operations list request filtered on their names instead of one
+  wait request each. Scopes whose list request fails fall back to wait
+  requests.
+
   Yields:
     The resources pointed to by the operations' targetLink fields if
     the operation type is not delete. Only resources whose
@@ -471,6 +561,8 @@ def WaitForOperations(
 
   start = time_util.CurrentTimeSec()
   sleep_sec = 0
+  list_threshold = _OperationsListThreshold()
+  unlistable_scopes = set()
   # There is only one type of operation in compute API.
   # We pick the type of the first operation in the list.
   operation_type = operations_data[0].operation_service.GetResponseType('Get')
@@ -480,16 +572,19 @@ def WaitForOperations(
       progress_tracker.Tick()
     resource_requests = []
     operation_requests = []
+    pending_operations = []
+    # The (operation, retry count) of each resource request.
+    resource_request_operations = []
+    retry_counts = {}
 
     log.debug('Operations to inspect: %s', unprocessed_operations)
-    for operation, _ in unprocessed_operations:
+    for operation, retry_count in unprocessed_operations:
       # Reify operation
       data = operation_details[operation.selfLink]
       # Need to update the operation since old operation may not have all the
       # required information.
       data.SetOperation(operation)
 
-      operation_service = data.operation_service
       resource_service = data.resource_service
 
       if operation.status == operation_type.StatusValueValuesEnum.DONE:
@@ -529,6 +624,7 @@ def WaitForOperations(
           # Some operations do not have target and should not send get request.
           if request:
             resource_requests.append((resource_service, 'Get', request))
+            resource_request_operations.append((operation, retry_count))
 
         # Only log when there is target link in the operation.
         if operation.targetLink and log_result:
@@ -537,17 +633,27 @@ def WaitForOperations(
                   operation.operationType).capitalize(), operation.targetLink))
 
       else:
-        # The operation has not reached the DONE state, so we add a request
-        # to poll the operation.
-        # TODO(b/129413862): Global org operation service supports wait API.
-        if data.IsGlobalOrganizationOperation():
-          request = data.OperationGetRequest()
-          operation_requests.append((operation_service, 'Get', request))
-        else:
-          request = data.OperationWaitRequest()
-          operation_requests.append((operation_service, 'Wait', request))
-
-    requests = resource_requests + operation_requests
+        pending_operations.append(data)
+        retry_counts[operation.selfLink] = retry_count
+
+    list_groups, pending_operations = _GroupOperationsForList(
+        pending_operations, unlistable_scopes, list_threshold)
+    for data in pending_operations:
+      # The operation has not reached the DONE state, so we add a request
+      # to poll the operation.
+      # TODO(b/129413862): Global org operation service supports wait API.
+      if data.IsGlobalOrganizationOperation():
+        request = data.OperationGetRequest()
+        operation_requests.append((data.operation_service, 'Get', request))
+      else:
+        request = data.OperationWaitRequest()
+        operation_requests.append((data.operation_service, 'Wait', request))
+    # The list requests go last so that the responses and errors of the other
+    # requests keep their positions.
+    list_requests = [(group[0].operation_service, 'List',
+                      _OperationsListRequest(group)) for group in list_groups]
+
+    requests = resource_requests + operation_requests + list_requests
     if not requests:
       break
     if (
@@ -560,12 +666,25 @@ def WaitForOperations(
     else:
       responses, request_errors = batch_helper.MakeRequests(
           requests=requests, http=http, batch_url=batch_url)
+    if list_requests:
+      list_responses = responses[-len(list_requests):]
+      responses = responses[:-len(list_requests)]
+      # Errors are in request order, so failed list requests own the last
+      # errors. They are not reported, their operations are waited on instead.
+      failed_lists = list_responses.count(None)
+      if failed_lists:
+        request_errors = request_errors[:-failed_lists]
+    else:
+      list_responses = []
 
     all_done = True
     # If a request return error, the response will be none. In this case, append
     # the previous operation back to unprocessed_operations. Thus we need to
-    # save the unprocessed_operations before reset
-    previous_operations = unprocessed_operations
+    # save the operation of each request in responses before reset
+    previous_operations = resource_request_operations + [
+        (data.operation, retry_counts[data.operation.selfLink])
+        for data in pending_operations
+    ]
     # save the current errors in case timeout
     current_errors = list(request_errors)
     unprocessed_operations = []
@@ -592,6 +711,24 @@ def WaitForOperations(
       else:
         yield response
 
+    for group, response in zip(list_groups, list_responses):
+      listed = {}
+      if response is not None:
+        listed = {operation.name: operation for operation in response.items}
+      for data in group:
+        operation = listed.get(data.operation.name)
+        if operation is None:
+          # The scope does not support filtered listing, or the operation was
+          # not returned. Keep the operation and wait on it from now on.
+          log.debug('Operation %s was not listed.', data.operation.name)
+          unlistable_scopes.add(_OperationScope(data))
+          operation = data.operation
+        unprocessed_operations.append(
+            (operation, _SERVICE_UNAVAILABLE_RETRY_COUNT)
+        )
+        if operation.status != operation_type.StatusValueValuesEnum.DONE:
+          all_done = False
+
     errors.extend(request_errors)
 
     # If there are no more operations, we are done.
@@ -22,6 +22,7 @@ from __future__ import unicode_literals
 
 import enum
 
+from googlecloudsdk.api_lib.storage import errors
 from googlecloudsdk.command_lib.storage import storage_url
 
 
@@ -32,10 +33,14 @@ class Capability(enum.Enum):
   ENCRYPTION = 'ENCRYPTION'
   MANAGED_FOLDERS = 'MANAGED_FOLDERS'
   FOLDERS = 'FOLDERS'
+  # list_objects accepts start_offset and end_offset.
+  LIST_OFFSETS = 'LIST_OFFSETS'
   STORAGE_LAYOUT = 'STORAGE_LAYOUT'
   RESUMABLE_UPLOAD = 'RESUMABLE_UPLOAD'
   SLICED_DOWNLOAD = 'SLICED_DOWNLOAD'
   APPENDABLE_UPLOAD = 'APPENDABLE_UPLOAD'
+  # delete_objects and patch_objects_metadata send batch requests.
+  BATCH_REQUESTS = 'BATCH_REQUESTS'
   # For daisy chain operations, the upload stream is not purely seekable.
   # For certain seek calls, we raise errors to avoid re-downloading the object.
   # We do not want the "seekable" method for the upload stream to always return
@@ -126,6 +131,10 @@ class CloudApi(object):
   # that do not support compose_objects.
   MAX_OBJECTS_PER_COMPOSE_CALL = 1
 
+  # APIs that support batch requests override this with the number of calls
+  # one batch request accepts.
+  MAX_REQUESTS_PER_BATCH = 1
+
   # All supported APIs currently limit object names to 1024 UTF-8 encoded bytes.
   # S3: https://docs.aws.amazon.com/AmazonS3/latest/userguide/object-keys.html
   # GCS: https://cloud.google.com/storage/docs/objects#naming
@@ -617,6 +626,34 @@ class CloudApi(object):
     """
     raise NotImplementedError('delete_object must be overridden.')
 
+  def delete_objects(self, object_urls_and_request_configs):
+    """Deletes objects, in batch requests if the API supports them.
+
+    Unlike delete_object, errors deleting individual objects are returned
+    instead of raised, so that one failure does not hide the others.
+
+    Args:
+      object_urls_and_request_configs (list[tuple[storage_url.CloudUrl,
+        RequestConfig]]): The objects to delete and the arguments for each
+        call.
+
+    Returns:
+      list[CloudApiError|None]: The error deleting each object, in order, or
+        None if it was deleted.
+
+    Raises:
+      CloudApiError: A batch request failed as a whole.
+    """
+    object_errors = []
+    for object_url, request_config in object_urls_and_request_configs:
+      try:
+        self.delete_object(object_url, request_config)
+      except errors.CloudApiError as e:
+        object_errors.append(e)
+      else:
+        object_errors.append(None)
+    return object_errors
+
   def download_object(self,
                       cloud_resource,
                       download_stream,
@@ -731,6 +768,8 @@ class CloudApi(object):
       next_page_token=None,
       object_state=ObjectState.LIVE,
       list_filter=None,
+      start_offset=None,
+      end_offset=None,
   ):
     """Lists objects (with metadata) and prefixes in a bucket.
 
@@ -754,6 +793,12 @@ class CloudApi(object):
         filters will be returned, The prefixes would still be returned
         regardless of whether they match the specified filter, See
         go/gcs-object-context-filtering for more details.
+      start_offset (str|None): Only list objects whose names are
+        lexicographically equal to or after start_offset. Requires the
+        LIST_OFFSETS capability.
+      end_offset (str|None): Only list objects whose names are
+        lexicographically before end_offset. Requires the LIST_OFFSETS
+        capability.
 
     Yields:
       Iterator over resource_reference.ObjectResource objects.
@@ -801,6 +846,41 @@ class CloudApi(object):
     """
     raise NotImplementedError('patch_object_metadata must be overridden.')
 
+  def patch_objects_metadata(self, patch_arguments):
+    """Updates the metadata of objects, in batch requests if supported.
+
+    Unlike patch_object_metadata, errors patching individual objects are
+    returned instead of raised, so that one failure does not hide the others.
+
+    Args:
+      patch_arguments (list[tuple[resource_reference.ObjectResource,
+        RequestConfig, PosixAttributes|None]]): For each object, its metadata
+        updates, the arguments for the call, and POSIX info to set as custom
+        metadata. See patch_object_metadata.
+
+    Returns:
+      list[CloudApiError|None]: The error patching each object, in order, or
+        None if it was patched.
+
+    Raises:
+      CloudApiError: A batch request failed as a whole.
+    """
+    object_errors = []
+    for object_resource, request_config, posix_to_set in patch_arguments:
+      try:
+        self.patch_object_metadata(
+            object_resource.storage_url.bucket_name,
+            object_resource.storage_url.resource_name,
+            object_resource,
+            request_config=request_config,
+            posix_to_set=posix_to_set,
+        )
+      except errors.CloudApiError as e:
+        object_errors.append(e)
+      else:
+        object_errors.append(None)
+    return object_errors
+
   def set_object_iam_policy(self,
                             bucket_name,
                             object_name,
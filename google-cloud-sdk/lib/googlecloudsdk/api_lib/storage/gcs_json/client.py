@@ -27,6 +27,7 @@ import errno
 import json
 import uuid
 
+from apitools.base.py import batch as apitools_batch
 from apitools.base.py import exceptions as apitools_exceptions
 from apitools.base.py import list_pager
 from apitools.base.py import transfer as apitools_transfer
@@ -72,6 +73,9 @@ patch_apitools_messages.patch()
 KB = 1024  # Bytes.
 MINIMUM_PROGRESS_CALLBACK_THRESHOLD = 512 * KB
 
+# Calls in a batch request that fail with these statuses are sent again.
+_BATCH_RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
 _NOTIFICATION_PAYLOAD_FORMAT_KEY_TO_API_CONSTANT = {
     cloud_api.NotificationPayloadFormat.JSON: 'JSON_API_V1',
     cloud_api.NotificationPayloadFormat.NONE: 'NONE',
@@ -286,11 +290,13 @@ class JsonClient(cloud_api.CloudApi):
   """Client for Google Cloud Storage API."""
 
   capabilities = {
+      cloud_api.Capability.BATCH_REQUESTS,
       cloud_api.Capability.COMPOSE_OBJECTS,
       cloud_api.Capability.DAISY_CHAIN_SEEKABLE_UPLOAD_STREAM,
       cloud_api.Capability.ENCRYPTION,
       cloud_api.Capability.MANAGED_FOLDERS,
       cloud_api.Capability.FOLDERS,
+      cloud_api.Capability.LIST_OFFSETS,
       cloud_api.Capability.STORAGE_LAYOUT,
       cloud_api.Capability.RESUMABLE_UPLOAD,
       cloud_api.Capability.SLICED_DOWNLOAD,
@@ -300,6 +306,9 @@ class JsonClient(cloud_api.CloudApi):
   # https://cloud.google.com/storage/docs/json_api/v1/objects/compose
   MAX_OBJECTS_PER_COMPOSE_CALL = 32
 
+  # https://cloud.google.com/storage/docs/batch
+  MAX_REQUESTS_PER_BATCH = 100
+
   def __init__(self):
     super(JsonClient, self).__init__()
     self.client = core_apis.GetClientInstance('storage', 'v1')
@@ -975,24 +984,96 @@ class JsonClient(cloud_api.CloudApi):
     return metadata_util.get_object_resource_from_metadata(
         rewrite_response.resource)
 
-  @error_util.catch_http_error_raise_gcs_api_error()
-  def delete_object(self, object_url, request_config):
-    """See super class."""
+  def _get_delete_object_request(self, object_url, request_config):
+    """Returns a StorageObjectsDeleteRequest for delete_object(s)."""
     # S3 requires a string, but GCS uses an int for generation.
     if object_url.generation is not None:
       generation = int(object_url.generation)
     else:
       generation = None
 
-    request = self.messages.StorageObjectsDeleteRequest(
+    return self.messages.StorageObjectsDeleteRequest(
         bucket=object_url.bucket_name,
         object=object_url.resource_name,
         generation=generation,
         ifGenerationMatch=request_config.precondition_generation_match,
         ifMetagenerationMatch=request_config.precondition_metageneration_match)
+
+  @error_util.catch_http_error_raise_gcs_api_error()
+  def delete_object(self, object_url, request_config):
+    """See super class."""
     # Success returns an empty body.
     # https://cloud.google.com/storage/docs/json_api/v1/objects/delete
-    self.client.objects.Delete(request)
+    self.client.objects.Delete(
+        self._get_delete_object_request(object_url, request_config))
+
+  def _get_batch_url(self):
+    """Returns the batch endpoint on the host of the configured endpoint."""
+    parsed_url = urllib.parse.urlparse(self.client.url)
+    return urllib.parse.urljoin(
+        '{}://{}'.format(parsed_url.scheme, parsed_url.netloc),
+        'batch/storage/v1')
+
+  def _execute_object_batch(self, method_name, requests_and_cleared_fields):
+    """Sends object requests in batch requests and returns their errors.
+
+    Calls that fail with a retryable status are sent again in later batch
+    requests, up to the storage/max_retries property.
+
+    Args:
+      method_name (str): Method of the objects service, like "Delete".
+      requests_and_cleared_fields (list[tuple[Message, list[str]]]): Request
+        messages and the fields of each to send as null.
+
+    Returns:
+      list[CloudApiError|None]: The error of each call, in order, or None if
+        it succeeded.
+    """
+    call_errors = []
+    for start in range(
+        0, len(requests_and_cleared_fields), self.MAX_REQUESTS_PER_BATCH
+    ):
+      batch_request = apitools_batch.BatchApiRequest(
+          batch_url=self._get_batch_url(),
+          retryable_codes=list(_BATCH_RETRYABLE_STATUS_CODES),
+      )
+      for request, cleared_fields in requests_and_cleared_fields[
+          start:start + self.MAX_REQUESTS_PER_BATCH
+      ]:
+        # Fields are serialized when the call is added.
+        with self.client.IncludeFields(cleared_fields):
+          batch_request.Add(self.client.objects, method_name, request)
+
+      api_calls = batch_request.Execute(
+          self.client.http,
+          sleep_between_polls=(
+              properties.VALUES.storage.base_retry_delay.GetInt()
+          ),
+          max_retries=properties.VALUES.storage.max_retries.GetInt() + 1,
+      )
+      for api_call in api_calls:
+        if api_call.is_error:
+          call_errors.append(
+              cloud_errors.translate_error(
+                  api_call.exception,
+                  error_util.ERROR_TRANSLATION,
+                  status_code_getter=error_util.get_status_code,
+              )
+          )
+        else:
+          call_errors.append(None)
+    return call_errors
+
+  @error_util.catch_http_error_raise_gcs_api_error()
+  def delete_objects(self, object_urls_and_request_configs):
+    """See super class."""
+    return self._execute_object_batch(
+        'Delete',
+        [
+            (self._get_delete_object_request(object_url, request_config), [])
+            for object_url, request_config in object_urls_and_request_configs
+        ],
+    )
 
   @error_util.catch_http_error_raise_gcs_api_error()
   def download_object(self,
@@ -1127,6 +1208,8 @@ class JsonClient(cloud_api.CloudApi):
       next_page_token=None,
       object_state=cloud_api.ObjectState.LIVE,
       list_filter=None,
+      start_offset=None,
+      end_offset=None,
   ):
     """See super class."""
     projection = self._get_projection(fields_scope,
@@ -1175,6 +1258,8 @@ class JsonClient(cloud_api.CloudApi):
           # Avoid needlessly appending "&softDeleted=False" to URL.
           softDeleted=soft_deleted,
           filter=list_filter,
+          startOffset=start_offset,
+          endOffset=end_offset,
       )
 
       try:
@@ -1206,7 +1291,7 @@ class JsonClient(cloud_api.CloudApi):
       # TODO(b/160238394) Decrypt metadata fields if necessary.
       for object_metadata in list_result.items:
         object_metadata.bucket = bucket_name
-        yield metadata_util.get_object_resource_from_metadata(
+        yield metadata_util.get_listed_object_resource_from_metadata(
             object_metadata)
 
       # Yield prefixes.
@@ -1221,8 +1306,7 @@ class JsonClient(cloud_api.CloudApi):
       if not next_page_token:
         break
 
-  @error_util.catch_http_error_raise_gcs_api_error()
-  def patch_object_metadata(
+  def _get_patch_object_request(
       self,
       bucket_name,
       object_name,
@@ -1232,7 +1316,7 @@ class JsonClient(cloud_api.CloudApi):
       generation=None,
       posix_to_set=None,
   ):
-    """See super class."""
+    """Returns a StorageObjectsPatchRequest for patch_object(s)_metadata."""
     # S3 requires a string, but GCS uses an int for generation.
     if generation:
       generation = int(generation)
@@ -1260,7 +1344,7 @@ class JsonClient(cloud_api.CloudApi):
         posix_to_set=posix_to_set,
         method_type=metadata_util.MethodType.OBJECT_PATCH,
     )
-    request = self.messages.StorageObjectsPatchRequest(
+    return self.messages.StorageObjectsPatchRequest(
         bucket=bucket_name,
         object=object_name,
         objectResource=object_metadata,
@@ -1272,12 +1356,55 @@ class JsonClient(cloud_api.CloudApi):
         projection=projection,
     )
 
+  @error_util.catch_http_error_raise_gcs_api_error()
+  def patch_object_metadata(
+      self,
+      bucket_name,
+      object_name,
+      object_resource,
+      request_config,
+      fields_scope=cloud_api.FieldsScope.NO_ACL,
+      generation=None,
+      posix_to_set=None,
+  ):
+    """See super class."""
+    request = self._get_patch_object_request(
+        bucket_name,
+        object_name,
+        object_resource,
+        request_config,
+        fields_scope=fields_scope,
+        generation=generation,
+        posix_to_set=posix_to_set,
+    )
     with self.client.IncludeFields(
         metadata_util.get_cleared_object_fields(request_config)
     ):
       updated_metadata = self.client.objects.Patch(request)
     return metadata_util.get_object_resource_from_metadata(updated_metadata)
 
+  @error_util.catch_http_error_raise_gcs_api_error()
+  def patch_objects_metadata(self, patch_arguments):
+    """See super class."""
+    return self._execute_object_batch(
+        'Patch',
+        [
+            (
+                self._get_patch_object_request(
+                    object_resource.storage_url.bucket_name,
+                    object_resource.storage_url.resource_name,
+                    object_resource,
+                    request_config,
+                    posix_to_set=posix_to_set,
+                ),
+                metadata_util.get_cleared_object_fields(request_config),
+            )
+            for object_resource, request_config, posix_to_set in (
+                patch_arguments
+            )
+        ],
+    )
+
   @error_util.catch_http_error_raise_gcs_api_error()
   def set_object_iam_policy(self,
                             bucket_name,
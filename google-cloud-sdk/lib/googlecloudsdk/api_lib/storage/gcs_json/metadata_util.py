@@ -404,66 +404,104 @@ def _parse_contexts_from_object_metadata(metadata):
   return parsed_contexts
 
 
-def get_object_resource_from_metadata(metadata):
-  """Helper method to generate a ObjectResource instance from GCS metadata.
+def _get_decryption_key_hash_sha256(metadata):
+  if metadata.customerEncryption:
+    return metadata.customerEncryption.keySha256
+  return None
 
-  Args:
-    metadata (messages.Object): Extract resource properties from this.
 
-  Returns:
-    ObjectResource with properties populated by metadata.
-  """
+def _get_encryption_algorithm(metadata):
+  if metadata.customerEncryption:
+    return metadata.customerEncryption.encryptionAlgorithm
+  return None
+
+
+# Maps GcsObjectResource initializer arguments to functions converting them
+# from object metadata.
+_OBJECT_RESOURCE_FIELD_GETTERS = {
+    'acl': lambda metadata: _message_to_dict(metadata.acl),
+    'cache_control': lambda metadata: metadata.cacheControl,
+    'component_count': lambda metadata: metadata.componentCount,
+    'content_disposition': lambda metadata: metadata.contentDisposition,
+    'content_encoding': lambda metadata: metadata.contentEncoding,
+    'content_language': lambda metadata: metadata.contentLanguage,
+    'content_type': lambda metadata: metadata.contentType,
+    'crc32c_hash': lambda metadata: metadata.crc32c,
+    'creation_time': lambda metadata: metadata.timeCreated,
+    'contexts': _parse_contexts_from_object_metadata,
+    'custom_fields': lambda metadata: _message_to_dict(metadata.metadata),
+    'custom_time': lambda metadata: metadata.customTime,
+    'decryption_key_hash_sha256': _get_decryption_key_hash_sha256,
+    'encryption_algorithm': _get_encryption_algorithm,
+    'etag': lambda metadata: metadata.etag,
+    'event_based_hold': lambda metadata: (
+        metadata.eventBasedHold if metadata.eventBasedHold else None
+    ),
+    'hard_delete_time': lambda metadata: metadata.hardDeleteTime,
+    'kms_key': lambda metadata: metadata.kmsKeyName,
+    'md5_hash': lambda metadata: metadata.md5Hash,
+    'metageneration': lambda metadata: metadata.metageneration,
+    'noncurrent_time': lambda metadata: metadata.timeDeleted,
+    'retention_expiration': lambda metadata: metadata.retentionExpirationTime,
+    'retention_settings': lambda metadata: _message_to_dict(metadata.retention),
+    'size': lambda metadata: metadata.size,
+    'soft_delete_time': lambda metadata: metadata.softDeleteTime,
+    'storage_class': lambda metadata: metadata.storageClass,
+    'storage_class_update_time': (
+        lambda metadata: metadata.timeStorageClassUpdated
+    ),
+    'temporary_hold': lambda metadata: (
+        metadata.temporaryHold if metadata.temporaryHold else None
+    ),
+    'update_time': lambda metadata: metadata.updated,
+}
+
+
+def _get_object_url_from_metadata(metadata):
+  """Returns the CloudUrl of GCS object metadata."""
   if metadata.generation is not None:
     # Generation may be 0 integer, which is valid although falsy.
     generation = str(metadata.generation)
   else:
     generation = None
-  url = storage_url.CloudUrl(
+  return storage_url.CloudUrl(
       scheme=storage_url.ProviderPrefix.GCS,
       bucket_name=metadata.bucket,
       resource_name=metadata.name,
       generation=generation)
 
-  if metadata.customerEncryption:
-    decryption_key_hash_sha256 = metadata.customerEncryption.keySha256
-    encryption_algorithm = metadata.customerEncryption.encryptionAlgorithm
-  else:
-    decryption_key_hash_sha256 = encryption_algorithm = None
 
+def get_object_resource_from_metadata(metadata):
+  """Helper method to generate a ObjectResource instance from GCS metadata.
+
+  Args:
+    metadata (messages.Object): Extract resource properties from this.
+
+  Returns:
+    ObjectResource with properties populated by metadata.
+  """
+  fields = {
+      name: getter(metadata)
+      for name, getter in _OBJECT_RESOURCE_FIELD_GETTERS.items()
+  }
   return gcs_resource_reference.GcsObjectResource(
-      url,
-      acl=_message_to_dict(metadata.acl),
-      cache_control=metadata.cacheControl,
-      component_count=metadata.componentCount,
-      content_disposition=metadata.contentDisposition,
-      content_encoding=metadata.contentEncoding,
-      content_language=metadata.contentLanguage,
-      content_type=metadata.contentType,
-      crc32c_hash=metadata.crc32c,
-      creation_time=metadata.timeCreated,
-      contexts=_parse_contexts_from_object_metadata(metadata),
-      custom_fields=_message_to_dict(metadata.metadata),
-      custom_time=metadata.customTime,
-      decryption_key_hash_sha256=decryption_key_hash_sha256,
-      encryption_algorithm=encryption_algorithm,
-      etag=metadata.etag,
-      event_based_hold=(
-          metadata.eventBasedHold if metadata.eventBasedHold else None
-      ),
-      hard_delete_time=metadata.hardDeleteTime,
-      kms_key=metadata.kmsKeyName,
-      md5_hash=metadata.md5Hash,
-      metadata=metadata,
-      metageneration=metadata.metageneration,
-      noncurrent_time=metadata.timeDeleted,
-      retention_expiration=metadata.retentionExpirationTime,
-      retention_settings=_message_to_dict(metadata.retention),
-      size=metadata.size,
-      soft_delete_time=metadata.softDeleteTime,
-      storage_class=metadata.storageClass,
-      storage_class_update_time=metadata.timeStorageClassUpdated,
-      temporary_hold=metadata.temporaryHold if metadata.temporaryHold else None,
-      update_time=metadata.updated,
+      _get_object_url_from_metadata(metadata), metadata=metadata, **fields
+  )
+
+
+def get_listed_object_resource_from_metadata(metadata):
+  """Returns a resource for listed object metadata that converts it lazily.
+
+  Args:
+    metadata (messages.Object): Extract resource properties from this.
+
+  Returns:
+    GcsListedObjectResource, which converts properties when they are read.
+  """
+  return gcs_resource_reference.GcsListedObjectResource(
+      _get_object_url_from_metadata(metadata),
+      metadata,
+      _OBJECT_RESOURCE_FIELD_GETTERS,
   )
 
 
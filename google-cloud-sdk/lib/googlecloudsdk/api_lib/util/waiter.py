@@ -20,9 +20,15 @@ from __future__ import division
 from __future__ import unicode_literals
 
 import abc
+import collections
+from concurrent import futures
+import random
+import threading
 import time
 
 from apitools.base.py import encoding
+from apitools.base.py import exceptions as apitools_exceptions
+from apitools.base.py import list_pager
 from googlecloudsdk.core import exceptions
 from googlecloudsdk.core.console import progress_tracker
 from googlecloudsdk.core.util import retry
@@ -35,6 +41,10 @@ _TIMEOUT_MESSAGE = (
     'https://console.developers.google.com/ to check resource state.')
 
 
+# The page size of operations List calls made by batch pollers.
+_LIST_PAGE_SIZE = 100
+
+
 class TimeoutError(exceptions.Error):
   pass
 
@@ -94,6 +104,106 @@ class OperationPoller(six.with_metaclass(abc.ABCMeta, object)):
     return None
 
 
+class BatchOperationPoller(OperationPoller):
+  """An OperationPoller that can poll many operations with fewer requests.
+
+  PollManyUntilDone() and WaitForMany() call PollMany() once per polling round
+  instead of calling Poll() for each pending operation.
+  """
+
+  @abc.abstractmethod
+  def PollMany(self, operation_refs):
+    """Retrieves many operations given their references.
+
+    Args:
+      operation_refs: list, ids for the operations.
+
+    Returns:
+      The list of operations in operation_refs order. An item is None if the
+      operation could not be retrieved in bulk and must be polled with Poll().
+    """
+    return [None] * len(operation_refs)
+
+
+class _OperationLister(object):
+  """Retrieves longrunning operations in bulk with the operations List method.
+
+  Operations are grouped by their parent collection and each group is listed
+  with one (paged) List call. APIs that accept a filter on operation names can
+  pass a list_filter_func that restricts the listing to the operations being
+  polled. A parent whose List call fails, or that does not return one of the
+  operations within max_listed_operations, is not listed again.
+
+  Attributes:
+    operation_service: apitools.base.py.base_api.BaseApiService, api service
+      for retrieving information about ongoing operations.
+    get_name: func(operation_ref) that returns the operation name.
+    get_parent: func(name) that returns the List parent of an operation name.
+    list_filter_func: func([name]) that returns the List filter for the names,
+      or None to list without a filter.
+    list_field: str, The operations field of the List response.
+    max_listed_operations: int, The maximum number of operations listed per
+      parent and poll.
+  """
+
+  def __init__(self, operation_service, get_name, get_parent=None,
+               list_filter_func=None, list_field='operations',
+               max_listed_operations=1000):
+    self.operation_service = operation_service
+    self.get_name = get_name
+    self.get_parent = get_parent or (lambda name: name.rsplit('/', 2)[0])
+    self.list_filter_func = list_filter_func
+    self.list_field = list_field
+    self.max_listed_operations = max_listed_operations
+    self._unlistable_parents = set()
+
+  def _ListRequest(self, parent, names):
+    request_type = self.operation_service.GetRequestType('List')
+    fields = set(field.name for field in request_type.all_fields())
+    request = request_type()
+    setattr(request, 'name' if 'name' in fields else 'parent', parent)
+    if self.list_filter_func:
+      request.filter = self.list_filter_func(names)
+    return request
+
+  def List(self, operation_refs):
+    """Implements BatchOperationPoller.PollMany()."""
+    if 'List' not in self.operation_service.GetMethodsList():
+      return [None] * len(operation_refs)
+    names = [self.get_name(ref) for ref in operation_refs]
+    parents = collections.OrderedDict()
+    for name in names:
+      parent = self.get_parent(name)
+      if parent not in self._unlistable_parents:
+        parents.setdefault(parent, set()).add(name)
+
+    operations = {}
+    for parent, wanted in six.iteritems(parents):
+      if len(wanted) < 2:
+        # A Get is as cheap as a List.
+        continue
+      found = 0
+      try:
+        for operation in list_pager.YieldFromList(
+            self.operation_service,
+            self._ListRequest(parent, sorted(wanted)),
+            field=self.list_field,
+            limit=self.max_listed_operations,
+            batch_size=_LIST_PAGE_SIZE,
+            batch_size_attribute='pageSize'):
+          if operation.name in wanted:
+            operations[operation.name] = operation
+            found += 1
+            if found == len(wanted):
+              break
+      except apitools_exceptions.HttpError:
+        self._unlistable_parents.add(parent)
+        continue
+      if found < len(wanted):
+        self._unlistable_parents.add(parent)
+    return [operations.get(name) for name in names]
+
+
 class CloudOperationPoller(OperationPoller):
   """Manages a longrunning Operations.
 
@@ -150,6 +260,41 @@ class CloudOperationPoller(OperationPoller):
     return self.result_service.Get(request_type(name=response_dict['name']))
 
 
+class CloudOperationBatchPoller(CloudOperationPoller, BatchOperationPoller):
+  """A CloudOperationPoller that polls operations with the List method.
+
+  Each poll round lists the pending operations of a parent collection with a
+  single List call instead of one Get per operation, and falls back to Get for
+  APIs and parents that do not support it.
+  """
+
+  def __init__(self, result_service, operation_service, get_parent_func=None,
+               list_filter_func=None, list_field='operations'):
+    """Sets up poller for cloud operations.
+
+    Args:
+      result_service: apitools.base.py.base_api.BaseApiService, api service for
+        retrieving created result of initiated operation.
+      operation_service: apitools.base.py.base_api.BaseApiService, api service
+        for retrieving information about ongoing operation.
+      get_parent_func: func(name) that returns the List parent of an operation
+        name. Defaults to the name without its last two segments, e.g.
+        `projects/p/locations/l` for `projects/p/locations/l/operations/o`.
+      list_filter_func: func([name]) that returns a List filter restricting the
+        listing to the named operations, for APIs that support it.
+      list_field: str, The operations field of the List response.
+    """
+    super(CloudOperationBatchPoller, self).__init__(
+        result_service, operation_service)
+    self._lister = _OperationLister(
+        operation_service, lambda x: x.RelativeName(), get_parent_func,
+        list_filter_func, list_field)
+
+  def PollMany(self, operation_refs):
+    """Overrides."""
+    return self._lister.List(operation_refs)
+
+
 class CloudOperationPollerNoResources(OperationPoller):
   """Manages longrunning Operations for Cloud API that creates no resources.
 
@@ -208,6 +353,39 @@ class CloudOperationPollerNoResources(OperationPoller):
     return operation.response
 
 
+class CloudOperationBatchPollerNoResources(CloudOperationPollerNoResources,
+                                           BatchOperationPoller):
+  """A CloudOperationPollerNoResources that polls with the List method.
+
+  See CloudOperationBatchPoller.
+  """
+
+  def __init__(self, operation_service, get_name_func=None,
+               get_parent_func=None, list_filter_func=None,
+               list_field='operations'):
+    """Sets up poller for cloud operations.
+
+    Args:
+      operation_service: apitools.base.py.base_api.BaseApiService, api service
+        for retrieving information about ongoing operation.
+      get_name_func: the function to use to get the name from the operation_ref.
+      get_parent_func: func(name) that returns the List parent of an operation
+        name.
+      list_filter_func: func([name]) that returns a List filter restricting the
+        listing to the named operations, for APIs that support it.
+      list_field: str, The operations field of the List response.
+    """
+    super(CloudOperationBatchPollerNoResources, self).__init__(
+        operation_service, get_name_func)
+    self._lister = _OperationLister(
+        operation_service, self.get_name, get_parent_func, list_filter_func,
+        list_field)
+
+  def PollMany(self, operation_refs):
+    """Overrides."""
+    return self._lister.List(operation_refs)
+
+
 def WaitFor(poller,
             operation_ref,
             message=None,
@@ -328,5 +506,282 @@ def PollUntilDone(poller, operation_ref,
   return operation
 
 
+class _RateLimiter(object):
+  """Spaces out calls made from any number of threads.
+
+  Attributes:
+    rate: float, The maximum number of calls per second, None for no limit.
+  """
+
+  def __init__(self, rate):
+    self.rate = rate
+    self._lock = threading.Lock()
+    self._next_call = 0
+
+  def Wait(self):
+    """Blocks until the calling thread may make its call."""
+    if not self.rate:
+      return
+    with self._lock:
+      now = time.time()
+      delay = self._next_call - now
+      self._next_call = max(now, self._next_call) + 1 / self.rate
+    if delay > 0:
+      time.sleep(delay)
+
+
+class _ThreadPollers(object):
+  """Gives every polling thread its own OperationPoller.
+
+  Pollers wrap apitools clients, whose http objects must not be used by
+  several threads at once.
+  """
+
+  def __init__(self, poller_factory):
+    self._poller_factory = poller_factory
+    self._local = threading.local()
+
+  def Get(self):
+    """Returns the poller of the calling thread."""
+    poller = getattr(self._local, 'poller', None)
+    if poller is None:
+      poller = self._local.poller = self._poller_factory()
+    return poller
+
+
+def _GetThreadPollers(poller, poller_factory, max_concurrent_polls):
+  """Returns the _ThreadPollers and number of threads to poll with."""
+  if poller_factory is None:
+    # The poller is not safe to share, so polls are made one at a time.
+    return _ThreadPollers(lambda: poller), 1
+  return _ThreadPollers(poller_factory), max_concurrent_polls
+
+
+def _RaiseErrors(operation_refs, errors):
+  """Raises the errors of failed operations, combining several of them.
+
+  Args:
+    operation_refs: list, The operation references, in order.
+    errors: {int: Exception}, The errors of the failed operations by index.
+
+  Raises:
+    Exception: The only error, or an OperationError listing all of them.
+  """
+  if len(errors) == 1:
+    raise next(iter(errors.values()))
+  raise OperationError('{0} operations failed:\n{1}'.format(
+      len(errors), '\n'.join(
+          ' {0}: {1}'.format(operation_refs[i], errors[i])
+          for i in sorted(errors))))
+
+
+def PollManyUntilDone(poller,
+                      operation_refs,
+                      max_wait_ms=1800000,
+                      exponential_sleep_multiplier=1.4,
+                      jitter_ms=1000,
+                      wait_ceiling_ms=180000,
+                      sleep_ms=2000,
+                      max_concurrent_polls=10,
+                      max_polls_per_second=20,
+                      fail_fast=False,
+                      status_update=None,
+                      poller_factory=None):
+  """Waits for poller.Poll to complete for many operations at once.
+
+  Operations are polled in rounds that share one backoff schedule: every round
+  polls all pending operations concurrently, then sleeps. The sleep grows by
+  exponential_sleep_multiplier after rounds in which no operation finished,
+  and shrinks back towards sleep_ms after rounds in which some did, since
+  operations started together tend to finish together.
+
+  A BatchOperationPoller retrieves the pending operations with one PollMany()
+  call per round, and only the operations it could not retrieve are polled
+  individually.
+
+  Pollers hold an API client that is not thread safe, so operations are only
+  polled concurrently when poller_factory is given. It is called once in each
+  polling thread to create a poller with its own client, for example a
+  CloudOperationPoller of the services of a new apis.GetClientInstance()
+  client. Otherwise the operations are polled one at a time.
+
+  Args:
+    poller: OperationPoller, poller to use during retrials.
+    operation_refs: list, the objects passed to the poller poll method.
+    max_wait_ms: int, number of ms to wait before raising TimeoutError.
+    exponential_sleep_multiplier: float, factor to use on subsequent rounds.
+    jitter_ms: int, random (up to the value) additional sleep between rounds.
+    wait_ceiling_ms: int, Maximum wait between rounds.
+    sleep_ms: int, the initial wait between rounds.
+    max_concurrent_polls: int, the maximum number of concurrent Poll calls
+      when poller_factory is given.
+    max_polls_per_second: float, the maximum rate of Poll calls across all
+      threads, None for no limit.
+    fail_fast: bool, raise as soon as one operation fails instead of waiting
+      for all the others first.
+    status_update: func(done_count, total_count) called after each round.
+    poller_factory: func() that returns a new OperationPoller like poller, with
+      its own API client, for each polling thread.
+
+  Returns:
+    The list of values returned by poller.Poll for each operation, in order.
+
+  Raises:
+    TimeoutError: if some operations are not done after max_wait_ms.
+    OperationError: if more than one operation failed. The error of a single
+      failed operation is raised as is.
+  """
+  limiter = _RateLimiter(max_polls_per_second)
+  thread_pollers, max_workers = _GetThreadPollers(
+      poller, poller_factory, max_concurrent_polls)
+
+  def _Poll(operation_ref, operation=None):
+    if operation is None:
+      limiter.Wait()
+      operation = thread_pollers.Get().Poll(operation_ref)
+    return operation, poller.IsDone(operation)
+
+  operations = [None] * len(operation_refs)
+  errors = {}
+  pending = list(range(len(operation_refs)))
+  start_time = time.time()
+  wait_ms = sleep_ms
+  executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+  try:
+    while pending:
+      if isinstance(poller, BatchOperationPoller):
+        limiter.Wait()
+        polled = poller.PollMany([operation_refs[i] for i in pending])
+      else:
+        polled = [None] * len(pending)
+      polls = {
+          executor.submit(_Poll, operation_refs[i], operation): i
+          for i, operation in zip(pending, polled)
+      }
+      still_pending = []
+      for future in futures.as_completed(polls):
+        index = polls[future]
+        try:
+          operations[index], done = future.result()
+        except Exception as e:  # pylint: disable=broad-except
+          if fail_fast:
+            raise
+          errors[index] = e
+          continue
+        if not done:
+          still_pending.append(index)
+      progressed = len(still_pending) < len(pending)
+      pending = sorted(still_pending)
+      if status_update:
+        status_update(len(operation_refs) - len(pending), len(operation_refs))
+      if not pending:
+        break
+
+      if progressed:
+        wait_ms = max(sleep_ms, wait_ms / exponential_sleep_multiplier)
+      else:
+        wait_ms = min(wait_ceiling_ms, wait_ms * exponential_sleep_multiplier)
+      time_passed_ms = (time.time() - start_time) * 1000
+      if time_passed_ms + wait_ms > max_wait_ms:
+        raise TimeoutError(
+            '{0} of {1} operations have not finished in {2} seconds. {3}'
+            .format(len(pending), len(operation_refs), max_wait_ms // 1000,
+                    _TIMEOUT_MESSAGE))
+      _SleepMs(wait_ms + random.random() * jitter_ms)
+  finally:
+    executor.shutdown(wait=False)
+
+  if errors:
+    _RaiseErrors(operation_refs, errors)
+  return operations
+
+
+def WaitForMany(poller,
+                operation_refs,
+                message=None,
+                custom_tracker=None,
+                pre_start_sleep_ms=1000,
+                max_wait_ms=1800000,
+                exponential_sleep_multiplier=1.4,
+                jitter_ms=1000,
+                wait_ceiling_ms=180000,
+                sleep_ms=2000,
+                max_concurrent_polls=10,
+                max_polls_per_second=20,
+                fail_fast=False,
+                poller_factory=None):
+  """Waits for many operations at once and displays their progress.
+
+  This is the multi-operation form of WaitFor(). See PollManyUntilDone() for
+  the polling schedule.
+
+  Args:
+    poller: OperationPoller, poller to use during retrials.
+    operation_refs: list, the objects passed to the poller poll method.
+    message: str, string to display for default progress_tracker.
+    custom_tracker: ProgressTracker, progress_tracker to use for display.
+    pre_start_sleep_ms: int, Time to wait before making first poll requests.
+    max_wait_ms: int, number of ms to wait before raising TimeoutError.
+    exponential_sleep_multiplier: float, factor to use on subsequent rounds.
+    jitter_ms: int, random (up to the value) additional sleep between rounds.
+    wait_ceiling_ms: int, Maximum wait between rounds.
+    sleep_ms: int, the initial wait between rounds.
+    max_concurrent_polls: int, the maximum number of concurrent Poll and
+      GetResult calls when poller_factory is given.
+    max_polls_per_second: float, the maximum rate of Poll and GetResult calls
+      across all threads, None for no limit.
+    fail_fast: bool, raise as soon as one operation fails instead of waiting
+      for all the others first.
+    poller_factory: func() that returns a new OperationPoller like poller, with
+      its own API client, for each polling thread. See PollManyUntilDone().
+
+  Returns:
+    The list of poller.GetResult(operation) for each operation, in order.
+
+  Raises:
+    AbortWaitError: if ctrl-c was pressed.
+    TimeoutError: if some operations are not done after max_wait_ms.
+    OperationError: if more than one operation failed. The error of a single
+      failed operation is raised as is.
+  """
+  operation_refs = list(operation_refs)
+  if not operation_refs:
+    return []
+  progress = {'done': 0}
+
+  def _DetailMessage():
+    return ' {0}/{1} done'.format(progress['done'], len(operation_refs))
+
+  aborted_message = 'Aborting wait for {0} operations.\n'.format(
+      len(operation_refs))
+  with progress_tracker.ProgressTracker(
+      message, aborted_message=aborted_message,
+      detail_message_callback=_DetailMessage
+  ) if not custom_tracker else custom_tracker as tracker:
+
+    if pre_start_sleep_ms:
+      _SleepMs(pre_start_sleep_ms)
+
+    def _StatusUpdate(done_count, unused_total_count):
+      progress['done'] = done_count
+      tracker.Tick()
+
+    operations = PollManyUntilDone(
+        poller, operation_refs, max_wait_ms, exponential_sleep_multiplier,
+        jitter_ms, wait_ceiling_ms, sleep_ms, max_concurrent_polls,
+        max_polls_per_second, fail_fast, _StatusUpdate, poller_factory)
+
+  limiter = _RateLimiter(max_polls_per_second)
+  thread_pollers, max_workers = _GetThreadPollers(
+      poller, poller_factory, max_concurrent_polls)
+
+  def _GetResult(operation):
+    limiter.Wait()
+    return thread_pollers.Get().GetResult(operation)
+
+  with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+    return list(executor.map(_GetResult, operations))
+
+
 def _SleepMs(miliseconds):
   time.sleep(miliseconds / 1000)
@@ -615,7 +615,7 @@ class CommandGroup(CommandCommon):
     self._unloadable_elements = set()
 
     group_infos, command_infos = command_loading.FindSubElements(
-        impl_paths, path
+        impl_paths, path, command_index=cli_generator.command_index
     )
     self._RemoveInitExtensionsFileIfNeeded(command_infos)
     self._groups_to_load.update(group_infos)
@@ -920,6 +920,7 @@ class Command(CommandCommon):
         construction_id,
         is_command=True,
         yaml_command_translator=cli_generator.yaml_command_translator,
+        command_index=cli_generator.command_index,
     )
     super(Command, self).__init__(
         common_type,
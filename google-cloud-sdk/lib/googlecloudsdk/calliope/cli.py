@@ -20,6 +20,7 @@ from __future__ import division
 from __future__ import unicode_literals
 
 import argparse
+import atexit
 import collections
 import os
 import re
@@ -31,6 +32,7 @@ import argcomplete
 from googlecloudsdk.calliope import actions
 from googlecloudsdk.calliope import backend
 from googlecloudsdk.calliope import base as calliope_base
+from googlecloudsdk.calliope import command_index
 from googlecloudsdk.calliope import command_loading
 from googlecloudsdk.calliope import exceptions
 from googlecloudsdk.calliope import parser_errors
@@ -46,6 +48,7 @@ from googlecloudsdk.core.console import console_attr
 from googlecloudsdk.core.util import encoding
 from googlecloudsdk.core.util import files
 from googlecloudsdk.core.util import pkg_resources
+from googlecloudsdk.core.util import startup_profiler
 
 import six
 
@@ -294,11 +297,32 @@ class CLILoader(object):
     self.__modules_by_parent = collections.defaultdict(list)
     self.__missing_components = {}
     self.__release_tracks = {}
+    self.__command_index = None
 
   @property
   def yaml_command_translator(self):
     return self.__yaml_command_translator
 
+  @property
+  def command_index(self):
+    """The command_index.CommandIndex consulted while loading, or None."""
+    return self.__command_index
+
+  def __LoadCommandIndex(self):
+    """Loads the persistent command tree index if it is enabled.
+
+    The index is only used for real installations, where the updater keeps it
+    consistent with the installed components. Entries recorded while loading
+    this invocation's command are saved at exit.
+    """
+    if not properties.VALUES.core.enable_command_index.GetBool():
+      return
+    if not config.Paths().sdk_root:
+      return
+    self.__command_index = command_index.CommandIndex.Load(
+        self.__command_root_directory)
+    atexit.register(self.__command_index.SaveIfDirty)
+
   def AddReleaseTrack(self, release_track, path, component=None):
     """Adds a release track to this CLI tool.
 
@@ -470,6 +494,8 @@ class CLILoader(object):
               [module_dot_path.replace('_', '-')])
           self.__missing_components[group_name] = component
 
+    self.__LoadCommandIndex()
+
     # The root group of the CLI.
     impl_path = self.__ValidateCommandOrGroupInfo(
         self.__command_root_directory, allow_non_existing_modules=False)
@@ -891,7 +917,8 @@ class CLI(object):
       argparse._SubParsersAction.__call__ = _SubParsersActionCall  # pylint: disable=protected-access
 
     if call_arg_complete:
-      _ArgComplete(self.__top_element.ai)
+      with startup_profiler.Phase('arg_complete'):
+        _ArgComplete(self.__top_element.ai)
 
     if not args:
       args = argv_utils.GetDecodedArgv()[1:]
@@ -911,9 +938,12 @@ class CLI(object):
     old_user_output_enabled = None
     old_verbosity = None
     try:
-      args = self.__parser.parse_args(_ApplyFlagsFile(argv))
-      if args.CONCEPT_ARGS is not None:
-        args.CONCEPT_ARGS.ParseConcepts()
+      # Parsing lazily loads the groups and the command on the command path
+      # and builds their argparse parsers.
+      with startup_profiler.Phase('argument_parsing'):
+        args = self.__parser.parse_args(_ApplyFlagsFile(argv))
+        if args.CONCEPT_ARGS is not None:
+          args.CONCEPT_ARGS.ParseConcepts()
       calliope_command = args._GetCommand()  # pylint: disable=protected-access
       command_path_string = '.'.join(calliope_command.GetPath())
       specified_arg_names = args.GetSpecifiedArgNames()
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A persistent on-disk index of the calliope command tree.
+
+Every invocation lists the package directories of each group on the path to the
+requested command (command_loading.FindSubElements) and probes YAML commands for
+partials before it can import the leaf command. The index records the results
+of those probes so that later invocations against the same installation can
+skip the filesystem walk and only import the modules on the command path.
+
+The index is keyed by the installation it was built for: the SDK version, the
+command root directory, the python version and a signature of the component
+snapshot files in the installation state directory. Installing, updating or
+removing components rewrites those snapshot files, so a stale index is never
+consulted; the `components post-process` step rebuilds it eagerly.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import hashlib
+import os
+import pickle
+import sys
+
+from googlecloudsdk.core import config
+from googlecloudsdk.core import log
+from googlecloudsdk.core.util import files
+
+# Bump this whenever the layout of the pickled payload changes.
+INDEX_FORMAT_VERSION = 1
+
+_MAGIC = b'GCLOUD_CMD_INDEX'
+_INDEX_FILE_NAME = 'index.bin'
+
+
+class Error(Exception):
+  """Base exception for command index errors."""
+
+
+class IndexFormatError(Error):
+  """Raised when an index file is corrupt or was written by another version."""
+
+
+def _InstallationSignature(sdk_root):
+  """Returns a digest of the component snapshot files of the installation.
+
+  The updater rewrites the snapshot file of every component it installs,
+  updates or removes, so the signature changes whenever the set of installed
+  commands can change.
+
+  Args:
+    sdk_root: str, The root of the SDK installation, or None.
+
+  Returns:
+    str, The signature.
+  """
+  digest = hashlib.sha256()
+  if not sdk_root:
+    return digest.hexdigest()
+  state_dir = os.path.join(sdk_root, config.Paths.CLOUDSDK_STATE_DIR)
+  try:
+    names = sorted(os.listdir(state_dir))
+  except OSError:
+    return digest.hexdigest()
+  for name in names:
+    if not name.endswith('.snapshot.json'):
+      continue
+    try:
+      stat = os.stat(os.path.join(state_dir, name))
+    except OSError:
+      continue
+    digest.update('{}:{}:{};'.format(
+        name, stat.st_size, stat.st_mtime_ns).encode('utf-8'))
+  return digest.hexdigest()
+
+
+def InstallationKey(command_root_directory, sdk_root=None):
+  """Computes the key that an index must match to be used.
+
+  Args:
+    command_root_directory: str, The root directory of the command tree.
+    sdk_root: str, The root of the SDK installation. Defaults to the root of
+      the running installation.
+
+  Returns:
+    str, The installation key.
+  """
+  if sdk_root is None:
+    sdk_root = config.Paths().sdk_root
+  return '|'.join([
+      config.CLOUD_SDK_VERSION,
+      '{}.{}'.format(*sys.version_info[:2]),
+      os.path.realpath(command_root_directory),
+      _InstallationSignature(sdk_root),
+  ])
+
+
+def IndexPath(command_root_directory):
+  """Returns the file path of the index for the given command root."""
+  root_hash = hashlib.sha256(
+      os.path.realpath(command_root_directory).encode('utf-8')).hexdigest()
+  return os.path.join(
+      config.Paths().command_index_dir, root_hash[:16], _INDEX_FILE_NAME)
+
+
+class CommandIndex(object):
+  """An index of the sub elements of the command groups in a command tree.
+
+  Attributes:
+    path: str, The file the index is persisted to.
+    key: str, The installation key the index is valid for.
+    dirty: bool, True if the index has entries that have not been saved.
+  """
+
+  def __init__(self, path, key, sub_elements=None, partials=None):
+    self.path = path
+    self.key = key
+    # {group impl path: ({name: [impl paths]}, {name: [impl paths]})}
+    self._sub_elements = sub_elements or {}
+    # {yaml command impl path: [partial file paths] or None}
+    self._partials = partials or {}
+    self.dirty = False
+
+  @classmethod
+  def Load(cls, command_root_directory):
+    """Loads the index for the given command root.
+
+    A missing, corrupt or stale index results in an empty index that will be
+    filled in as commands are loaded.
+
+    Args:
+      command_root_directory: str, The root directory of the command tree.
+
+    Returns:
+      CommandIndex, The loaded index.
+    """
+    path = IndexPath(command_root_directory)
+    key = InstallationKey(command_root_directory)
+    try:
+      sub_elements, partials = cls._Read(path, key)
+    except (IOError, OSError, files.Error):
+      return cls(path, key)
+    except IndexFormatError as e:
+      log.debug('Ignoring command index [%s]: %s', path, e)
+      return cls(path, key)
+    return cls(path, key, sub_elements=sub_elements, partials=partials)
+
+  @staticmethod
+  def _Read(path, key):
+    """Reads and validates the payload of an index file."""
+    with files.BinaryFileReader(path) as f:
+      header = f.read(len(_MAGIC))
+      if header != _MAGIC:
+        raise IndexFormatError('bad magic number')
+      try:
+        version, file_key, sub_elements, partials = pickle.load(f)
+      # pylint:disable=broad-except, Unpickling a truncated or foreign file
+      # can raise nearly anything; all of it means the index is unusable.
+      except Exception as e:
+        raise IndexFormatError(e)
+    if version != INDEX_FORMAT_VERSION:
+      raise IndexFormatError('format version {} != {}'.format(
+          version, INDEX_FORMAT_VERSION))
+    if file_key != key:
+      raise IndexFormatError('the installation has changed')
+    return sub_elements, partials
+
+  def GetSubElements(self, impl_path):
+    """Returns the indexed (groups, commands) of a group or None."""
+    return self._sub_elements.get(impl_path)
+
+  def SetSubElements(self, impl_path, groups, commands):
+    self._sub_elements[impl_path] = (groups, commands)
+    self.dirty = True
+
+  def HasPartials(self, impl_file):
+    return impl_file in self._partials
+
+  def GetPartials(self, impl_file):
+    """Returns the partial files of a YAML command, None if it has none."""
+    return self._partials.get(impl_file)
+
+  def SetPartials(self, impl_file, partial_files):
+    self._partials[impl_file] = partial_files
+    self.dirty = True
+
+  def Save(self):
+    """Atomically writes the index to disk."""
+    payload = pickle.dumps(
+        (INDEX_FORMAT_VERSION, self.key, self._sub_elements, self._partials),
+        protocol=pickle.HIGHEST_PROTOCOL)
+    files.MakeDir(os.path.dirname(self.path))
+    temp_path = '{}.{}.tmp'.format(self.path, os.getpid())
+    files.WriteBinaryFileContents(temp_path, _MAGIC + payload, private=True)
+    os.replace(temp_path, self.path)
+    self.dirty = False
+
+  def SaveIfDirty(self):
+    """Saves the index if it changed, never raising."""
+    if not self.dirty:
+      return
+    try:
+      self.Save()
+    # pylint:disable=broad-except, The index is an optimization only.
+    except Exception as e:
+      log.debug('Failed to save command index [%s]: %s', self.path, e)
+
+  def Build(self, impl_paths, path):
+    """Indexes the whole command tree below the given group.
+
+    This walks the filesystem only; no command or group module is imported.
+
+    Args:
+      impl_paths: [str], The file paths to the implementation of the group.
+      path: [str], The command path of the group.
+
+    Returns:
+      int, The number of groups indexed.
+    """
+    # Imported here to avoid a circular import.
+    # pylint:disable=g-import-not-at-top
+    from googlecloudsdk.calliope import command_loading
+
+    count = 0
+    pending = [(impl_paths, path)]
+    while pending:
+      group_impl_paths, group_path = pending.pop()
+      groups, commands = command_loading.FindSubElements(
+          group_impl_paths, group_path, command_index=self)
+      count += 1
+      for command_name, command_impl_paths in commands.items():
+        for impl_file in command_impl_paths:
+          if impl_file.endswith('.yaml'):
+            command_loading.FindPartials(
+                impl_file, group_path + [command_name], command_index=self)
+      for group_name, sub_impl_paths in groups.items():
+        pending.append((sub_impl_paths, group_path + [group_name]))
+    return count
+
+
+def Rebuild(command_root_directory, name):
+  """Discards the current index for a command root and builds a new one.
+
+  Args:
+    command_root_directory: str, The root directory of the command tree.
+    name: str, The name of the top level command, e.g. gcloud.
+
+  Returns:
+    CommandIndex, The saved index.
+  """
+  index = CommandIndex(
+      IndexPath(command_root_directory),
+      InstallationKey(command_root_directory))
+  index.Build([command_root_directory], [name])
+  index.Save()
+  return index
@@ -78,7 +78,7 @@ class YamlCommandTranslator(six.with_metaclass(abc.ABCMeta, object)):
     pass
 
 
-def FindSubElements(impl_paths, path):
+def FindSubElements(impl_paths, path, command_index=None):
   """Find all the sub groups and commands under this group.
 
   Args:
@@ -88,6 +88,8 @@ def FindSubElements(impl_paths, path):
       with respect to the CLI itself.  This path should be used for things like
       error reporting when a specific element in the tree needs to be
       referenced.
+    command_index: command_index.CommandIndex, An optional index to consult
+      before listing the group directory, and to record the listing in.
 
   Raises:
     CommandLoadFailure: If the command is invalid and cannot be loaded.
@@ -105,13 +107,21 @@ def FindSubElements(impl_paths, path):
         Exception('Command groups cannot be implemented in yaml'),
     )
   impl_path = impl_paths[0]
+  if command_index:
+    indexed = command_index.GetSubElements(impl_path)
+    if indexed is not None:
+      group_infos, command_infos = indexed
+      # Callers mutate the returned mappings, never hand out the index's own.
+      return dict(group_infos), dict(command_infos)
   groups, commands = pkg_resources.ListPackage(
       impl_path, extra_extensions=['.yaml']
   )
-  return (
-      _GenerateElementInfo(impl_path, groups),
-      _GenerateElementInfo(impl_path, commands),
-  )
+  group_infos = _GenerateElementInfo(impl_path, groups)
+  command_infos = _GenerateElementInfo(impl_path, commands)
+  if command_index:
+    command_index.SetSubElements(
+        impl_path, dict(group_infos), dict(command_infos))
+  return group_infos, command_infos
 
 
 def _GenerateElementInfo(impl_path, names):
@@ -150,6 +160,7 @@ def LoadCommonType(
     construction_id,
     is_command,
     yaml_command_translator=None,
+    command_index=None,
 ):
   """Loads a calliope command or group from a file.
 
@@ -166,6 +177,8 @@ def LoadCommonType(
     is_command: bool, True if we are loading a command, False to load a group.
     yaml_command_translator: YamlCommandTranslator, An instance of a translator
       to use to load the yaml data.
+    command_index: command_index.CommandIndex, An optional index of the
+      command tree used to resolve YAML partials without probing the disk.
 
   Raises:
     CommandLoadFailure: If the command is invalid and cannot be loaded.
@@ -174,7 +187,12 @@ def LoadCommonType(
     The base._Common class for the command or group.
   """
   implementations = _GetAllImplementations(
-      impl_paths, path, construction_id, is_command, yaml_command_translator
+      impl_paths,
+      path,
+      construction_id,
+      is_command,
+      yaml_command_translator,
+      command_index=command_index,
   )
   return _ExtractReleaseTrackImplementation(
       impl_paths[0], release_track, implementations
@@ -206,7 +224,12 @@ def _CustomLoadYamlFile(path):
 
 
 def _GetAllImplementations(
-    impl_paths, path, construction_id, is_command, yaml_command_translator
+    impl_paths,
+    path,
+    construction_id,
+    is_command,
+    yaml_command_translator,
+    command_index=None,
 ):
   """Gets all the release track command implementations.
 
@@ -224,6 +247,8 @@ def _GetAllImplementations(
     is_command: bool, True if we are loading a command, False to load a group.
     yaml_command_translator: YamlCommandTranslator, An instance of a translator
       to use to load the yaml data.
+    command_index: command_index.CommandIndex, An optional index of the
+      command tree used to resolve YAML partials without probing the disk.
 
   Raises:
     CommandLoadFailure: If the command is invalid and cannot be loaded.
@@ -243,8 +268,9 @@ def _GetAllImplementations(
             '.'.join(path),
             Exception('Command groups cannot be implemented in yaml'),
         )
-      if _IsCommandWithPartials(impl_file, path):
-        data = _LoadCommandWithPartials(impl_file, path)
+      partial_files = FindPartials(impl_file, path, command_index)
+      if partial_files is not None:
+        data = _LoadCommandWithPartials(partial_files, path)
       else:
         data = _CustomLoadYamlFile(impl_file)
       implementations.extend(
@@ -300,10 +326,37 @@ def _IsCommandWithPartials(impl_file, path):
   return found_partial_token
 
 
-def _LoadCommandWithPartials(impl_file, path):
-  """Loads all YAML partials for a command with partials based on conventions.
+def FindPartials(impl_file, path, command_index=None):
+  """Finds the YAML partial files of a command, if it is one with partials.
+
+  Args:
+    impl_file: file path to the main YAML command implementation.
+    path: [str], A list of group names that got us down to this command group
+      with respect to the CLI itself.  This path should be used for things like
+      error reporting when a specific element in the tree needs to be
+      referenced.
+    command_index: command_index.CommandIndex, An optional index to consult
+      before probing the disk, and to record the result in.
+
+  Raises:
+    CommandLoadFailure: If the command is invalid and should not be loaded.
+
+  Returns:
+    [str], The partial files of the command in load order, or None if the
+    command is not a command with partials.
+  """
+  if command_index and command_index.HasPartials(impl_file):
+    return command_index.GetPartials(impl_file)
+  partial_files = None
+  if _IsCommandWithPartials(impl_file, path):
+    partial_files = _FindPartialFiles(impl_file)
+  if command_index:
+    command_index.SetPartials(impl_file, partial_files)
+  return partial_files
 
-  Partial files are loaded using _CustomLoadYamlFile as normal YAML commands.
+
+def _FindPartialFiles(impl_file):
+  """Lists the YAML partials for a command with partials based on conventions.
 
   Conventions:
   - Partials should be placed in subfolder `_partials`.
@@ -313,13 +366,9 @@ def _LoadCommandWithPartials(impl_file, path):
 
   Args:
     impl_file: file path to the main YAML command implementation.
-    path: [str], A list of group names that got us down to this command group
-      with respect to the CLI itself.  This path should be used for things like
-      error reporting when a specific element in the tree needs to be
-      referenced.
 
   Returns:
-    List with data loaded from partial YAML files for the main command.
+    [str], The partial files for the main command.
   """
   file_name = os.path.basename(impl_file)
   command_name = file_name[:-5]  # strip .yaml
@@ -327,12 +376,32 @@ def _LoadCommandWithPartials(impl_file, path):
   partial_files = pkg_resources.GetFilesFromDirectory(
       partials_dir, f'_{command_name}_*.yaml'
   )
+  command_path = re.escape(os.path.join(partials_dir, f'_{command_name}'))
+  return [
+      partial_file
+      for partial_file in partial_files
+      if re.match(fr'{command_path}_(alpha|beta|ga)\.yaml', partial_file)
+  ]
+
+
+def _LoadCommandWithPartials(partial_files, path):
+  """Loads all YAML partials for a command with partials.
+
+  Partial files are loaded using _CustomLoadYamlFile as normal YAML commands.
 
+  Args:
+    partial_files: [str], The partial files of the command, see FindPartials.
+    path: [str], A list of group names that got us down to this command group
+      with respect to the CLI itself.  This path should be used for things like
+      error reporting when a specific element in the tree needs to be
+      referenced.
+
+  Returns:
+    List with data loaded from partial YAML files for the main command.
+  """
   command_data_list = []
-  command_path = re.escape(os.path.join(partials_dir, f'_{command_name}'))
   for partial_file in partial_files:
-    if re.match(fr'{command_path}_(alpha|beta|ga)\.yaml', partial_file):
-      command_data_list.extend(_CustomLoadYamlFile(partial_file))
+    command_data_list.extend(_CustomLoadYamlFile(partial_file))
 
   _ValidateCommandWithPartials(command_data_list, path)
   return command_data_list
@@ -34,6 +34,9 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+import functools
+import heapq
+
 from googlecloudsdk.calliope import display_taps
 from googlecloudsdk.core import exceptions
 from googlecloudsdk.core import log
@@ -62,6 +65,48 @@ class CommandShouldntHaveAddCacheUpdater(Error):
   """Command has an AddCacheUpdater() call and shouldn't."""
 
 
+def _GetComparableKey(r, key):
+  """Returns the value for key in r that can be compared with None."""
+  value = resource_property.Get(r, key, None)
+  # Some types (datetime for example) preclude comparisons with None.
+  # This converts the value to a string and uses that ordering.
+  try:
+    assert None < value
+    return value
+  except (AssertionError, TypeError):
+    return six.text_type(value)
+
+
+@functools.total_ordering
+class _SortKey(object):
+  """A --sort-by key for one resource with per-key sort direction.
+
+  Orders resources the same way as applying the stable _SortResources passes
+  of Displayer._AddSortByTap, so a bounded heap over these keys selects the
+  same leading resources as sorting everything.
+
+  Attributes:
+    values: The resource values of the sort keys, highest precedence first.
+    reverses: The reverse flag of each sort key.
+  """
+
+  __slots__ = ('values', 'reverses')
+
+  def __init__(self, resource, sort_keys):
+    self.values = [_GetComparableKey(resource, key) for key, _ in sort_keys]
+    self.reverses = [reverse for _, reverse in sort_keys]
+
+  def __eq__(self, other):
+    return self.values == other.values
+
+  def __lt__(self, other):
+    for mine, theirs, reverse in zip(self.values, other.values, self.reverses):
+      if mine == theirs:
+        continue
+      return theirs < mine if reverse else mine < theirs
+    return False
+
+
 class Displayer(object):
   """Implements the resource display method.
 
@@ -223,23 +268,27 @@ class Displayer(object):
         ascending.
     """
 
-    def _GetKey(r, key):
-      """Returns the value for key in r that can be compared with None."""
-      value = resource_property.Get(r, key, None)
-      # Some types (datetime for example) preclude comparisons with None.
-      # This converts the value to a string and uses that ordering.
-      try:
-        assert None < value
-        return value
-      except (AssertionError, TypeError):
-        return six.text_type(value)
-
     self._resources = sorted(
         self._resources,
-        key=lambda r: [_GetKey(r, k) for k in keys],
+        key=lambda r: [_GetComparableKey(r, k) for k in keys],
         reverse=reverse,
     )
 
+  def _SelectTopResources(self, sort_keys, limit):
+    """_AddSortByTap helper that keeps only the first limit sorted resources.
+
+    This is equivalent to sorting all of the resources and then applying
+    --limit, but holds at most limit resources in a heap instead of the whole
+    stream. Ties keep their original order, as with the stable sort.
+
+    Args:
+      sort_keys: The list of --sort-by [(key, reverse)] tuples from highest to
+        lowest precedence.
+      limit: The --limit value.
+    """
+    self._resources = heapq.nsmallest(
+        limit, self._resources, key=lambda r: _SortKey(r, sort_keys))
+
   def _AddSortByTap(self):
     """Sorts the resources using the --sort-by keys."""
     if not resource_property.IsListLike(self._resources):
@@ -248,6 +297,12 @@ class Displayer(object):
     if not sort_keys:
       return
     self._args.sort_by = None
+    limit = self._GetFlag('limit')
+    if limit is not None and limit >= 0:
+      # Only the first --limit resources are displayed, a top-k selection
+      # avoids holding and sorting the whole stream.
+      self._SelectTopResources(sort_keys, limit)
+      return
     # This loop partitions the keys into groups having the same reverse value.
     # The groups are then applied in reverse order to maintain the original
     # precedence.
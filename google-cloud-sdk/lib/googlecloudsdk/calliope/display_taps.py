@@ -42,6 +42,7 @@ from __future__ import division
 from __future__ import unicode_literals
 
 from googlecloudsdk.core import log
+from googlecloudsdk.core.resource import resource_expr_compiler
 from googlecloudsdk.core.resource import resource_filter
 from googlecloudsdk.core.resource import resource_printer_base
 from googlecloudsdk.core.resource import resource_projector
@@ -63,7 +64,7 @@ class Filterer(peek_iterable.Tap):
       expression: The resource filter expression string.
       defaults: The resource format and filter default projection.
     """
-    self._compiled_expression = resource_filter.Compile(
+    self._compiled_expression = resource_expr_compiler.Compile(
         expression, defaults=defaults
     )
     self._missing_keys = resource_filter.GetAllKeys(self._compiled_expression)
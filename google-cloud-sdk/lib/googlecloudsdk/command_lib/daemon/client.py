@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Thin client shim that forwards a gcloud invocation to a running daemon.
+
+Run as:
+
+  CLOUDSDK_DAEMON_SOCKET=/path/to/socket \\
+      python -m googlecloudsdk.command_lib.daemon.client compute zones list
+
+If no daemon is listening on the socket the command runs in this process as
+a regular gcloud invocation, so the shim can be used as a drop-in replacement
+for the gcloud entry point.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import os
+import signal
+import socket
+import sys
+
+from googlecloudsdk.command_lib.daemon import protocol
+
+
+def Forward(socket_path, argv, env=None, cwd=None):
+  """Runs a command on the daemon listening at socket_path.
+
+  Args:
+    socket_path: str, The path of the daemon socket.
+    argv: [str], The gcloud arguments, not including the program name.
+    env: {str: str}, The environment to run the command in. Defaults to the
+      environment of this process.
+    cwd: str, The working directory to run the command in. Defaults to the
+      working directory of this process.
+
+  Returns:
+    int, The exit code of the command, or None if no daemon is listening.
+  """
+  sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+  try:
+    sock.connect(socket_path)
+  except (OSError, IOError):
+    sock.close()
+    return None
+
+  with sock:
+    for stream in (sys.stdout, sys.stderr):
+      stream.flush()
+    protocol.SendRequest(
+        sock,
+        argv,
+        dict(os.environ) if env is None else env,
+        os.getcwd() if cwd is None else cwd,
+        [0, 1, 2],
+    )
+    interrupted = False
+    while True:
+      try:
+        return protocol.ReceiveExitCode(sock)
+      except KeyboardInterrupt:
+        # The command runs in the daemon, let it handle the interrupt.
+        interrupted = True
+        sock.sendall(protocol.INTERRUPT)
+      except protocol.ProtocolError:
+        # The command process died without reporting an exit code, which is
+        # how gcloud handles an interrupt.
+        return 128 + signal.SIGINT if interrupted else 1
+
+
+def main():
+  socket_path = os.environ.get(protocol.SOCKET_ENV_VAR)
+  if socket_path:
+    exit_code = Forward(socket_path, sys.argv[1:])
+    if exit_code is not None:
+      return exit_code
+  # No daemon, run gcloud in process.
+  # pylint:disable=g-import-not-at-top, Only import gcloud when it is needed.
+  from googlecloudsdk import gcloud_main
+  try:
+    gcloud_main.main()
+  except KeyboardInterrupt:
+    # pylint:disable=g-import-not-at-top
+    from googlecloudsdk.core.util import keyboard_interrupt
+    keyboard_interrupt.HandleInterrupt()
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wire protocol between the gcloud daemon and its client shim.
+
+A session is a single connection on a Unix domain socket:
+
+  1. The client sends a request frame: a 4 byte big-endian length followed by
+     a JSON object {"argv": [...], "env": {...}, "cwd": "..."}. Its stdin,
+     stdout and stderr file descriptors ride along as SCM_RIGHTS ancillary
+     data of the first chunk, so the command reads and writes the client's
+     streams directly.
+  2. While the command runs the client may send single INTERRUPT bytes to
+     forward a keyboard interrupt.
+  3. The daemon answers with a 4 byte big-endian signed exit code and closes
+     the connection.
+
+This module only depends on the standard library so that the client shim
+starts without importing the rest of gcloud.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import json
+import socket
+import struct
+
+# The environment variable holding the daemon socket path.
+SOCKET_ENV_VAR = 'CLOUDSDK_DAEMON_SOCKET'
+
+INTERRUPT = b'I'
+
+_LENGTH = struct.Struct('>I')
+_EXIT_CODE = struct.Struct('>i')
+_MAX_REQUEST_BYTES = 16 * 1024 * 1024
+_STDIO_FD_COUNT = 3
+
+
+class ProtocolError(Exception):
+  """Raised when the peer sends something unexpected."""
+
+
+def _RecvExactly(sock, size, initial=b''):
+  data = initial
+  while len(data) < size:
+    chunk = sock.recv(size - len(data))
+    if not chunk:
+      raise ProtocolError('Connection closed by peer.')
+    data += chunk
+  return data
+
+
+def SendRequest(sock, argv, env, cwd, fds):
+  """Sends a command request along with the stdio file descriptors."""
+  payload = json.dumps({'argv': argv, 'env': env, 'cwd': cwd}).encode('utf-8')
+  socket.send_fds(sock, [_LENGTH.pack(len(payload)) + payload], fds)
+
+
+def ReceiveRequest(sock):
+  """Receives a command request.
+
+  Args:
+    sock: socket.socket, The connected socket.
+
+  Raises:
+    ProtocolError: If the request is malformed.
+
+  Returns:
+    (dict, [int]), The decoded request and the received file descriptors.
+  """
+  data, fds, _, _ = socket.recv_fds(sock, 64 * 1024, _STDIO_FD_COUNT)
+  if len(fds) != _STDIO_FD_COUNT:
+    for fd in fds:
+      socket.close(fd)
+    raise ProtocolError('Expected {} file descriptors, got {}.'.format(
+        _STDIO_FD_COUNT, len(fds)))
+  header = _RecvExactly(sock, _LENGTH.size, data[:_LENGTH.size])
+  (size,) = _LENGTH.unpack(header)
+  if size > _MAX_REQUEST_BYTES:
+    raise ProtocolError('Request of {} bytes is too large.'.format(size))
+  payload = _RecvExactly(sock, size, data[_LENGTH.size:])
+  try:
+    request = json.loads(payload.decode('utf-8'))
+  except ValueError as e:
+    raise ProtocolError('Malformed request: {}'.format(e))
+  return request, fds
+
+
+def SendExitCode(sock, exit_code):
+  sock.sendall(_EXIT_CODE.pack(exit_code))
+
+
+def ReceiveExitCode(sock):
+  (exit_code,) = _EXIT_CODE.unpack(_RecvExactly(sock, _EXIT_CODE.size))
+  return exit_code
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A resident gcloud process that serves commands over a Unix socket.
+
+The daemon pays interpreter startup, module imports and command tree loading
+once. Every request is then served by a child forked from the warm daemon, so
+commands start with everything already imported, yet each runs with the
+isolation of a normal gcloud process: its own argv, environment, working
+directory, property state, and the caller's stdin, stdout and stderr.
+
+HTTP connections and credential store handles are deliberately not shared
+across requests: neither TLS sessions nor sqlite connections survive a fork
+safely. Access tokens are still reused through the on-disk access token cache.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import atexit
+import errno
+import os
+import signal
+import socket
+import struct
+import sys
+import threading
+
+from googlecloudsdk.command_lib.daemon import protocol
+from googlecloudsdk.core import exceptions
+from googlecloudsdk.core import log
+from googlecloudsdk.core.configurations import named_configs
+from googlecloudsdk.core.util import platforms
+
+# Exit code reported when the command could not be run at all.
+_INTERNAL_ERROR_EXIT_CODE = 1
+
+
+class Error(exceptions.Error):
+  """Base exception for daemon errors."""
+
+
+class UnsupportedPlatformError(Error):
+  """Raised when the daemon is started on a platform without fork."""
+
+
+class SocketInUseError(Error):
+  """Raised when another daemon is already listening on the socket."""
+
+
+def _PeerUid(conn):
+  """Returns the uid of the connected peer, None if it cannot be determined."""
+  if not hasattr(socket, 'SO_PEERCRED'):
+    return None
+  creds = conn.getsockopt(
+      socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+  _, uid, _ = struct.unpack('3i', creds)
+  return uid
+
+
+class DaemonServer(object):
+  """Serves gcloud commands from a warm process.
+
+  Attributes:
+    socket_path: str, The path of the Unix socket the daemon listens on.
+  """
+
+  def __init__(self, socket_path, cli):
+    """Creates the daemon.
+
+    Args:
+      socket_path: str, The path of the Unix socket to listen on.
+      cli: calliope.cli.CLI, The loaded CLI that commands are run with.
+    """
+    if (platforms.OperatingSystem.Current() ==
+        platforms.OperatingSystem.WINDOWS):
+      raise UnsupportedPlatformError(
+          'The gcloud daemon is not supported on Windows.')
+    self.socket_path = socket_path
+    self._cli = cli
+    self._sock = None
+
+  def Preload(self):
+    """Imports every command in the tree so that requests start warm.
+
+    Returns:
+      int, The number of commands and groups loaded.
+    """
+    # pylint: disable=protected-access
+    return self._cli._TopElement().LoadAllSubElements(
+        recursive=True, ignore_load_errors=True)
+
+  def _Bind(self):
+    """Binds the listening socket, replacing a stale socket file."""
+    if os.path.exists(self.socket_path):
+      probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+      try:
+        probe.connect(self.socket_path)
+      except (OSError, IOError):
+        os.remove(self.socket_path)
+      else:
+        raise SocketInUseError(
+            'A daemon is already listening on [{}].'.format(self.socket_path))
+      finally:
+        probe.close()
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)
+    try:
+      sock.bind(self.socket_path)
+    finally:
+      os.umask(old_umask)
+    sock.listen(64)
+    return sock
+
+  def Serve(self):
+    """Accepts and serves requests until interrupted."""
+    self._sock = self._Bind()
+    atexit.register(self._Cleanup)
+    # Let the kernel reap finished request children.
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    log.status.Print('Listening on [{}].'.format(self.socket_path))
+    while True:
+      try:
+        conn, _ = self._sock.accept()
+      except (OSError, IOError) as e:
+        if e.errno == errno.EINTR:
+          continue
+        raise
+      if _PeerUid(conn) not in (None, os.getuid()):
+        log.warning('Rejected connection from another user.')
+        conn.close()
+        continue
+      # Nothing buffered in the daemon may leak into a request's output.
+      sys.stdout.flush()
+      sys.stderr.flush()
+      pid = os.fork()
+      if pid == 0:
+        self._sock.close()
+        exit_code = self._HandleRequest(conn)
+        # Never return into the accept loop from a request child.
+        os._exit(exit_code)  # pylint: disable=protected-access
+      conn.close()
+
+  def _Cleanup(self):
+    if self._sock:
+      self._sock.close()
+      self._sock = None
+      try:
+        os.remove(self.socket_path)
+      except OSError:
+        pass
+
+  def _HandleRequest(self, conn):
+    """Runs a single request in a forked child.
+
+    Args:
+      conn: socket.socket, The client connection.
+
+    Returns:
+      int, The exit status of the child process.
+    """
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    # Exit handlers inherited from the daemon (its socket cleanup, metrics,
+    # sessions) belong to the daemon; the child runs only those registered by
+    # its own command.
+    atexit._clear()  # pylint: disable=protected-access
+    try:
+      request, fds = protocol.ReceiveRequest(conn)
+    except protocol.ProtocolError as e:
+      log.debug('Bad daemon request: %s', e)
+      return _INTERNAL_ERROR_EXIT_CODE
+    for target_fd, fd in enumerate(fds):
+      os.dup2(fd, target_fd)
+      os.close(fd)
+    os.chdir(request['cwd'])
+    os.environ.clear()
+    os.environ.update(request['env'])
+    # Properties may come from a different configuration directory or named
+    # configuration than the one the daemon was started with.
+    named_configs.ActivePropertiesFile.Invalidate()
+    sys.argv = ['gcloud'] + request['argv']
+
+    threading.Thread(target=self._WatchForInterrupts, args=(conn,),
+                     daemon=True).start()
+    exit_code = self._RunCommand()
+    try:
+      protocol.SendExitCode(conn, exit_code)
+    except (OSError, IOError):
+      pass
+    return 0
+
+  def _WatchForInterrupts(self, conn):
+    """Delivers interrupts forwarded by the client to this process."""
+    while True:
+      try:
+        data = conn.recv(1)
+      except (OSError, IOError):
+        return
+      if not data:
+        return
+      if data == protocol.INTERRUPT:
+        os.kill(os.getpid(), signal.SIGINT)
+
+  def _RunCommand(self):
+    """Runs the command in sys.argv like gcloud_main does.
+
+    Interrupts are handled by the default gcloud handler, which kills this
+    process; the client reports that as an interrupted command.
+
+    Returns:
+      int, The exit code of the command.
+    """
+    # pylint:disable=g-import-not-at-top, Avoid a circular import.
+    from googlecloudsdk import gcloud_main
+
+    exit_code = 0
+    try:
+      gcloud_main.main(gcloud_cli=self._cli)
+    except SystemExit as e:
+      exit_code = e.code if isinstance(e.code, int) else int(bool(e.code))
+    # Run what gcloud would run at interpreter exit (metrics, caches) before
+    # reporting completion, since this process ends with os._exit.
+    atexit._run_exitfuncs()  # pylint: disable=protected-access
+    for stream in (sys.stdout, sys.stderr):
+      try:
+        stream.flush()
+      except (OSError, IOError):
+        pass
+    return exit_code
@@ -18,15 +18,266 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
-import gzip
+import collections
+from concurrent import futures
 import os
+import queue
 import shutil
+import struct
+import threading
+import zlib
 
 from googlecloudsdk.command_lib.storage import storage_url
 from googlecloudsdk.command_lib.storage import user_request_args_factory
 from googlecloudsdk.core import properties
 from googlecloudsdk.core.util import files
 
+# Magic number, deflate method, no flags, no modification time, no extra flags,
+# and unknown operating system.
+_GZIP_HEADER = b'\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff'
+# A final, empty deflate block with fixed Huffman codes.
+_FINAL_DEFLATE_BLOCK = b'\x03\x00'
+# Matches gzip.open.
+_DEFAULT_COMPRESSION_LEVEL = 9
+# Back-references in deflate reach at most this far.
+_DEFLATE_WINDOW_SIZE = 32 * 1024
+# wbits value telling zlib to expect a gzip header and trailer.
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+_COMPRESSION_BLOCK_SIZE = 1024 * 1024
+_DECOMPRESSION_READ_SIZE = 1024 * 1024
+# Maximum decompressed bytes produced by one decompress call.
+_DECOMPRESSION_WRITE_SIZE = 1024 * 1024
+# Blocks read ahead of the decompressor.
+_DECOMPRESSION_READ_AHEAD_COUNT = 4
+
+
+def _compress_block(data, dictionary, compression_level):
+  """Returns data as raw deflate blocks that end on a byte boundary.
+
+  Args:
+    data (bytes): Uncompressed data.
+    dictionary (bytes): Uncompressed data preceding this block in the stream,
+      which back-references may point into.
+    compression_level (int): zlib compression level.
+
+  Returns:
+    Compressed bytes that can be concatenated with the output for the next
+    block.
+  """
+  if dictionary:
+    compressor = zlib.compressobj(
+        compression_level,
+        zlib.DEFLATED,
+        -zlib.MAX_WBITS,
+        zlib.DEF_MEM_LEVEL,
+        zlib.Z_DEFAULT_STRATEGY,
+        dictionary,
+    )
+  else:
+    compressor = zlib.compressobj(
+        compression_level, zlib.DEFLATED, -zlib.MAX_WBITS
+    )
+  return compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
+class ParallelGzipStream(object):
+  """Reads a stream and returns its data gzipped on several threads.
+
+  Like pigz, the stream is split into blocks that are compressed independently
+  with the end of the previous block as a preset dictionary, and the results are
+  concatenated into a single gzip member. zlib releases the GIL while
+  compressing, so blocks are compressed in parallel.
+
+  The stream is not seekable.
+  """
+
+  def __init__(
+      self,
+      stream,
+      thread_count=None,
+      block_size=_COMPRESSION_BLOCK_SIZE,
+      compression_level=_DEFAULT_COMPRESSION_LEVEL,
+  ):
+    """Initializes a ParallelGzipStream instance.
+
+    Args:
+      stream (io.IOBase): Uncompressed data to read.
+      thread_count (int|None): Number of blocks to compress at once. Defaults
+        to the storage/parallel_gzip_thread_count property.
+      block_size (int): Number of uncompressed bytes in each block.
+      compression_level (int): zlib compression level.
+    """
+    if thread_count is None:
+      thread_count = (
+          properties.VALUES.storage.parallel_gzip_thread_count.GetInt() or 1
+      )
+    self._stream = stream
+    self._block_size = block_size
+    self._compression_level = compression_level
+    self._max_pending_blocks = thread_count * 2
+    self._executor = futures.ThreadPoolExecutor(max_workers=thread_count)
+
+    self._pending_blocks = collections.deque()
+    self._dictionary = b''
+    self._crc32 = 0
+    self._uncompressed_size = 0
+    self._stream_exhausted = False
+
+    self._output = _GZIP_HEADER
+    self._output_position = 0
+    self._finished = False
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *unused_args):
+    self.close()
+
+  def readable(self):
+    return True
+
+  def seekable(self):
+    return False
+
+  def _submit_blocks(self):
+    """Reads and starts compressing blocks until enough are pending."""
+    while (
+        not self._stream_exhausted
+        and len(self._pending_blocks) < self._max_pending_blocks
+    ):
+      data = self._stream.read(self._block_size)
+      if not data:
+        self._stream_exhausted = True
+        return
+      self._crc32 = zlib.crc32(data, self._crc32)
+      self._uncompressed_size += len(data)
+      self._pending_blocks.append(
+          self._executor.submit(
+              _compress_block, data, self._dictionary, self._compression_level
+          )
+      )
+      self._dictionary = data[-_DEFLATE_WINDOW_SIZE:]
+
+  def _get_next_output(self):
+    """Returns the next piece of compressed data, or None at the end."""
+    self._submit_blocks()
+    if self._pending_blocks:
+      return self._pending_blocks.popleft().result()
+    if self._finished:
+      return None
+    self._finished = True
+    return _FINAL_DEFLATE_BLOCK + struct.pack(
+        '<II', self._crc32 & 0xFFFFFFFF, self._uncompressed_size & 0xFFFFFFFF
+    )
+
+  def read(self, size=-1):
+    """Returns up to size bytes of gzip data, or all of it if size < 0."""
+    read_all = size is None or size < 0
+    while read_all or len(self._output) - self._output_position < size:
+      data = self._get_next_output()
+      if data is None:
+        break
+      self._output = self._output[self._output_position:] + data
+      self._output_position = 0
+
+    if read_all:
+      size = len(self._output) - self._output_position
+    data = self._output[self._output_position:self._output_position + size]
+    self._output_position += len(data)
+    return data
+
+  def close(self):
+    for block in self._pending_blocks:
+      block.cancel()
+    self._executor.shutdown(wait=True)
+    self._stream.close()
+
+
+def _read_ahead(stream, read_size, read_ahead_count):
+  """Yields data from stream, read on another thread.
+
+  Args:
+    stream (io.IOBase): Stream to read.
+    read_size (int): Number of bytes to read at once.
+    read_ahead_count (int): Number of reads allowed to wait for the consumer.
+
+  Yields:
+    bytes from stream until it is exhausted.
+  """
+  data_queue = queue.Queue(maxsize=read_ahead_count)
+  stop_event = threading.Event()
+
+  def _read():
+    try:
+      while not stop_event.is_set():
+        data = stream.read(read_size)
+        data_queue.put(data)
+        if not data:
+          return
+    except Exception as e:  # pylint: disable=broad-except
+      data_queue.put(e)
+
+  reader = threading.Thread(target=_read)
+  reader.daemon = True
+  reader.start()
+  try:
+    while True:
+      data = data_queue.get()
+      if isinstance(data, Exception):
+        raise data
+      if not data:
+        return
+      yield data
+  finally:
+    stop_event.set()
+    # Unblocks the reader if it is waiting for space in the queue.
+    while reader.is_alive():
+      try:
+        data_queue.get(timeout=0.1)
+      except queue.Empty:
+        pass
+
+
+def _decompress_gzip_stream(source_stream, destination_stream):
+  """Writes the decompressed contents of a gzip stream to another stream.
+
+  Reads happen on a separate thread so that they overlap with decompression and
+  writes. Concatenated gzip members are all decompressed, like gzip.open does.
+
+  Args:
+    source_stream (io.IOBase): Gzip data to read.
+    destination_stream (io.IOBase): Stream to write decompressed data to.
+
+  Raises:
+    EOFError: The gzip data was truncated.
+    zlib.error: The data is not valid gzip data.
+  """
+  decompressor = zlib.decompressobj(_GZIP_WBITS)
+  member_started = False
+  for data in _read_ahead(
+      source_stream, _DECOMPRESSION_READ_SIZE, _DECOMPRESSION_READ_AHEAD_COUNT
+  ):
+    while data:
+      if not member_started and not data.strip(b'\x00'):
+        # gzip.open also ignores padding after the last member.
+        break
+      member_started = True
+      # Bounded output keeps highly compressed data from filling memory.
+      destination_stream.write(
+          decompressor.decompress(data, _DECOMPRESSION_WRITE_SIZE)
+      )
+      if decompressor.eof:
+        data = decompressor.unused_data
+        decompressor = zlib.decompressobj(_GZIP_WBITS)
+        member_started = False
+      else:
+        data = decompressor.unconsumed_tail
+  if member_started:
+    raise EOFError(
+        'Compressed file ended before the end-of-stream marker was reached.'
+    )
+
 
 def decompress_gzip_if_necessary(source_resource,
                                  gzipped_path,
@@ -52,7 +303,7 @@ def decompress_gzip_if_necessary(source_resource,
     return False
 
   try:
-    with gzip.open(gzipped_path, 'rb') as gzipped_file:
+    with files.BinaryFileReader(gzipped_path) as gzipped_file:
       with files.BinaryFileWriter(
           destination_path,
           create_path=True,
@@ -60,9 +311,9 @@ def decompress_gzip_if_necessary(source_resource,
               properties.VALUES.storage
               .convert_incompatible_windows_path_characters.GetBool()
           )) as ungzipped_file:
-        shutil.copyfileobj(gzipped_file, ungzipped_file)
+        _decompress_gzip_stream(gzipped_file, ungzipped_file)
     return True
-  except OSError:
+  except (OSError, zlib.error):
     # May indicate trying to decompress non-gzipped file. Clean up.
     os.remove(destination_path)
 
@@ -97,7 +348,7 @@ def should_gzip_locally(gzip_settings, file_path):
 
 def get_temporary_gzipped_file(file_path):
   zipped_file_path = file_path + storage_url.TEMPORARY_FILE_SUFFIX
-  with files.BinaryFileReader(file_path) as file_reader:
-    with gzip.open(zipped_file_path, 'wb') as gzip_file_writer:
-      shutil.copyfileobj(file_reader, gzip_file_writer)
+  with ParallelGzipStream(files.BinaryFileReader(file_path)) as gzip_stream:
+    with files.BinaryFileWriter(zipped_file_path) as gzip_file_writer:
+      shutil.copyfileobj(gzip_stream, gzip_file_writer)
   return zipped_file_path
@@ -21,15 +21,25 @@ from __future__ import unicode_literals
 
 import base64
 import binascii
+from concurrent import futures
 import enum
+import os
 
 from googlecloudsdk.command_lib.storage import errors
 from googlecloudsdk.command_lib.storage import fast_crc32c_util
+from googlecloudsdk.command_lib.util import crc32c
 from googlecloudsdk.core import log
+from googlecloudsdk.core import properties
 from googlecloudsdk.core.updater import installers
 from googlecloudsdk.core.util import files
 from googlecloudsdk.core.util import hashing
 
+# Each thread of a parallel CRC32C calculation hashes at least this many bytes.
+_MIN_PARALLEL_HASHING_RANGE_SIZE = 32 * 1024 * 1024
+# google-crc32c only releases the GIL for large buffers, so ranges are read in
+# bigger pieces than files hashed on one thread.
+_PARALLEL_HASHING_READ_SIZE = 4 * 1024 * 1024
+
 
 class HashAlgorithm(enum.Enum):
   """Algorithms available for hashing data."""
@@ -105,6 +115,95 @@ def get_hash_from_data_chunk_or_file(
   return hash_object
 
 
+def combine_crc32c_checksums(checksums_and_lengths):
+  """Returns the CRC32C checksum of consecutive byte ranges.
+
+  Args:
+    checksums_and_lengths (Iterable[tuple[int, int]]): The CRC32C checksum and
+      byte count of each range, in the order the ranges appear in the data.
+
+  Returns:
+    int: The CRC32C checksum of all ranges concatenated.
+  """
+  combined_checksum = 0
+  for checksum, length in checksums_and_lengths:
+    combined_checksum = crc32c.concat_checksums(
+        combined_checksum, checksum, b_byte_count=length
+    )
+  return combined_checksum
+
+
+def _get_crc32c_checksum_of_range(path, start, stop):
+  """Reads bytes [start, stop) of a file and returns their CRC32C checksum."""
+  hash_object = crc32c.get_crc32c()
+  with files.BinaryFileReader(path) as stream:
+    stream.seek(start)
+    position = start
+    while position < stop:
+      data = stream.read(min(_PARALLEL_HASHING_READ_SIZE, stop - position))
+      if not data:
+        break
+      hash_object.update(data)
+      position += len(data)
+  return crc32c.get_checksum(hash_object)
+
+
+def _get_parallel_hashing_ranges(start, stop):
+  """Returns the (start, stop) ranges to hash on separate threads."""
+  thread_count = (
+      properties.VALUES.storage.parallel_hashing_thread_count.GetInt()
+  )
+  range_count = min(
+      thread_count or 1, (stop - start) // _MIN_PARALLEL_HASHING_RANGE_SIZE
+  )
+  if range_count < 2:
+    return None
+  range_size = -(-(stop - start) // range_count)
+  return [
+      (range_start, min(range_start + range_size, stop))
+      for range_start in range(start, stop, range_size)
+  ]
+
+
+def _get_crc32c_from_file_in_parallel(path, start, stop):
+  """Hashes ranges of a file concurrently and returns a CRC32C object.
+
+  Only used with the google-crc32c C extension, which releases the GIL while
+  hashing.
+
+  Args:
+    path (str): File to read.
+    start (int|None): Byte index to start hashing at.
+    stop (int|None): Stop hashing at this byte index.
+
+  Returns:
+    CRC32C object for the byte range, or None if the range is too small to
+    split.
+  """
+  start = start or 0
+  try:
+    file_size = os.path.getsize(path)
+  except OSError:
+    return None
+  stop = min(stop, file_size) if stop else file_size
+  if stop <= start:
+    return None
+  ranges = _get_parallel_hashing_ranges(start, stop)
+  if not ranges:
+    return None
+
+  with futures.ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+    checksums = executor.map(
+        lambda byte_range: _get_crc32c_checksum_of_range(path, *byte_range),
+        ranges,
+    )
+    checksum = combine_crc32c_checksums(
+        (checksum, range_stop - range_start)
+        for checksum, (range_start, range_stop) in zip(checksums, ranges)
+    )
+  return crc32c.get_crc32c_from_checksum(checksum)
+
+
 def get_hash_from_file(path, hash_algorithm, start=None, stop=None):
   """Reads file and returns its hash object.
 
@@ -113,6 +212,9 @@ def get_hash_from_file(path, hash_algorithm, start=None, stop=None):
   -Uses a FIPS-safe MD5 object.
   -Accomodates gcloud_crc32c, which uses a Go binary for hashing.
   -Supports start and end index to set byte range for hashing.
+  -Hashes large files on several threads if CRC32C is requested and the
+   google-crc32c C extension is available. See the
+   storage/parallel_hashing_thread_count property.
 
   Args:
     path (str): File to read.
@@ -130,6 +232,14 @@ def get_hash_from_file(path, hash_algorithm, start=None, stop=None):
   if isinstance(hash_object, fast_crc32c_util.DeferredCrc32c):
     return _get_hash_for_deferred_crc32c(path, hash_object, start, stop)
 
+  if (
+      hash_algorithm == HashAlgorithm.CRC32C
+      and crc32c.IS_FAST_GOOGLE_CRC32C_AVAILABLE
+  ):
+    parallel_hash_object = _get_crc32c_from_file_in_parallel(path, start, stop)
+    if parallel_hash_object is not None:
+      return parallel_hash_object
+
   with files.BinaryFileReader(path) as stream:
     if start:
       stream.seek(start)
@@ -12,22 +12,51 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""For managing the copy manifest feature (manifest = a file with copy info)."""
+"""For managing the copy manifest feature (manifest = a file with copy info).
+
+Rows are buffered and appended to the manifest in batches, each followed by an
+fsync. Sources the manifest marks as completed or skipped are also recorded in
+an SQLite index next to it, so resuming a copy looks sources up on disk instead
+of loading the whole manifest into memory. A crash loses at most the rows of
+the last batch, which only causes those files to be copied again.
+"""
 
 from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+import contextlib
 import csv
 import datetime
 import enum
+import hashlib
 import os
+import sqlite3
+import threading
+import time
 
 from googlecloudsdk.command_lib.storage import thread_messages
+from googlecloudsdk.core import log
 from googlecloudsdk.core import properties
 from googlecloudsdk.core.util import files
 from googlecloudsdk.core.util import retry
 
+_INDEX_SUFFIX = '.index'
+# Buffered rows are written once there are this many or they are this old.
+_FLUSH_INTERVAL_ROWS = 1000
+_FLUSH_INTERVAL_SECONDS = 5
+# The index belongs to a manifest if the start of the manifest is unchanged.
+_FINGERPRINT_BYTES = 64 * 1024
+
+_INDEX_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS completed_sources (source TEXT PRIMARY KEY)',
+    'CREATE TABLE IF NOT EXISTS manifest_state ('
+    ' id INTEGER PRIMARY KEY CHECK (id = 0),'
+    ' indexed_size INTEGER NOT NULL,'
+    ' fingerprint_size INTEGER NOT NULL,'
+    ' fingerprint TEXT NOT NULL)',
+)
+
 
 def _should_retry_if_permission_error(
     exc_type, exc_value, exc_traceback, state
@@ -82,11 +111,128 @@ class ResultStatus(enum.Enum):
   SKIP = 'skip'
 
 
+_COMPLETED_RESULTS = (ResultStatus.OK.value, ResultStatus.SKIP.value)
+
+
+def _get_fingerprint(manifest_path, size):
+  """Returns the hash of the first size bytes of the manifest."""
+  with files.BinaryFileReader(manifest_path) as file_reader:
+    return hashlib.sha256(file_reader.read(size)).hexdigest()
+
+
+class ManifestIndex:
+  """SQLite backed set of the sources a manifest marks as completed or skipped.
+
+  The index records how much of the manifest it covers. When opened, rows
+  appended since, e.g. by an older gcloud version or gsutil, are indexed. If the
+  start of the manifest changed, the index is rebuilt.
+
+  Supports `in` for lookups. Methods are thread safe.
+  """
+
+  def __init__(self, manifest_path):
+    self._manifest_path = manifest_path
+    self._connection = sqlite3.connect(
+        manifest_path + _INDEX_SUFFIX, timeout=60, check_same_thread=False
+    )
+    self._connection.execute('PRAGMA journal_mode=WAL')
+    self._connection.execute('PRAGMA synchronous=NORMAL')
+    for statement in _INDEX_SCHEMA:
+      self._connection.execute(statement)
+    self._connection.commit()
+    self._lock = threading.Lock()
+    with self._lock:
+      self._catch_up()
+
+  def _get_indexed_size(self):
+    """Returns how many manifest bytes are indexed, 0 if the index is stale."""
+    row = self._connection.execute(
+        'SELECT indexed_size, fingerprint_size, fingerprint FROM manifest_state'
+    ).fetchone()
+    if row is None:
+      return 0
+    indexed_size, fingerprint_size, fingerprint = row
+    if (
+        os.path.getsize(self._manifest_path) < indexed_size
+        or _get_fingerprint(self._manifest_path, fingerprint_size)
+        != fingerprint
+    ):
+      self._connection.execute('DELETE FROM completed_sources')
+      return 0
+    return indexed_size
+
+  def _record_state(self, indexed_size):
+    fingerprint_size = min(indexed_size, _FINGERPRINT_BYTES)
+    self._connection.execute(
+        'INSERT OR REPLACE INTO manifest_state VALUES (0, ?, ?, ?)',
+        (
+            indexed_size,
+            fingerprint_size,
+            _get_fingerprint(self._manifest_path, fingerprint_size),
+        ),
+    )
+
+  def _catch_up(self):
+    """Indexes manifest rows past the indexed size."""
+    if not os.path.exists(self._manifest_path):
+      return
+    indexed_size = self._get_indexed_size()
+    manifest_size = os.path.getsize(self._manifest_path)
+    if manifest_size > indexed_size:
+      with get_file_read_handle(self._manifest_path) as file_reader:
+        field_names = next(csv.reader(file_reader), None)
+        if indexed_size:
+          file_reader.seek(indexed_size)
+        self._connection.executemany(
+            'INSERT OR IGNORE INTO completed_sources VALUES (?)',
+            (
+                (row['Source'],)
+                for row in csv.DictReader(file_reader, field_names)
+                if row.get('Result') in _COMPLETED_RESULTS
+            ),
+        )
+      self._record_state(manifest_size)
+    self._connection.commit()
+
+  def __contains__(self, source):
+    with self._lock:
+      return (
+          self._connection.execute(
+              'SELECT 1 FROM completed_sources WHERE source = ?', (source,)
+          ).fetchone()
+          is not None
+      )
+
+  def add(self, sources, manifest_size):
+    """Records completed sources of rows written up to manifest_size bytes."""
+    with self._lock:
+      self._connection.executemany(
+          'INSERT OR IGNORE INTO completed_sources VALUES (?)',
+          ((source,) for source in sources),
+      )
+      self._record_state(manifest_size)
+      self._connection.commit()
+
+  def close(self):
+    with self._lock:
+      self._connection.close()
+
+
+def _open_index(manifest_path):
+  """Returns a ManifestIndex for the manifest or None if it cannot be used."""
+  try:
+    return ManifestIndex(manifest_path)
+  except (OSError, sqlite3.Error) as e:
+    log.warning('Could not open manifest index, using manifest only: {}'.format(
+        e))
+    return None
+
+
 class ManifestManager:
   """Handles writing copy statuses to manifest."""
 
   def __init__(self, manifest_path):
-    """Creates manifest file with correct headers."""
+    """Creates manifest file with correct headers and opens its index."""
     # UploadId is never populated and kept around for compatibility with gsutil.
     self._manifest_column_headers = (
         [
@@ -110,16 +256,21 @@ class ManifestManager:
     )
 
     self._manifest_path = manifest_path
-    if os.path.exists(manifest_path) and os.path.getsize(manifest_path) > 0:
-      return
-
-    with get_file_write_handle(
-        manifest_path, newline='\n'
-    ) as file_writer:
-      csv.DictWriter(file_writer, self._manifest_column_headers).writeheader()
+    self._rows = []
+    self._completed_sources = []
+    self._last_flush_time = time.time()
+
+    if not (
+        os.path.exists(manifest_path) and os.path.getsize(manifest_path) > 0
+    ):
+      with get_file_write_handle(manifest_path, newline='\n') as file_writer:
+        csv.DictWriter(
+            file_writer, self._manifest_column_headers
+        ).writeheader()
+    self._index = _open_index(manifest_path)
 
   def write_row(self, manifest_message, file_progress=None):
-    """Writes data to manifest file."""
+    """Buffers a row of data for the manifest file, flushing if needed."""
     if file_progress and manifest_message.result_status is ResultStatus.OK:
       bytes_copied = file_progress.total_bytes_copied
     else:
@@ -150,25 +301,83 @@ class ManifestManager:
     }
     if properties.VALUES.storage.run_by_gsutil_shim.GetBool():
       row_dictionary['UploadId'] = None
+    self._rows.append(row_dictionary)
+    if row_dictionary['Result'] in _COMPLETED_RESULTS:
+      self._completed_sources.append(row_dictionary['Source'])
+
+    if (
+        len(self._rows) >= _FLUSH_INTERVAL_ROWS
+        or time.time() - self._last_flush_time >= _FLUSH_INTERVAL_SECONDS
+    ):
+      self.flush()
+
+  def flush(self):
+    """Appends buffered rows to the manifest, syncs it and updates the index."""
+    self._last_flush_time = time.time()
+    if not self._rows:
+      return
     with get_file_write_handle(
         self._manifest_path, append=True, newline='\n') as file_writer:
       csv.DictWriter(file_writer,
-                     self._manifest_column_headers).writerow(row_dictionary)
+                     self._manifest_column_headers).writerows(self._rows)
+      file_writer.flush()
+      os.fsync(file_writer.fileno())
+    self._rows = []
+
+    if self._index:
+      try:
+        self._index.add(
+            self._completed_sources, os.path.getsize(self._manifest_path)
+        )
+      except sqlite3.Error as e:
+        # The next ManifestIndex opened for this manifest catches up.
+        log.debug('Could not update manifest index: %s', e)
+    self._completed_sources = []
+
+  def close(self):
+    """Flushes buffered rows and closes the index."""
+    self.flush()
+    if self._index:
+      self._index.close()
+      self._index = None
 
 
 def parse_for_completed_sources(manifest_path):
-  """Extracts set of completed or skipped copies from manifest CSV."""
+  """Returns completed or skipped sources of the manifest CSV.
+
+  Args:
+    manifest_path (str|None): Path to the manifest.
+
+  Returns:
+    ManifestIndex|set[str]: Supports `in` checks of source URL strings. A set
+      loaded from the manifest if its index cannot be opened. The caller must
+      close a ManifestIndex, see completed_sources().
+  """
   if not (manifest_path and os.path.exists(manifest_path)):
     return set()
+  index = _open_index(manifest_path)
+  if index:
+    return index
   res = set()
   with get_file_read_handle(manifest_path) as file_reader:
     csv_reader = csv.DictReader(file_reader)
     for row in csv_reader:
-      if row['Result'] in (ResultStatus.OK.value, ResultStatus.SKIP.value):
+      if row['Result'] in _COMPLETED_RESULTS:
         res.add(row['Source'])
   return res
 
 
+@contextlib.contextmanager
+def completed_sources(manifest_path):
+  """Yields parse_for_completed_sources(), closing its index afterwards."""
+  sources = parse_for_completed_sources(manifest_path)
+  try:
+    yield sources
+  finally:
+    if isinstance(sources, ManifestIndex):
+      sources.close()
+
+
 def _send_manifest_message(task_status_queue,
                            source_resource,
                            destination_resource,
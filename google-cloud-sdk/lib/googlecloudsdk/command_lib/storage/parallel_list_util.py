@@ -0,0 +1,411 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Lists a bucket prefix as concurrently listed key range shards.
+
+A recursive listing is a single stream of pages, each one request round trip
+after the previous one. ShardedObjectLister splits the key space of a prefix
+into contiguous [start_offset, end_offset) ranges and lists them on several
+threads:
+
+1. A delimiter probe lists the top level of the prefix. If it returns few
+   enough entries, the sub-prefixes it finds become the range boundaries.
+   Otherwise the key space is split evenly.
+2. While a worker is listing a long range and another worker is idle, it
+   splits the rest of its range in two and hands the upper half over.
+
+Ranges are contiguous and disjoint, so ordered results are produced by reading
+the ranges in key order. Because splitting restarts listing after the last
+returned name, only listings with one entry per name (live objects) can be
+sharded.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import collections
+import threading
+
+from googlecloudsdk.api_lib.storage import api_factory
+from googlecloudsdk.api_lib.storage import cloud_api
+from googlecloudsdk.command_lib.storage import storage_url
+from googlecloudsdk.command_lib.storage.resources import resource_reference
+from googlecloudsdk.core import properties
+
+# The delimiter probe gives up on prefix boundaries after this many entries.
+_PROBE_LIMIT = cloud_api.NUM_ITEMS_PER_LIST_PAGE
+# A range is only split after it returned this many entries, so that small
+# ranges are not split into many one page requests.
+_MIN_ITEMS_BEFORE_SPLIT = 2 * cloud_api.NUM_ITEMS_PER_LIST_PAGE
+# Initial ranges per worker, leaving room for uneven ranges.
+_RANGES_PER_WORKER = 4
+# Results buffered per worker before workers wait for the consumer.
+_MAX_BUFFERED_ITEMS_PER_WORKER = 10 * cloud_api.NUM_ITEMS_PER_LIST_PAGE
+
+# Open ended ranges are split in the ASCII range first, where most object
+# names are.
+_OPEN_END_ASCII = 0x80
+_SURROGATES_START = 0xD800
+_SURROGATES_END = 0xE000
+_MAX_CODE_POINT = 0x110000
+
+
+def _get_split_character(low, high):
+  """Returns a code point strictly between low and high or None."""
+  middle = (low + high) // 2
+  if _SURROGATES_START <= middle < _SURROGATES_END:
+    # Surrogates can't be encoded in object names.
+    middle = _SURROGATES_START - 1 if low < _SURROGATES_START - 1 else (
+        _SURROGATES_END)
+  if low < middle < high:
+    return middle
+  return None
+
+
+def get_split_key(start, end):
+  """Returns a key strictly between start and end.
+
+  Keys are compared like object names, by code point, which is the same order
+  as their UTF-8 encoding.
+
+  Args:
+    start (str): The start of the range.
+    end (str|None): The end of the range, None for no end.
+
+  Returns:
+    str|None: A key k with start < k < end, or None if there is none worth
+      splitting on.
+  """
+  for i in range(len(start) + 1):
+    low = ord(start[i]) if i < len(start) else -1
+    if end is None:
+      if low < _OPEN_END_ASCII - 1:
+        high = _OPEN_END_ASCII
+      elif low < _SURROGATES_START - 1:
+        high = _SURROGATES_START
+      else:
+        high = _MAX_CODE_POINT
+    elif i < len(end):
+      high = ord(end[i])
+    else:
+      return None
+
+    if low == high:
+      continue
+    middle = _get_split_character(low, high)
+    if middle is not None and middle > 0:
+      return start[:i] + chr(middle)
+    if low < 0:
+      return None
+    # No room at this position, any key after start with its next character
+    # is before end.
+    rest = get_split_key(start[i + 1:], None)
+    return None if rest is None else start[:i + 1] + rest
+  return None
+
+
+def get_prefix_end(prefix):
+  """Returns the first key after all keys starting with prefix, or None."""
+  while prefix:
+    code_point = ord(prefix[-1]) + 1
+    if code_point == _SURROGATES_START:
+      code_point = _SURROGATES_END
+    if code_point < _MAX_CODE_POINT:
+      return prefix[:-1] + chr(code_point)
+    prefix = prefix[:-1]
+  return None
+
+
+class _Range(object):
+  """A key range [start, end) of the listing and its buffered results."""
+
+  def __init__(self, start, end):
+    self.start = start
+    self.end = end
+    self.items = collections.deque()
+    self.done = False
+    self.next = None
+
+
+class ShardedObjectLister(object):
+  """Lists a prefix with concurrent key range shards.
+
+  Attributes:
+    list_function (func(start_offset, end_offset, delimiter)): Returns an
+      iterator of the resources of a range in name order. It is called from
+      worker threads.
+    prefix (str): The listed prefix.
+    max_workers (int): The number of listing threads.
+    ordered (bool): If True, results are returned in name order. Otherwise
+      they are returned as they arrive.
+  """
+
+  def __init__(self, list_function, prefix, max_workers, ordered=True):
+    self.list_function = list_function
+    self.prefix = prefix or ''
+    self.max_workers = max_workers
+    self.ordered = ordered
+    self._condition = threading.Condition()
+    self._pending_ranges = []
+    self._active_ranges = 0
+    self._idle_workers = 0
+    self._buffered_items = 0
+    self._unordered_items = collections.deque()
+    self._consumed_range = None
+    self._error = None
+    self._closed = False
+
+  def _get_initial_boundaries(self):
+    """Returns the sorted keys to split the prefix on."""
+    boundaries = []
+    for i, resource in enumerate(
+        self.list_function(None, None, storage_url.CLOUD_URL_DELIMITER)
+    ):
+      if i >= _PROBE_LIMIT:
+        boundaries = None
+        break
+      if (
+          isinstance(resource, resource_reference.PrefixResource)
+          and resource.prefix > self.prefix
+      ):
+        boundaries.append(resource.prefix)
+
+    max_ranges = self.max_workers * _RANGES_PER_WORKER
+    if boundaries:
+      boundaries = sorted(set(boundaries))
+      step = max(1, len(boundaries) // max_ranges)
+      return boundaries[step - 1::step][:max_ranges]
+
+    # Too many or no sub-prefixes, split evenly.
+    keys = [self.prefix, get_prefix_end(self.prefix)]
+    while len(keys) - 1 < max_ranges:
+      split_keys = []
+      for start, end in zip(keys, keys[1:]):
+        split_keys.append(start)
+        key = get_split_key(start, end)
+        if key is not None:
+          split_keys.append(key)
+      split_keys.append(keys[-1])
+      if len(split_keys) == len(keys):
+        break
+      keys = split_keys
+    return keys[1:-1]
+
+  def _take_range(self):
+    """Waits for a range to list, returns None when there are none left."""
+    with self._condition:
+      while not (self._pending_ranges or self._closed):
+        if not self._active_ranges:
+          return None
+        self._idle_workers += 1
+        self._condition.wait()
+        self._idle_workers -= 1
+      if self._closed:
+        return None
+      self._active_ranges += 1
+      # Ranges are taken in key order, so the range being consumed is always
+      # listed or about to be listed.
+      return self._pending_ranges.pop(0)
+
+  def _add_item(self, key_range, item):
+    """Buffers an item, waiting while too many are buffered."""
+    with self._condition:
+      if self.ordered:
+        key_range.items.append(item)
+      else:
+        self._unordered_items.append(item)
+      self._buffered_items += 1
+      self._condition.notify_all()
+      max_buffered_items = self.max_workers * _MAX_BUFFERED_ITEMS_PER_WORKER
+      # The range being consumed never waits, its items unblock everything.
+      while (
+          self._buffered_items > max_buffered_items
+          and not self._closed
+          and not (self.ordered and key_range is self._consumed_range)
+      ):
+        self._condition.wait()
+      return not self._closed
+
+  def _try_split(self, key_range, last_key):
+    """Hands the upper half of the rest of key_range to an idle worker.
+
+    Args:
+      key_range (_Range): The range being listed.
+      last_key (str): The last name listed in the range.
+
+    Returns:
+      bool: True if key_range was split and its end moved.
+    """
+    with self._condition:
+      if not self._idle_workers or self._closed:
+        return False
+      split_key = get_split_key(last_key + '\0', key_range.end)
+      if split_key is None:
+        return False
+      upper_range = _Range(split_key, key_range.end)
+      upper_range.next = key_range.next
+      key_range.next = upper_range
+      key_range.end = split_key
+      self._pending_ranges.append(upper_range)
+      self._pending_ranges.sort(key=lambda r: r.start)
+      self._condition.notify_all()
+      return True
+
+  def _list_range(self, key_range):
+    """Lists key_range into its buffer, splitting it when workers are idle."""
+    start = key_range.start or None
+    iterator = iter(self.list_function(start, key_range.end, None))
+    items_since_split = 0
+    while True:
+      item = next(iterator, None)
+      if item is None:
+        return
+      if not self._add_item(key_range, item):
+        return
+      items_since_split += 1
+      if items_since_split >= _MIN_ITEMS_BEFORE_SPLIT:
+        name = item.storage_url.resource_name
+        if self._try_split(key_range, name):
+          # The open request covers the old end, restart after the last name.
+          iterator = iter(self.list_function(name + '\0', key_range.end, None))
+          items_since_split = 0
+
+  def _work(self):
+    while True:
+      key_range = self._take_range()
+      if key_range is None:
+        return
+      try:
+        self._list_range(key_range)
+      except Exception as e:  # pylint: disable=broad-except
+        with self._condition:
+          if self._error is None:
+            self._error = e
+          self._closed = True
+      finally:
+        with self._condition:
+          key_range.done = True
+          self._active_ranges -= 1
+          self._condition.notify_all()
+
+  def _start(self):
+    """Creates the initial ranges and starts the workers."""
+    boundaries = self._get_initial_boundaries()
+    starts = [self.prefix] + boundaries
+    ends = boundaries + [get_prefix_end(self.prefix)]
+    ranges = [_Range(start, end) for start, end in zip(starts, ends)]
+    for key_range, next_range in zip(ranges, ranges[1:]):
+      key_range.next = next_range
+    self._pending_ranges = list(ranges)
+    self._consumed_range = ranges[0]
+    for _ in range(self.max_workers):
+      thread = threading.Thread(target=self._work)
+      thread.daemon = True
+      thread.start()
+
+  def _get_items(self):
+    """Waits for and returns the next buffered items, [] at the end."""
+    with self._condition:
+      while True:
+        if self._error is not None:
+          raise self._error  # pylint: disable=raising-bad-type
+        if self.ordered:
+          key_range = self._consumed_range
+          if key_range is None:
+            return []
+          items = key_range.items
+          if not items and key_range.done:
+            self._consumed_range = key_range.next
+            self._condition.notify_all()
+            continue
+        else:
+          items = self._unordered_items
+          if not items and not (self._pending_ranges or self._active_ranges):
+            return []
+        if items:
+          batch = list(items)
+          items.clear()
+          self._buffered_items -= len(batch)
+          self._condition.notify_all()
+          return batch
+        self._condition.wait()
+
+  def __iter__(self):
+    self._start()
+    try:
+      while True:
+        items = self._get_items()
+        if not items:
+          return
+        for item in items:
+          yield item
+    finally:
+      with self._condition:
+        self._closed = True
+        self._condition.notify_all()
+
+
+def get_parallel_listing_threads():
+  """Returns the storage/parallel_listing_threads property, 1 if unset."""
+  return properties.VALUES.storage.parallel_listing_threads.GetInt() or 1
+
+
+def list_objects(
+    provider,
+    bucket_name,
+    prefix=None,
+    fields_scope=cloud_api.FieldsScope.NO_ACL,
+    halt_on_empty_response=True,
+    list_filter=None,
+    max_workers=None,
+    ordered=True,
+):
+  """Recursively lists live objects under prefix with concurrent shards.
+
+  Args:
+    provider (storage_url.ProviderPrefix): The provider of the bucket. Its API
+      must have the LIST_OFFSETS capability.
+    bucket_name (str): The bucket to list.
+    prefix (str|None): The prefix to list.
+    fields_scope (cloud_api.FieldsScope): See CloudApi.list_objects.
+    halt_on_empty_response (bool): See CloudApi.list_objects.
+    list_filter (str|None): See CloudApi.list_objects.
+    max_workers (int|None): The number of listing threads, defaults to the
+      storage/parallel_listing_threads property.
+    ordered (bool): Return the objects in name order.
+
+  Returns:
+    An iterator of resource_reference.ObjectResource.
+  """
+
+  def _list(start_offset, end_offset, delimiter):
+    # API instances are thread local. Zonal buckets use a different client.
+    return api_factory.get_api(provider, bucket_name=bucket_name).list_objects(
+        bucket_name=bucket_name,
+        prefix=prefix,
+        delimiter=delimiter,
+        fields_scope=fields_scope,
+        halt_on_empty_response=halt_on_empty_response,
+        list_filter=list_filter,
+        start_offset=start_offset,
+        end_offset=end_offset,
+    )
+
+  return ShardedObjectLister(
+      _list,
+      prefix,
+      max_workers or get_parallel_listing_threads(),
+      ordered=ordered,
+  )
@@ -415,3 +415,71 @@ class GcsObjectResource(resource_reference.ObjectResource):
   def get_formatted_acl(self):
     """See base class."""
     return {full_resource_formatter.ACL_KEY: _get_formatted_acl(self.acl)}
+
+
+def _new_gcs_object_resource():
+  """Returns an uninitialized GcsObjectResource to unpickle state into."""
+  return GcsObjectResource.__new__(GcsObjectResource)
+
+
+class GcsListedObjectResource(GcsObjectResource):
+  """GcsObjectResource that converts metadata fields when they are first read.
+
+  Listings can return tens of millions of objects, most of which are only
+  printed, counted, or compared by name and size. Instances hold the URL and
+  the API message in slots, and other attributes of GcsObjectResource are
+  converted from the message the first time they are read, then cached. Since
+  nothing is stored in the instance dictionary until then, objects whose
+  fields are never read cost a fraction of a GcsObjectResource.
+
+  Attributes can be set as usual. Pickling or copying an instance produces an
+  equivalent GcsObjectResource with every field converted.
+  """
+
+  __slots__ = ('storage_url', 'metadata', '_field_getters')
+
+  def __init__(self, storage_url_object, metadata, field_getters):
+    """Initializes GcsListedObjectResource.
+
+    Args:
+      storage_url_object (StorageUrl): The object's URL.
+      metadata (messages.Object): The object's API message.
+      field_getters (dict[str, Callable[[messages.Object], Any]]): Map of
+        GcsObjectResource initializer arguments to functions returning their
+        values for metadata. Shared by instances from the same listing.
+    """
+    # Skips the parent initializers, which convert every field.
+    # pylint: disable=super-init-not-called
+    self.storage_url = storage_url_object
+    self.metadata = metadata
+    self._field_getters = field_getters
+
+  def __getattr__(self, name):
+    # Only called for attributes that have not been read or set yet. Uses
+    # object.__getattribute__ since slots are unset while unpickling.
+    try:
+      getter = object.__getattribute__(self, '_field_getters')[name]
+    except (AttributeError, KeyError):
+      raise AttributeError(
+          '{!r} object has no attribute {!r}'.format(type(self).__name__, name)
+      )
+    value = getter(self.metadata)
+    setattr(self, name, value)
+    return value
+
+  def materialize(self):
+    """Returns a GcsObjectResource with every field converted."""
+    fields = {name: getattr(self, name) for name in self._field_getters}
+    return GcsObjectResource(
+        self.storage_url, metadata=self.metadata, **fields
+    )
+
+  def __reduce__(self):
+    # Field getters are not necessarily picklable, and processes receiving
+    # resources usually read their fields.
+    return _new_gcs_object_resource, (), self.materialize().__dict__
+
+  def __eq__(self, other):
+    # The parent compares classes, which would make listed and regular
+    # resources for the same object unequal.
+    return self.materialize() == other
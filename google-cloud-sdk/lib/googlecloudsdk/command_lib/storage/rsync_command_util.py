@@ -29,6 +29,7 @@ from googlecloudsdk.command_lib.storage import path_util
 from googlecloudsdk.command_lib.storage import plurality_checkable_iterator
 from googlecloudsdk.command_lib.storage import posix_util
 from googlecloudsdk.command_lib.storage import progress_callbacks
+from googlecloudsdk.command_lib.storage import rsync_file_index
 from googlecloudsdk.command_lib.storage import storage_url
 from googlecloudsdk.command_lib.storage import tracker_file_util
 from googlecloudsdk.command_lib.storage import wildcard_iterator
@@ -297,6 +298,13 @@ def parse_csv_line_to_resource(line, is_managed_folder=False):
   return cloud_object
 
 
+def _compute_local_hash(path, hash_algorithm):
+  """Reads the file at path and returns its base64 encoded hash."""
+  return hash_util.get_base64_hash_digest_string(
+      hash_util.get_hash_from_file(path, hash_algorithm)
+  )
+
+
 def _compute_hashes_and_return_match(source_resource, destination_resource):
   """Does minimal computation to compare checksums of resources."""
   if source_resource.size != destination_resource.size:
@@ -360,6 +368,14 @@ def _compute_hashes_and_return_match(source_resource, destination_resource):
     cloud_resource = source_resource
     local_resource = destination_resource
 
+  local_path = local_resource.storage_url.resource_name
+  cloud_url = cloud_resource.storage_url.versionless_url_string
+  file_index = rsync_file_index.get_index()
+  if file_index and file_index.is_synced(
+      local_path, cloud_url, cloud_resource.etag
+  ):
+    return True
+
   if cloud_resource.crc32c_hash is not None and cloud_resource.md5_hash is None:
     # We must do a CRC32C check.
     # Let existing download flow warn that ALWAYS check may be slow.
@@ -388,12 +404,17 @@ def _compute_hashes_and_return_match(source_resource, destination_resource):
     hash_algorithm = hash_util.HashAlgorithm.MD5
     cloud_hash = cloud_resource.md5_hash
 
-  local_hash = hash_util.get_base64_hash_digest_string(
-      hash_util.get_hash_from_file(
-          local_resource.storage_url.resource_name, hash_algorithm
-      )
-  )
-  return cloud_hash == local_hash
+  if file_index:
+    local_hash = file_index.get_hash(
+        local_path, hash_algorithm, _compute_local_hash
+    )
+  else:
+    local_hash = _compute_local_hash(local_path, hash_algorithm)
+  if cloud_hash != local_hash:
+    return False
+  if file_index:
+    file_index.record_sync(local_path, cloud_url, cloud_resource.etag)
+  return True
 
 
 def _compare_metadata_and_return_copy_needed(
@@ -980,7 +1001,21 @@ def _get_task_and_iteration_instruction(
   )
 
 
-def get_operation_iterator(
+def get_operation_iterator(*args, **kwargs):
+  """Returns tasks with the rsync operations (patch, delete, copy, etc).
+
+  Takes the arguments of _get_operation_iterator. Consecutive object patches
+  and deletions are batched if the storage/object_request_batch_size property
+  is greater than 1.
+  """
+  return delete_task.get_batched_delete_tasks(
+      patch_object_task.get_batched_patch_tasks(
+          _get_operation_iterator(*args, **kwargs)
+      )
+  )
+
+
+def _get_operation_iterator(
     user_request_args,
     source_list_file,
     source_container,
@@ -1049,6 +1084,7 @@ def get_operation_iterator(
             is_managed_folder=yield_managed_folder_operations,
         )
 
+  rsync_file_index.flush_index()
   if task_status_queue and (operation_count or bytes_operated_on):
     progress_callbacks.workload_estimator_callback(
         task_status_queue, item_count=operation_count, size=bytes_operated_on
@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Persistent index of local file hashes for the rsync command.
+
+When rsync cannot compare modification times (--checksums-only, or a side
+without mtime metadata), it hashes every local file that has a cloud
+counterpart of the same size. With the storage/use_rsync_file_index property
+set, the hashes are stored in an SQLite database keyed on the file path and
+validated against the file's inode, size, mtime_ns and ctime_ns, so files that
+did not change since the last run are not read again. ctime_ns catches writes
+that restore the previous modification time, e.g. with `touch -d`. The index
+also records the etag of the cloud object a file last matched, so a pair that
+is unchanged on both sides is skipped without comparing hashes.
+
+Entries whose stat information does not match the file are ignored and
+overwritten. Files modified within _RACY_WINDOW_NS of being indexed are not
+cached, because a write within the same mtime tick would go unnoticed.
+
+Stale entries of deleted or modified files can be removed with:
+
+  python -m googlecloudsdk.command_lib.storage.rsync_file_index compact
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+from googlecloudsdk.core import log
+from googlecloudsdk.core import properties
+
+_INDEX_FILE_NAME = 'file_index.db'
+# Entries are committed in batches, losing the last batch to a crash only
+# costs rehashing those files.
+_COMMIT_INTERVAL = 1000
+_RACY_WINDOW_NS = 2 * 10**9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+  path TEXT PRIMARY KEY,
+  inode INTEGER NOT NULL,
+  size INTEGER NOT NULL,
+  mtime_ns INTEGER NOT NULL,
+  ctime_ns INTEGER NOT NULL,
+  crc32c TEXT,
+  md5 TEXT,
+  remote_url TEXT,
+  remote_etag TEXT
+)
+"""
+
+_lock = threading.Lock()
+_index = None
+_index_failed = False
+
+
+def _get_stat_key(path):
+  """Returns (inode, size, mtime_ns, ctime_ns) of path, None if unreadable."""
+  try:
+    stat = os.stat(path)
+  except OSError:
+    return None
+  return stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns
+
+
+def _is_racy(stat_key):
+  """Returns True if the file may still change within its mtime tick."""
+  return time.time_ns() - max(stat_key[2:]) < _RACY_WINDOW_NS
+
+
+class FileIndex(object):
+  """SQLite backed map of local file states to their hashes.
+
+  Methods are thread safe. Writes are committed every _COMMIT_INTERVAL changes
+  and on flush().
+  """
+
+  def __init__(self, index_path):
+    self.index_path = index_path
+    self._connection = sqlite3.connect(
+        index_path, timeout=60, check_same_thread=False
+    )
+    self._connection.execute('PRAGMA journal_mode=WAL')
+    self._connection.execute('PRAGMA synchronous=NORMAL')
+    self._connection.execute(_SCHEMA)
+    self._connection.commit()
+    self._lock = threading.Lock()
+    self._pending_writes = 0
+
+  def _get_row(self, path, stat_key):
+    """Returns the columns of the valid entry for path or None."""
+    row = self._connection.execute(
+        'SELECT inode, size, mtime_ns, ctime_ns, crc32c, md5, remote_url,'
+        ' remote_etag FROM files WHERE path = ?',
+        (path,),
+    ).fetchone()
+    if row is None or tuple(row[:4]) != stat_key:
+      return None
+    return row
+
+  def _write(self, statement, parameters):
+    self._connection.execute(statement, parameters)
+    self._pending_writes += 1
+    if self._pending_writes >= _COMMIT_INTERVAL:
+      self._connection.commit()
+      self._pending_writes = 0
+
+  def get_hash(self, path, hash_algorithm, compute_hash):
+    """Returns the base64 hash of the file at path, from the index if valid.
+
+    Args:
+      path (str): Local file path.
+      hash_algorithm (hash_util.HashAlgorithm): The hash to return.
+      compute_hash (func(path, hash_algorithm)): Returns the base64 hash of the
+        file, called if the index has no valid entry.
+
+    Returns:
+      str: The base64 encoded hash.
+    """
+    column = hash_algorithm.value
+    stat_key = _get_stat_key(path)
+    if stat_key is not None:
+      with self._lock:
+        row = self._get_row(path, stat_key)
+      cached_hash = row and row[4 if column == 'crc32c' else 5]
+      if cached_hash:
+        return cached_hash
+
+    file_hash = compute_hash(path, hash_algorithm)
+    # Only cache the hash if the file did not change while it was read.
+    if (
+        stat_key is None
+        or _get_stat_key(path) != stat_key
+        or _is_racy(stat_key)
+    ):
+      return file_hash
+
+    with self._lock:
+      if self._get_row(path, stat_key) is None:
+        self._write(
+            'INSERT OR REPLACE INTO files (path, inode, size, mtime_ns,'
+            ' ctime_ns, {}) VALUES (?, ?, ?, ?, ?, ?)'.format(column),
+            (path,) + stat_key + (file_hash,),
+        )
+      else:
+        self._write(
+            'UPDATE files SET {} = ? WHERE path = ?'.format(column),
+            (file_hash, path),
+        )
+    return file_hash
+
+  def is_synced(self, path, remote_url, remote_etag):
+    """Returns True if path last matched the same version of remote_url."""
+    if not remote_etag:
+      return False
+    stat_key = _get_stat_key(path)
+    if stat_key is None:
+      return False
+    with self._lock:
+      row = self._get_row(path, stat_key)
+    return row is not None and tuple(row[6:]) == (remote_url, remote_etag)
+
+  def record_sync(self, path, remote_url, remote_etag):
+    """Records that path matches the given version of remote_url.
+
+    Only files that already have a valid entry are recorded, since the entry
+    is what ties the match to the file's state.
+
+    Args:
+      path (str): Local file path.
+      remote_url (str): The URL of the matching cloud object.
+      remote_etag (str|None): The etag of the matching cloud object.
+    """
+    if not remote_etag:
+      return
+    stat_key = _get_stat_key(path)
+    if stat_key is None:
+      return
+    with self._lock:
+      if self._get_row(path, stat_key) is not None:
+        self._write(
+            'UPDATE files SET remote_url = ?, remote_etag = ? WHERE path = ?',
+            (remote_url, remote_etag, path),
+        )
+
+  def flush(self):
+    """Commits pending writes."""
+    with self._lock:
+      self._connection.commit()
+      self._pending_writes = 0
+
+  def compact(self):
+    """Removes entries of missing or modified files and shrinks the index.
+
+    Returns:
+      int: The number of removed entries.
+    """
+    with self._lock:
+      stale_paths = []
+      for row in self._connection.execute(
+          'SELECT path, inode, size, mtime_ns, ctime_ns FROM files'
+      ):
+        path = row[0]
+        if _get_stat_key(path) != tuple(row[1:]):
+          stale_paths.append((path,))
+      self._connection.executemany(
+          'DELETE FROM files WHERE path = ?', stale_paths
+      )
+      self._connection.commit()
+      self._pending_writes = 0
+      self._connection.execute('VACUUM')
+    return len(stale_paths)
+
+  def close(self):
+    self.flush()
+    self._connection.close()
+
+
+def get_index_path():
+  """Returns the path of the index database."""
+  return os.path.join(
+      properties.VALUES.storage.rsync_files_directory.Get(), _INDEX_FILE_NAME
+  )
+
+
+def _open_index():
+  index_path = get_index_path()
+  index_directory = os.path.dirname(index_path)
+  if not os.path.isdir(index_directory):
+    os.makedirs(index_directory)
+  return FileIndex(index_path)
+
+
+def get_index():
+  """Returns the shared FileIndex or None if the index is not enabled."""
+  global _index, _index_failed
+  if not properties.VALUES.storage.use_rsync_file_index.GetBool():
+    return None
+  with _lock:
+    if _index is None and not _index_failed:
+      try:
+        _index = _open_index()
+      except (OSError, sqlite3.Error) as e:
+        log.warning(
+            'Could not open rsync file index, hashing files: {}'.format(e)
+        )
+        _index_failed = True
+    return _index
+
+
+def flush_index():
+  """Commits pending writes of the shared FileIndex, if it is open."""
+  with _lock:
+    index = _index
+  if index:
+    index.flush()
+
+
+def compact():
+  """Compacts the index and returns the number of removed entries."""
+  index = _open_index()
+  try:
+    return index.compact()
+  finally:
+    index.close()
+
+
+def main(argv=None):
+  argv = sys.argv[1:] if argv is None else argv
+  if argv != ['compact']:
+    sys.stderr.write('usage: {} compact\n'.format(__name__))
+    return 2
+  removed = compact()
+  sys.stdout.write('Removed {} stale entries from {}.\n'.format(
+      removed, get_index_path()))
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Binary sorted runs used to build rsync list files.
+
+rsync lists a container in chunks, sorts each chunk into a run file and merges
+the runs into the final CSV list file. A run is a sequence of records:
+
+  line_length (uint32, little endian)
+  key_length (uint32, little endian)
+  line (line_length bytes of UTF-8)
+
+The sort key of a record is the first key_length bytes of its line: the whole
+line, or only the URL with URL based sorting. UTF-8 bytes compare in the same
+order as the code points of the decoded strings, so records are sorted and
+merged on their raw bytes without decoding or splitting the CSV line again.
+Runs are read through mmap, so merging many runs does not copy them into
+per-file read buffers.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import heapq
+import mmap
+import struct
+
+from googlecloudsdk.command_lib.storage import rsync_command_util
+from googlecloudsdk.core.util import files
+
+_HEADER = struct.Struct('<II')
+_NEWLINE = b'\n'
+
+
+def write_sorted_run(path, lines, url_based_sorting):
+  """Sorts CSV lines and writes them to path as a binary run.
+
+  Runs in chunk sorting worker processes, so it only takes picklable
+  arguments.
+
+  Args:
+    path (str): The run file to write.
+    lines (list[str]): Unsorted CSV lines.
+    url_based_sorting (bool): Sort on the URL of the lines instead of the
+      whole lines.
+
+  Returns:
+    str: path.
+  """
+  records = []
+  for line in lines:
+    encoded_line = line.encode('utf-8')
+    if url_based_sorting:
+      # The URL is a prefix of the line, see get_fields_from_csv_line.
+      url = rsync_command_util.get_fields_from_csv_line(line)[0]
+      key = url.encode('utf-8')
+    else:
+      key = encoded_line
+    records.append((key, encoded_line))
+  # Python's sort is stable, so lines with equal URLs keep listing order.
+  records.sort(key=lambda record: record[0])
+
+  with files.BinaryFileWriter(path, create_path=True) as file_writer:
+    for key, line in records:
+      file_writer.write(_HEADER.pack(len(line), len(key)))
+      file_writer.write(line)
+  return path
+
+
+class SortedRunReader(object):
+  """Reads the records of a run file through mmap.
+
+  Iterating yields (key, line) tuples of bytes.
+  """
+
+  def __init__(self, path):
+    self.path = path
+    self._map = None
+    with files.BinaryFileReader(path) as file_reader:
+      # Empty files can't be mapped.
+      if file_reader.seek(0, 2):
+        self._map = mmap.mmap(
+            file_reader.fileno(), 0, access=mmap.ACCESS_READ
+        )
+
+  def __iter__(self):
+    if self._map is None:
+      return
+    buffer = self._map
+    size = len(buffer)
+    offset = 0
+    header_size = _HEADER.size
+    unpack_from = _HEADER.unpack_from
+    while offset < size:
+      line_length, key_length = unpack_from(buffer, offset)
+      offset += header_size
+      line = buffer[offset:offset + line_length]
+      offset += line_length
+      yield (line if key_length == line_length else line[:key_length]), line
+
+  def close(self):
+    if self._map is not None:
+      self._map.close()
+      self._map = None
+
+
+def merge_sorted_runs(readers, output_path):
+  """Merges sorted runs into a CSV list file.
+
+  Args:
+    readers (list[SortedRunReader]): The runs to merge.
+    output_path (str): Where to write the merged newline separated lines.
+  """
+  with files.BinaryFileWriter(output_path, create_path=True) as file_writer:
+    # Records compare on their key first. Ties between runs fall back to the
+    # lines, which keeps the output deterministic.
+    for _, line in heapq.merge(*readers):
+      file_writer.write(line)
+      file_writer.write(_NEWLINE)
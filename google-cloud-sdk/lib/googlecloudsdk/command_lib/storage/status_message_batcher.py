@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Batches status messages that worker processes send to the main process.
+
+Every message put on the task status queue is pickled by the worker, written
+to a pipe, and unpickled by the status message handler thread of the main
+process. Copies of many small files send several messages per file, so this
+per-message work limits how fast the main process keeps up.
+
+BatchingStatusQueue collects messages for
+storage/status_message_batch_interval_ms and sends them as one
+thread_messages.StatusMessageBatch. Progress updates for the same file or
+component within a batch are combined, since each carries the total number of
+bytes processed so far. The first update of each file in a batch is kept, so
+the status tracker sees when operations start, and updates reporting errors
+are never combined.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import contextlib
+import threading
+
+from googlecloudsdk.command_lib.storage import thread_messages
+from googlecloudsdk.core import properties
+
+# Batches are sent early when they reach this size, to bound worker memory and
+# the latency of the status display.
+_MAX_BATCH_SIZE = 1000
+
+
+def _get_progress_key(status_message):
+  return (
+      status_message.source_url.url_string,
+      status_message.component_number or 0,
+  )
+
+
+class BatchingStatusQueue(object):
+  """Wraps a task status queue, sending messages to it in batches.
+
+  Supports the put method that tasks use. Methods are thread safe.
+  """
+
+  def __init__(self, task_status_queue, interval_seconds):
+    """Initializes BatchingStatusQueue.
+
+    Args:
+      task_status_queue (multiprocessing.Queue): Receives batches.
+      interval_seconds (float): The longest time a message waits for its batch
+        to be sent.
+    """
+    self._task_status_queue = task_status_queue
+    self._interval_seconds = interval_seconds
+    self._lock = threading.Lock()
+    self._closed = threading.Event()
+    self._flush_thread = None
+
+    self._messages = []
+    self._sent_message_count = 0
+    # Keys of files with a progress update in the batch.
+    self._started_progress_keys = set()
+    # Maps keys to indices of progress updates later updates can replace.
+    self._replaceable_progress_indices = {}
+
+  def _add_progress_message(self, status_message):
+    key = _get_progress_key(status_message)
+    if status_message.error_occurred:
+      self._replaceable_progress_indices.pop(key, None)
+      self._messages.append(status_message)
+    elif key not in self._started_progress_keys:
+      self._started_progress_keys.add(key)
+      self._messages.append(status_message)
+    elif key in self._replaceable_progress_indices:
+      self._messages[self._replaceable_progress_indices[key]] = status_message
+    else:
+      self._replaceable_progress_indices[key] = len(self._messages)
+      self._messages.append(status_message)
+
+  def _flush_locked(self):
+    if not self._messages:
+      return
+    if len(self._messages) == 1 and self._sent_message_count == 1:
+      self._task_status_queue.put(self._messages[0])
+    else:
+      self._task_status_queue.put(
+          thread_messages.StatusMessageBatch(
+              self._messages, self._sent_message_count
+          )
+      )
+    self._messages = []
+    self._sent_message_count = 0
+    self._started_progress_keys = set()
+    self._replaceable_progress_indices = {}
+
+  def _flush_periodically(self):
+    while not self._closed.wait(self._interval_seconds):
+      self.flush()
+
+  def put(self, status_message):
+    """Adds a message to the batch, sending the batch if it is full."""
+    with self._lock:
+      if self._flush_thread is None:
+        self._flush_thread = threading.Thread(target=self._flush_periodically)
+        self._flush_thread.daemon = True
+        self._flush_thread.start()
+
+      self._sent_message_count += 1
+      if isinstance(status_message, thread_messages.DetailedProgressMessage):
+        self._add_progress_message(status_message)
+      else:
+        self._messages.append(status_message)
+      if len(self._messages) >= _MAX_BATCH_SIZE:
+        self._flush_locked()
+
+  def flush(self):
+    """Sends collected messages."""
+    with self._lock:
+      self._flush_locked()
+
+  def close(self):
+    """Sends collected messages and stops the flushing thread."""
+    self._closed.set()
+    if self._flush_thread:
+      self._flush_thread.join()
+    self.flush()
+
+
+def get_batching_status_queue(task_status_queue):
+  """Returns task_status_queue wrapped in a BatchingStatusQueue if enabled.
+
+  Args:
+    task_status_queue (multiprocessing.Queue|None): A worker process's queue.
+
+  Returns:
+    BatchingStatusQueue, or task_status_queue if it is None or batching is
+    disabled.
+  """
+  interval_ms = (
+      properties.VALUES.storage.status_message_batch_interval_ms.GetInt()
+  )
+  if task_status_queue is None or not interval_ms or interval_ms <= 0:
+    return task_status_queue
+  return BatchingStatusQueue(task_status_queue, interval_ms / 1000)
+
+
+@contextlib.contextmanager
+def batching_status_queue(task_status_queue):
+  """Yields get_batching_status_queue(), sending its messages on exit.
+
+  Messages are sent even if the worker fails, so that statuses and manifest
+  rows of completed tasks are not lost.
+
+  Args:
+    task_status_queue (multiprocessing.Queue|None): A worker process's queue.
+
+  Yields:
+    BatchingStatusQueue|multiprocessing.Queue|None: See
+      get_batching_status_queue.
+  """
+  status_queue = get_batching_status_queue(task_status_queue)
+  try:
+    yield status_queue
+  finally:
+    if isinstance(status_queue, BatchingStatusQueue):
+      status_queue.close()
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Utilities for tasks that send several object API calls in batch requests.
+
+Deleting or patching millions of objects one call at a time is bound by
+request latency. With storage/object_request_batch_size set above 1, task
+iterators combine consecutive per-object tasks into one task that sends their
+calls through CloudApi.delete_objects or CloudApi.patch_objects_metadata.
+APIs with the BATCH_REQUESTS capability send those as multipart batch
+requests.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+from googlecloudsdk.api_lib.storage import api_factory
+from googlecloudsdk.api_lib.storage import cloud_api
+from googlecloudsdk.core import log
+from googlecloudsdk.core import properties
+
+
+def get_batch_size():
+  """Returns the number of object calls to run in one task, 1 if disabled."""
+  return max(
+      1, properties.VALUES.storage.object_request_batch_size.GetInt() or 1
+  )
+
+
+def supports_batch_requests(scheme):
+  """Returns True if calls to the provider of scheme can be batched."""
+  return (
+      cloud_api.Capability.BATCH_REQUESTS
+      in api_factory.get_capabilities(scheme)
+  )
+
+
+def get_batched_tasks(task_iterator, get_batch_key, create_batch_task):
+  """Combines consecutive tasks with equal batch keys.
+
+  Args:
+    task_iterator (Iterable[task.Task]): Tasks to run.
+    get_batch_key (Callable[[task.Task], object|None]): Returns a key shared by
+      tasks that can run together, or None for tasks that must run alone.
+    create_batch_task (Callable[[list[task.Task]], task.Task]): Returns a task
+      doing the work of several tasks with the same key.
+
+  Yields:
+    Tasks from task_iterator, with up to get_batch_size() consecutive tasks
+    with the same key replaced by one task from create_batch_task. Like the
+    task graph does for tasks it runs, a task is skipped if its
+    parallel_processing_key is already used by a task in the same batch.
+  """
+  batch_size = get_batch_size()
+  if batch_size == 1:
+    for task in task_iterator:
+      yield task
+    return
+
+  pending_tasks = []
+  pending_key = None
+  pending_parallel_processing_keys = set()
+
+  def _flush():
+    if len(pending_tasks) == 1:
+      return pending_tasks[0]
+    return create_batch_task(list(pending_tasks))
+
+  for task in task_iterator:
+    key = get_batch_key(task)
+    if (
+        pending_tasks
+        and key is not None
+        and key == pending_key
+        and task.parallel_processing_key in pending_parallel_processing_keys
+    ):
+      log.status.Print(
+          'Skipping {} for {}. This can occur if a command results in'
+          ' multiple operations on the same resource.'.format(
+              task.__class__.__name__, task.parallel_processing_key
+          )
+      )
+      continue
+    if pending_tasks and (
+        key is None or key != pending_key or len(pending_tasks) >= batch_size
+    ):
+      yield _flush()
+      pending_tasks = []
+      pending_parallel_processing_keys = set()
+    if key is None:
+      yield task
+    else:
+      pending_tasks.append(task)
+      pending_key = key
+      if task.parallel_processing_key is not None:
+        pending_parallel_processing_keys.add(task.parallel_processing_key)
+  if pending_tasks:
+    yield _flush()
+
+
+def raise_last_error_and_log_others(call_errors):
+  """Reports errors returned for the calls of a batch task.
+
+  Every error but the last is logged, and the last is raised, so that each
+  failed call is reported once after the task executor logs the raised error.
+
+  Args:
+    call_errors (list[Exception|None]): The error of each call, or None for
+      calls that succeeded.
+
+  Raises:
+    Exception: The last error in call_errors, if any.
+  """
+  failures = [error for error in call_errors if error is not None]
+  for error in failures[:-1]:
+    log.error(error)
+  if failures:
+    raise failures[-1]
@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Adjusts the number of tasks task_graph_executor runs at once.
+
+optimize_parameters_util picks process and thread counts before a command
+starts. The controller in this module treats those counts as an upper bound and
+changes how many tasks may run at once while the command runs, based on the
+throughput and errors it measures from task status messages and task outputs.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import collections
+import json
+import threading
+import time
+
+from googlecloudsdk.command_lib.storage import thread_messages
+from googlecloudsdk.command_lib.storage.tasks import task
+from googlecloudsdk.core import log
+from googlecloudsdk.core import properties
+from googlecloudsdk.core.util import files
+
+
+# Throughput changes smaller than this fraction are treated as noise.
+_THROUGHPUT_TOLERANCE = 0.05
+
+# Slots are multiplied by this after an interval with errors.
+_DECREASE_FACTOR = 0.5
+
+
+class Action:
+  INCREASE = 'increase'
+  DECREASE = 'decrease'
+  HOLD = 'hold'
+
+
+Decision = collections.namedtuple(
+    'Decision',
+    [
+        'time',
+        'action',
+        'reason',
+        'previous_slots',
+        'slots',
+        'bytes_per_second',
+        'tasks_per_second',
+        'error_count',
+    ],
+)
+
+
+class AdaptiveConcurrencyController:
+  """Limits running tasks to a number of slots adjusted from measurements.
+
+  The executor calls acquire_slot before it sends a task to the worker
+  processes and release_slot when the task's output is received. Every
+  interval, the slot count changes:
+
+  - After an interval with errors, slots are halved.
+  - Until throughput first stops improving, slots are doubled ("slow start").
+  - After that, slots grow by increase_step while throughput improves. If an
+    increase made throughput drop, it is undone, and if it made no difference,
+    slots are held for one interval before probing again.
+
+  Throughput is measured in bytes per second if any task reported byte
+  progress, and in completed tasks per second otherwise.
+
+  Attributes:
+    decisions (list[Decision]): Every adjustment made, in order.
+  """
+
+  def __init__(
+      self,
+      min_slots,
+      max_slots,
+      initial_slots,
+      increase_step,
+      interval_seconds,
+      log_file_path=None,
+  ):
+    """Initializes an AdaptiveConcurrencyController instance.
+
+    Args:
+      min_slots (int): The lowest number of tasks allowed to run at once.
+      max_slots (int): The highest number of tasks allowed to run at once.
+      initial_slots (int): The number of tasks allowed to run at once before
+        the first adjustment.
+      increase_step (int): The number of slots added by an additive increase.
+      interval_seconds (float): Time to measure between adjustments.
+      log_file_path (str|None): If set, decisions are appended to this file as
+        lines of JSON.
+    """
+    self._min_slots = min_slots
+    self._max_slots = max_slots
+    self._slots = max(min_slots, min(initial_slots, max_slots))
+    self._increase_step = increase_step
+    self._interval_seconds = interval_seconds
+    self._log_file_path = log_file_path
+
+    self._condition = threading.Condition()
+    self._running_tasks = 0
+    self._shutting_down = False
+
+    self._in_slow_start = True
+    self._measures_bytes = False
+    self._previous_throughput = None
+    self._previous_action = None
+    self._slots_before_increase = self._slots
+
+    self._interval_start_time = None
+    self._interval_bytes = 0
+    self._interval_tasks = 0
+    self._interval_errors = 0
+    # Maps (URL string, component number) to bytes reported so far.
+    self._component_progress = {}
+
+    self.decisions = []
+
+  @property
+  def slots(self):
+    return self._slots
+
+  def acquire_slot(self):
+    """Blocks until a task may start.
+
+    Returns:
+      False if the controller was shut down while waiting, True otherwise.
+    """
+    with self._condition:
+      while self._running_tasks >= self._slots and not self._shutting_down:
+        self._condition.wait()
+      if self._shutting_down:
+        return False
+      self._running_tasks += 1
+      return True
+
+  def release_slot(self, task_output):
+    """Frees the slot of a completed task and records its result.
+
+    Args:
+      task_output (task.Output|None): The output of the completed task.
+    """
+    with self._condition:
+      self._running_tasks -= 1
+      self._interval_tasks += 1
+      self._condition.notify_all()
+    self.add_task_output(task_output)
+
+  def add_task_output(self, task_output):
+    """Counts errors reported by a task's messages.
+
+    Args:
+      task_output (task.Output|None): The output of a task.
+    """
+    if not (task_output and task_output.messages):
+      self._maybe_adjust()
+      return
+    error_count = sum(
+        1
+        for message in task_output.messages
+        if message.topic
+        in (task.Topic.CHANGE_EXIT_CODE, task.Topic.FATAL_ERROR)
+    )
+    with self._condition:
+      self._interval_errors += error_count
+    self._maybe_adjust()
+
+  def add_status_message(self, status_message):
+    """Records bytes and errors reported on the task status queue.
+
+    Args:
+      status_message (thread_messages.*): A message sent by a task.
+    """
+    if not isinstance(status_message, thread_messages.DetailedProgressMessage):
+      return
+    key = (
+        status_message.source_url.url_string,
+        status_message.component_number or 0,
+    )
+    processed_bytes = status_message.current_byte - status_message.offset
+    with self._condition:
+      # current_byte includes bytes from earlier messages.
+      new_bytes = processed_bytes - self._component_progress.get(key, 0)
+      if processed_bytes == status_message.length:
+        self._component_progress.pop(key, None)
+      else:
+        self._component_progress[key] = processed_bytes
+      if new_bytes > 0:
+        self._measures_bytes = True
+        self._interval_bytes += new_bytes
+      if status_message.error_occurred:
+        self._interval_errors += 1
+    self._maybe_adjust()
+
+  def shutdown(self):
+    """Wakes up threads waiting for slots, which will not get one."""
+    with self._condition:
+      self._shutting_down = True
+      self._condition.notify_all()
+
+  def _decide(self, throughput, error_count):
+    """Returns the action and reason for the interval that just ended."""
+    if error_count:
+      self._in_slow_start = False
+      return Action.DECREASE, 'errors'
+    if self._previous_throughput is None:
+      return Action.INCREASE, 'no_baseline'
+
+    improved = throughput > self._previous_throughput * (
+        1 + _THROUGHPUT_TOLERANCE)
+    dropped = throughput < self._previous_throughput * (
+        1 - _THROUGHPUT_TOLERANCE)
+    if self._previous_action != Action.INCREASE:
+      return Action.INCREASE, 'probe'
+    if improved:
+      return Action.INCREASE, 'throughput_improved'
+    self._in_slow_start = False
+    if dropped:
+      return Action.DECREASE, 'throughput_dropped'
+    return Action.HOLD, 'throughput_unchanged'
+
+  def _get_new_slot_count(self, action, reason):
+    """Returns the slot count after taking action."""
+    if action == Action.INCREASE:
+      if self._in_slow_start:
+        new_slots = self._slots * 2
+      else:
+        new_slots = self._slots + self._increase_step
+    elif action == Action.DECREASE:
+      if reason == 'errors':
+        new_slots = int(self._slots * _DECREASE_FACTOR)
+      else:
+        # Undo the increase that made throughput drop.
+        new_slots = self._slots_before_increase
+    else:
+      new_slots = self._slots
+    return max(self._min_slots, min(new_slots, self._max_slots))
+
+  def _maybe_adjust(self):
+    """Adjusts the slot count if the current interval is over."""
+    now = time.time()
+    with self._condition:
+      if self._interval_start_time is None:
+        self._interval_start_time = now
+        return
+      elapsed = now - self._interval_start_time
+      if elapsed < self._interval_seconds:
+        return
+
+      bytes_per_second = self._interval_bytes / elapsed
+      tasks_per_second = self._interval_tasks / elapsed
+      throughput = (
+          bytes_per_second if self._measures_bytes else tasks_per_second)
+      error_count = self._interval_errors
+
+      action, reason = self._decide(throughput, error_count)
+      previous_slots = self._slots
+      if action == Action.INCREASE:
+        self._slots_before_increase = previous_slots
+      self._slots = self._get_new_slot_count(action, reason)
+      self._condition.notify_all()
+
+      self._previous_action = action
+      # After a decrease for errors, the interval's throughput is not a useful
+      # baseline for the next one.
+      self._previous_throughput = None if error_count else throughput
+      self._interval_start_time = now
+      self._interval_bytes = self._interval_tasks = self._interval_errors = 0
+
+      decision = Decision(
+          time=now,
+          action=action,
+          reason=reason,
+          previous_slots=previous_slots,
+          slots=self._slots,
+          bytes_per_second=bytes_per_second,
+          tasks_per_second=tasks_per_second,
+          error_count=error_count,
+      )
+      self.decisions.append(decision)
+    self._log_decision(decision)
+
+  def _log_decision(self, decision):
+    log.debug(
+        'Adaptive concurrency: {} from {} to {} slots ({}). {:.1f} B/s, {:.1f}'
+        ' tasks/s, {} errors.'.format(
+            decision.action,
+            decision.previous_slots,
+            decision.slots,
+            decision.reason,
+            decision.bytes_per_second,
+            decision.tasks_per_second,
+            decision.error_count,
+        )
+    )
+    if not self._log_file_path:
+      return
+    try:
+      with files.FileWriter(self._log_file_path, append=True) as log_file:
+        log_file.write(json.dumps(decision._asdict()) + '\n')
+    except files.Error as e:
+      log.debug('Could not write adaptive concurrency log: %s', e)
+      self._log_file_path = None
+
+
+def get_controller(max_process_count, thread_count):
+  """Returns a controller if enabled by properties.
+
+  Args:
+    max_process_count (int): The most processes the executor may start.
+    thread_count (int): The number of threads per process.
+
+  Returns:
+    AdaptiveConcurrencyController|None: None if adaptive concurrency is
+      disabled.
+  """
+  if not properties.VALUES.storage.use_adaptive_concurrency.GetBool():
+    return None
+  return AdaptiveConcurrencyController(
+      min_slots=1,
+      max_slots=max_process_count * thread_count,
+      initial_slots=thread_count,
+      increase_step=thread_count,
+      interval_seconds=(
+          properties.VALUES.storage.adaptive_concurrency_interval.GetInt()
+      ),
+      log_file_path=(
+          properties.VALUES.storage.adaptive_concurrency_log_file.Get()
+      ),
+  )
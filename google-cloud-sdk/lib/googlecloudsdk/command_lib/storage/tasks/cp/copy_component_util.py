@@ -18,6 +18,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+import copy
 import hashlib
 import math
 import os
@@ -133,6 +134,40 @@ def get_temporary_component_resource(source_resource, destination_resource,
   return resource_reference.UnknownResource(component_url)
 
 
+def get_user_request_args_for_components(user_request_args):
+  """Returns the user args to use for temporary components.
+
+  Custom contexts and metadata are set on the final composite object instead of
+  on each component.
+
+  Args:
+    user_request_args (UserRequestArgs|None): Values from user flags.
+
+  Returns:
+    A copy of user_request_args without custom contexts and metadata, or
+    user_request_args if it has no resource args.
+  """
+  if not user_request_args or not user_request_args.resource_args:
+    return user_request_args
+
+  user_args = copy.deepcopy(user_request_args)
+  resource_args = user_args.resource_args
+
+  # We do not want context to be uploaded for each chunk. Instead we will
+  # set the context once the composite object is finalized.
+  setattr(resource_args, 'custom_contexts_to_set', None)
+  setattr(resource_args, 'custom_contexts_to_remove', None)
+  setattr(resource_args, 'custom_contexts_to_update', None)
+
+  # We also do not want metadata to be uploaded for each chunk.
+  # See b/377305136 for more details.
+  setattr(resource_args, 'custom_fields_to_set', None)
+  setattr(resource_args, 'custom_fields_to_remove', None)
+  setattr(resource_args, 'custom_fields_to_update', None)
+
+  return user_args
+
+
 def get_component_count(file_size, target_component_size, max_components):
   """Returns the # components a file would be split into for a composite upload.
 
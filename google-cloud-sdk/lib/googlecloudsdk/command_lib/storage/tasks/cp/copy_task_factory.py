@@ -19,6 +19,7 @@ from __future__ import division
 from __future__ import unicode_literals
 
 from googlecloudsdk.command_lib.storage import errors
+from googlecloudsdk.command_lib.storage import gzip_util
 from googlecloudsdk.command_lib.storage import posix_util
 from googlecloudsdk.command_lib.storage import storage_url
 from googlecloudsdk.command_lib.storage.resources import resource_reference
@@ -31,6 +32,7 @@ from googlecloudsdk.command_lib.storage.tasks.cp import intra_cloud_copy_task
 from googlecloudsdk.command_lib.storage.tasks.cp import parallel_composite_upload_util
 from googlecloudsdk.command_lib.storage.tasks.cp import streaming_download_task
 from googlecloudsdk.command_lib.storage.tasks.cp import streaming_upload_task
+from googlecloudsdk.core import properties
 
 
 def get_copy_task(
@@ -122,7 +124,15 @@ def get_copy_task(
 
   if (isinstance(source_url, storage_url.FileUrl)
       and isinstance(destination_url, storage_url.CloudUrl)):
-    if source_url.is_stream:
+    should_stream_gzip_upload = (
+        not delete_source
+        and properties.VALUES.storage.stream_gzip_local_uploads.GetBool()
+        and gzip_util.should_gzip_locally(
+            getattr(user_request_args, 'gzip_settings', None),
+            source_url.resource_name,
+        )
+    )
+    if source_url.is_stream or should_stream_gzip_upload:
       return streaming_upload_task.StreamingUploadTask(
           source_resource,
           destination_resource,
@@ -405,8 +405,9 @@ class CopyTaskIterator:
           ' custom MD5 digest is allowed.'
       )
 
-    self._already_completed_sources = manifest_util.parse_for_completed_sources(
-        getattr(user_request_args, 'manifest_path', None))
+    self._manifest_path = getattr(user_request_args, 'manifest_path', None)
+    # Set while iterating, see __iter__.
+    self._already_completed_sources = None
 
   def _raise_error_if_source_matches_destination(self):
     if not self._multiple_sources and not self._source_name_iterator.is_empty():
@@ -491,6 +492,14 @@ class CopyTaskIterator:
       )
 
   def __iter__(self):
+    # The manifest index is closed when iteration ends or is abandoned.
+    with manifest_util.completed_sources(self._manifest_path) as sources:
+      self._already_completed_sources = sources
+      for copy_task in self._get_copy_tasks():
+        yield copy_task
+
+  def _get_copy_tasks(self):
+    """Yields copy tasks for the sources."""
     self._raise_error_if_source_matches_destination()
 
     is_source_plural = self._source_name_iterator.is_plural()
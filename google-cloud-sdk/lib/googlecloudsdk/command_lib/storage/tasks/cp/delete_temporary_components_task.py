@@ -18,9 +18,6 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
-import glob
-import os
-
 from googlecloudsdk.api_lib.storage import errors as api_errors
 from googlecloudsdk.command_lib.storage import errors as command_errors
 from googlecloudsdk.command_lib.storage import tracker_file_util
@@ -79,7 +76,9 @@ class DeleteTemporaryComponentsTask(task.Task):
         # after using the final destination to generate component tracker paths.
         component_number='')
     # Matches all paths, regardless of component number:
-    component_tracker_paths = glob.iglob(component_tracker_path_prefix + '*')
+    component_tracker_paths = (
+        tracker_file_util.get_tracker_file_paths_with_prefix(
+            component_tracker_path_prefix))
 
     component_urls = []
     found_permissions_error = permissions_error = None
@@ -106,7 +105,7 @@ class DeleteTemporaryComponentsTask(task.Task):
           # Save URL to delete with task later.
           component_urls.append(component_url)
 
-      os.remove(component_tracker_path)
+      tracker_file_util.delete_tracker_file(component_tracker_path)
 
     if permissions_error:
       log.error(
@@ -23,6 +23,7 @@ from __future__ import division
 from __future__ import unicode_literals
 
 from googlecloudsdk.command_lib.storage import errors
+from googlecloudsdk.command_lib.storage import hash_util
 from googlecloudsdk.command_lib.storage import manifest_util
 from googlecloudsdk.command_lib.storage import posix_util
 from googlecloudsdk.command_lib.storage import symlink_util
@@ -112,14 +113,12 @@ class FinalizeSlicedDownloadTask(copy_util.ObjectCopyTaskWithExitHandler):
         sorted_component_payloads = sorted(
             component_payloads, key=lambda d: d['component_number'])
 
-        downloaded_file_checksum = sorted_component_payloads[0][
-            'crc32c_checksum']
-        for i in range(1, len(sorted_component_payloads)):
-          payload = sorted_component_payloads[i]
-          downloaded_file_checksum = crc32c.concat_checksums(
-              downloaded_file_checksum,
-              payload['crc32c_checksum'],
-              b_byte_count=payload['length'])
+        # Components were hashed while they were downloaded, so the file is
+        # not read again.
+        downloaded_file_checksum = hash_util.combine_crc32c_checksums(
+            (payload['crc32c_checksum'], payload['length'])
+            for payload in sorted_component_payloads
+        )
 
         downloaded_file_hash_object = crc32c.get_crc32c_from_checksum(
             downloaded_file_checksum)
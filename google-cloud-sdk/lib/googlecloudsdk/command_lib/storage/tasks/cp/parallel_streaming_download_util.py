@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Streams an object in order while fetching ranges of it concurrently.
+
+Used by StreamingDownloadTask when storage/streaming_download_thread_count is
+greater than one. A single HTTP stream is limited by the throughput of one
+connection, so ranges ahead of the one being written are downloaded on other
+threads into a bounded buffer.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import collections
+from concurrent import futures
+import io
+
+from googlecloudsdk.api_lib.storage import api_factory
+from googlecloudsdk.api_lib.storage import cloud_api
+from googlecloudsdk.api_lib.storage import errors as api_errors
+from googlecloudsdk.api_lib.storage import retry_util
+from googlecloudsdk.calliope import exceptions as calliope_errors
+from googlecloudsdk.command_lib.storage import errors
+from googlecloudsdk.command_lib.storage import hash_util
+from googlecloudsdk.command_lib.util import crc32c
+from googlecloudsdk.core import exceptions as core_exceptions
+from googlecloudsdk.core import log
+from googlecloudsdk.core import properties
+from googlecloudsdk.core.util import scaled_integer
+
+_MIN_RANGE_SIZE = 1024 * 1024
+
+
+def get_read_ahead_thread_count():
+  """Returns the number of concurrent range requests, 1 if disabled."""
+  return max(
+      1, properties.VALUES.storage.streaming_download_thread_count.GetInt() or 1
+  )
+
+
+def _get_range_size(thread_count):
+  """Returns the size of each range so that the buffer holds two per thread."""
+  buffer_size = scaled_integer.ParseInteger(
+      properties.VALUES.storage.streaming_download_buffer_size.Get()
+  )
+  return max(_MIN_RANGE_SIZE, buffer_size // (thread_count * 2))
+
+
+def should_read_ahead(source_resource, start_byte, end_byte):
+  """Returns True if a streaming download should use concurrent ranges.
+
+  Args:
+    source_resource (resource_reference.ObjectResource): The object to stream.
+    start_byte (int): The first byte to stream.
+    end_byte (int|None): The last byte to stream, inclusive.
+  """
+  thread_count = get_read_ahead_thread_count()
+  if thread_count < 2 or not source_resource.size:
+    return False
+  content_encoding = getattr(source_resource, 'content_encoding', None)
+  if content_encoding and 'gzip' in content_encoding:
+    # The server may decompress gzip objects in flight, which makes byte
+    # ranges of the stored object meaningless.
+    return False
+  last_byte = source_resource.size - 1
+  if end_byte is not None:
+    last_byte = min(last_byte, end_byte)
+  return last_byte - start_byte + 1 > _get_range_size(thread_count)
+
+
+def _should_retry_range(exc_type, exc_value, exc_traceback, state):
+  """Returns True if a range download failed with a transient error."""
+  del exc_type, state  # Unused.
+  converted_error, _ = calliope_errors.ConvertKnownError(exc_value)
+  if not isinstance(
+      converted_error,
+      (core_exceptions.NetworkIssueError, api_errors.RetryableApiError),
+  ):
+    return False
+  log.debug(
+      'Retrying range download after exception: {}. Trace: {}'.format(
+          exc_value, exc_traceback
+      )
+  )
+  return True
+
+
+def _download_range(
+    source_resource, request_config, start_byte, end_byte, compute_checksum
+):
+  """Downloads an inclusive byte range of an object into memory.
+
+  A failed range is downloaded again from its start, so retries do not depend
+  on the position of a shared stream.
+
+  Args:
+    source_resource (resource_reference.ObjectResource): The object to read.
+    request_config (request_config_factory._RequestConfig): Decryption keys and
+      other request arguments.
+    start_byte (int): The first byte of the range.
+    end_byte (int): The last byte of the range.
+    compute_checksum (bool): Whether to calculate the range's CRC32C checksum.
+
+  Returns:
+    A (bytes, int|None) tuple of the range's data and its CRC32C checksum.
+
+  Raises:
+    errors.Error: The server returned a different number of bytes than
+      requested.
+  """
+
+  def _download():
+    stream = io.BytesIO()
+    api = api_factory.get_api(source_resource.storage_url.scheme)
+    api.download_object(
+        source_resource,
+        stream,
+        request_config,
+        download_strategy=cloud_api.DownloadStrategy.ONE_SHOT,
+        start_byte=start_byte,
+        end_byte=end_byte,
+    )
+    return stream.getvalue()
+
+  data = retry_util.retryer(
+      target=_download, should_retry_if=_should_retry_range
+  )
+  if len(data) != end_byte - start_byte + 1:
+    raise errors.Error(
+        'Expected {} bytes from range {}-{} of {} but received {}.'.format(
+            end_byte - start_byte + 1,
+            start_byte,
+            end_byte,
+            source_resource.storage_url,
+            len(data),
+        )
+    )
+  checksum = crc32c.get_checksum(crc32c.get_crc32c(data)) if (
+      compute_checksum) else None
+  return data, checksum
+
+
+def _should_validate_crc32c(source_resource, start_byte, last_byte):
+  """Returns True if the combined ranges should be checked against the object.
+
+  Only whole objects can be validated. Since bytes are written before the whole
+  object is read, a mismatch is reported after the data was written.
+  """
+  if not (
+      source_resource.crc32c_hash
+      and start_byte == 0
+      and last_byte == source_resource.size - 1
+  ):
+    return False
+  check_hashes = properties.CheckHashes(
+      properties.VALUES.storage.check_hashes.Get()
+  )
+  if check_hashes == properties.CheckHashes.NEVER:
+    return False
+  return (
+      crc32c.IS_FAST_GOOGLE_CRC32C_AVAILABLE
+      or check_hashes == properties.CheckHashes.ALWAYS
+  )
+
+
+def download_with_read_ahead(
+    source_resource,
+    download_stream,
+    request_config,
+    start_byte=0,
+    end_byte=None,
+    progress_callback=None,
+):
+  """Writes a byte range of an object to a stream, fetching ranges ahead.
+
+  Up to storage/streaming_download_thread_count ranges are downloaded at once,
+  and downloaded ranges wait in memory until every earlier range is written.
+  The ranges waiting or in flight hold at most about
+  storage/streaming_download_buffer_size bytes.
+
+  Args:
+    source_resource (resource_reference.ObjectResource): The object to stream.
+      Must have a size.
+    download_stream (stream): Where bytes are written, in order.
+    request_config (request_config_factory._RequestConfig): Decryption keys and
+      other request arguments.
+    start_byte (int): The first byte to write.
+    end_byte (int|None): The last byte to write, inclusive. Defaults to the end
+      of the object.
+    progress_callback (Callable[[int], None]|None): Called with the index of
+      the next byte to write after each range is written.
+
+  Raises:
+    errors.HashMismatchError: The whole object was written, and its CRC32C hash
+      does not match the hash reported by the server.
+  """
+  thread_count = get_read_ahead_thread_count()
+  range_size = _get_range_size(thread_count)
+  last_byte = source_resource.size - 1
+  if end_byte is not None:
+    last_byte = min(last_byte, end_byte)
+  validate_crc32c = _should_validate_crc32c(
+      source_resource, start_byte, last_byte
+  )
+
+  ranges = (
+      (range_start, min(range_start + range_size, last_byte + 1) - 1)
+      for range_start in range(start_byte, last_byte + 1, range_size)
+  )
+  max_pending_ranges = thread_count * 2
+  pending_ranges = collections.deque()
+  checksums_and_lengths = []
+
+  with futures.ThreadPoolExecutor(max_workers=thread_count) as executor:
+
+    def _fill_buffer():
+      while len(pending_ranges) < max_pending_ranges:
+        byte_range = next(ranges, None)
+        if byte_range is None:
+          return
+        pending_ranges.append((
+            byte_range,
+            executor.submit(
+                _download_range,
+                source_resource,
+                request_config,
+                byte_range[0],
+                byte_range[1],
+                validate_crc32c,
+            ),
+        ))
+
+    try:
+      _fill_buffer()
+      while pending_ranges:
+        (_, range_end), future = pending_ranges.popleft()
+        data, checksum = future.result()
+        _fill_buffer()
+        download_stream.write(data)
+        if progress_callback:
+          progress_callback(range_end + 1)
+        checksums_and_lengths.append((checksum, len(data)))
+    except BaseException:
+      for _, future in pending_ranges:
+        future.cancel()
+      raise
+
+  if validate_crc32c:
+    calculated_hash = crc32c.get_crc32c_hash_string_from_checksum(
+        hash_util.combine_crc32c_checksums(checksums_and_lengths)
+    )
+    hash_util.validate_object_hashes_match(
+        source_resource.storage_url.url_string,
+        source_resource.crc32c_hash,
+        calculated_hash,
+    )
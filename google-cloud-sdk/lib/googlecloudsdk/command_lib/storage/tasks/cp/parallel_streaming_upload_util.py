@@ -0,0 +1,386 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Uploads an unseekable stream as concurrently uploaded components.
+
+Parallel composite uploads of files let worker tasks read their own byte ranges
+of the file. Streams like stdin can only be read once, in order, so instead the
+task reading the stream cuts it into parts of
+storage/parallel_composite_upload_component_size bytes held in memory, uploads
+storage/parallel_streaming_upload_thread_count of them at once as temporary
+components, and composes the components into the destination at the end.
+
+The size of a stream is not known in advance, so there may be more components
+than a compose request accepts. These are composed in batches into
+intermediate temporary objects, level by level, until one request can compose
+the rest.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+from concurrent import futures
+import io
+import threading
+
+from googlecloudsdk.api_lib.storage import api_factory
+from googlecloudsdk.api_lib.storage import cloud_api
+from googlecloudsdk.api_lib.storage import errors as api_errors
+from googlecloudsdk.api_lib.storage import request_config_factory
+from googlecloudsdk.command_lib.storage import hash_util
+from googlecloudsdk.command_lib.storage import path_util
+from googlecloudsdk.command_lib.storage.tasks import batch_util
+from googlecloudsdk.command_lib.storage.tasks import compose_objects_task
+from googlecloudsdk.command_lib.storage.tasks import task
+from googlecloudsdk.command_lib.storage.tasks import task_util
+from googlecloudsdk.command_lib.storage.tasks.cp import copy_component_util
+from googlecloudsdk.command_lib.storage.tasks.cp import parallel_composite_upload_util
+from googlecloudsdk.command_lib.storage.tasks.cp import upload_util
+from googlecloudsdk.command_lib.util import crc32c
+from googlecloudsdk.core import log
+from googlecloudsdk.core import properties
+from googlecloudsdk.core.util import scaled_integer
+
+
+def _get_thread_count():
+  return max(
+      1,
+      properties.VALUES.storage.parallel_streaming_upload_thread_count.GetInt()
+      or 1,
+  )
+
+
+def should_upload_in_parallel(api, destination_resource, user_request_args):
+  """Returns True if a stream should be uploaded as parallel components.
+
+  Args:
+    api (CloudApi): The API the stream would be uploaded with.
+    destination_resource (resource_reference.Resource): The upload destination.
+    user_request_args (UserRequestArgs|None): Values from user flags.
+  """
+  if _get_thread_count() < 2:
+    return False
+  # Can't use "not" since None means parallel composite uploads are enabled
+  # with a warning.
+  if properties.VALUES.storage.parallel_composite_upload_enabled.GetBool() is (
+      False):
+    return False
+  if cloud_api.Capability.COMPOSE_OBJECTS not in api.capabilities:
+    return False
+  compatibility_check = (
+      properties.VALUES.storage.parallel_composite_upload_compatibility_check
+  )
+  if not compatibility_check.GetBool():
+    return True
+  is_compatible = (
+      parallel_composite_upload_util.is_destination_composite_upload_compatible
+  )
+  return is_compatible(destination_resource, user_request_args)
+
+
+class ParallelStreamingUpload(object):
+  """Uploads a stream in parts and composes them into one object."""
+
+  def __init__(
+      self,
+      api,
+      stream,
+      source_resource,
+      destination_resource,
+      content_type,
+      posix_to_set=None,
+      progress_callback=None,
+      task_status_queue=None,
+      user_request_args=None,
+  ):
+    """Initializes a ParallelStreamingUpload instance.
+
+    Args:
+      api (CloudApi): API used on the calling thread. Worker threads get their
+        own clients.
+      stream (io.IOBase): Unseekable data to upload.
+      source_resource (resource_reference.FileObjectResource): The stream's
+        source, used for component names and final object metadata.
+      destination_resource (resource_reference.Resource): The upload
+        destination.
+      content_type (str): Content type of the final object.
+      posix_to_set (PosixAttributes|None): Set as custom metadata on the final
+        object.
+      progress_callback (Callable[[int], None]|None): Called with the total
+        number of bytes uploaded after each part is uploaded.
+      task_status_queue (multiprocessing.Queue|None): Used for sending messages
+        if the uploaded object is deleted after failing validation.
+      user_request_args (UserRequestArgs|None): Values from user flags.
+    """
+    self._api = api
+    self._stream = stream
+    self._source_resource = source_resource
+    self._destination_resource = destination_resource
+    self._content_type = content_type
+    self._posix_to_set = posix_to_set
+    self._progress_callback = progress_callback
+    self._task_status_queue = task_status_queue
+    self._user_request_args = user_request_args
+    self._component_user_request_args = (
+        copy_component_util.get_user_request_args_for_components(
+            user_request_args
+        )
+    )
+
+    self._part_size = scaled_integer.ParseInteger(
+        properties.VALUES.storage.parallel_composite_upload_component_size.Get()
+    )
+    self._thread_count = _get_thread_count()
+    self._random_prefix = path_util.generate_random_int_for_path()
+
+    self._lock = threading.Lock()
+    self._temporary_resources = []
+    self._uploaded_bytes = 0
+
+  def _get_temporary_resource(self, component_id):
+    return copy_component_util.get_temporary_component_resource(
+        self._source_resource,
+        self._destination_resource,
+        self._random_prefix,
+        component_id,
+    )
+
+  def _upload_part(self, component_id, data):
+    """Uploads a part as a temporary component and validates its CRC32C.
+
+    Args:
+      component_id (int): Position of the part in the stream.
+      data (bytes): The part's data.
+
+    Returns:
+      A (ObjectResource, int, int) tuple of the component, the CRC32C checksum
+      of its data, and its length.
+    """
+    component_resource = self._get_temporary_resource(component_id)
+    api = api_factory.get_api(
+        component_resource.storage_url.scheme,
+        bucket_name=component_resource.storage_url.bucket_name,
+    )
+    request_config = request_config_factory.get_request_config(
+        component_resource.storage_url,
+        content_type=self._content_type,
+        size=len(data),
+        user_request_args=self._component_user_request_args,
+    )
+    uploaded_resource = api.upload_object(
+        io.BytesIO(data),
+        component_resource,
+        request_config,
+        upload_strategy=upload_util.get_upload_strategy(api, len(data)),
+    )
+    with self._lock:
+      self._temporary_resources.append(uploaded_resource)
+      self._uploaded_bytes += len(data)
+      if self._progress_callback:
+        self._progress_callback(self._uploaded_bytes)
+
+    checksum = crc32c.get_checksum(crc32c.get_crc32c(data))
+    if uploaded_resource.crc32c_hash:
+      hash_util.validate_object_hashes_match(
+          uploaded_resource.storage_url.url_string,
+          crc32c.get_crc32c_hash_string_from_checksum(checksum),
+          uploaded_resource.crc32c_hash,
+      )
+    return uploaded_resource, checksum, len(data)
+
+  def _compose(self, source_resources, destination_resource, is_final):
+    """Composes source_resources and returns the created resource."""
+    if is_final:
+      compose_task = compose_objects_task.ComposeObjectsTask(
+          source_resources,
+          destination_resource,
+          original_source_resource=self._source_resource,
+          posix_to_set=self._posix_to_set,
+          user_request_args=self._user_request_args,
+      )
+    else:
+      compose_task = compose_objects_task.ComposeObjectsTask(
+          source_resources,
+          destination_resource,
+          user_request_args=self._component_user_request_args,
+      )
+    return task_util.get_first_matching_message_payload(
+        compose_task.execute().messages, task.Topic.CREATED_RESOURCE
+    )
+
+  def _compose_tree(self, executor, component_resources):
+    """Composes components into the destination, in batches if needed."""
+    max_sources = self._api.MAX_OBJECTS_PER_COMPOSE_CALL
+    level = 0
+    while len(component_resources) > max_sources:
+      compose_futures = []
+      for index, start in enumerate(
+          range(0, len(component_resources), max_sources)
+      ):
+        intermediate_resource = self._get_temporary_resource(
+            'composite_{}_{}'.format(level, index)
+        )
+        compose_futures.append(
+            executor.submit(
+                self._compose,
+                component_resources[start:start + max_sources],
+                intermediate_resource,
+                False,
+            )
+        )
+      component_resources = [future.result() for future in compose_futures]
+      with self._lock:
+        self._temporary_resources.extend(component_resources)
+      level += 1
+    return self._compose(
+        component_resources, self._destination_resource, True
+    )
+
+  def _delete_temporary_resources(self, executor):
+    """Deletes temporary objects, logging instead of raising errors."""
+
+    def _delete(resources):
+      storage_url = resources[0].storage_url
+      api = api_factory.get_api(
+          storage_url.scheme, bucket_name=storage_url.bucket_name
+      )
+      object_urls_and_request_configs = [
+          (
+              resource.storage_url,
+              request_config_factory.get_request_config(
+                  resource.storage_url,
+                  user_request_args=self._component_user_request_args,
+              ),
+          )
+          for resource in resources
+      ]
+      try:
+        if len(object_urls_and_request_configs) == 1:
+          api.delete_object(*object_urls_and_request_configs[0])
+          call_errors = [None]
+        else:
+          call_errors = api.delete_objects(object_urls_and_request_configs)
+      except api_errors.CloudApiError as e:
+        call_errors = [e] * len(resources)
+      for resource, error in zip(resources, call_errors):
+        if error is not None:
+          log.warning(
+              'Failed to delete temporary component {}: {}'.format(
+                  resource.storage_url, error
+              )
+          )
+
+    with self._lock:
+      temporary_resources = self._temporary_resources
+      self._temporary_resources = []
+    # Without storage/object_request_batch_size set, or for APIs without batch
+    # requests, each object is deleted with its own call, in parallel.
+    batch_size = min(
+        batch_util.get_batch_size(), self._api.MAX_REQUESTS_PER_BATCH
+    )
+    list(
+        executor.map(
+            _delete,
+            [
+                temporary_resources[i : i + batch_size]
+                for i in range(0, len(temporary_resources), batch_size)
+            ],
+        )
+    )
+
+  def _upload_single_part(self, data):
+    """Uploads a stream that fit in one part directly to the destination."""
+    request_config = request_config_factory.get_request_config(
+        self._destination_resource.storage_url,
+        content_type=self._content_type,
+        size=len(data),
+        user_request_args=self._user_request_args,
+    )
+    uploaded_resource = self._api.upload_object(
+        io.BytesIO(data),
+        self._destination_resource,
+        request_config,
+        posix_to_set=self._posix_to_set,
+        source_resource=self._source_resource,
+        upload_strategy=upload_util.get_upload_strategy(self._api, len(data)),
+    )
+    if self._progress_callback:
+      self._progress_callback(len(data))
+    return uploaded_resource
+
+  def run(self):
+    """Uploads the stream and returns the resulting object's resource.
+
+    At most thread_count parts are uploaded at once, so about thread_count + 1
+    parts are held in memory.
+
+    Returns:
+      ObjectResource for the uploaded object.
+
+    Raises:
+      errors.HashMismatchError: A component or the final object does not have
+        the CRC32C hash of the data read from the stream.
+    """
+    data = self._stream.read(self._part_size)
+    if len(data) < self._part_size:
+      return self._upload_single_part(data)
+
+    component_futures = []
+    running_futures = set()
+    with futures.ThreadPoolExecutor(max_workers=self._thread_count) as executor:
+      try:
+        while data:
+          if len(running_futures) >= self._thread_count:
+            done_futures, running_futures = futures.wait(
+                running_futures, return_when=futures.FIRST_COMPLETED
+            )
+            for future in done_futures:
+              # Raises errors before reading more of the stream.
+              future.result()
+          future = executor.submit(
+              self._upload_part, len(component_futures), data
+          )
+          component_futures.append(future)
+          running_futures.add(future)
+          data = self._stream.read(self._part_size)
+
+        results = [future.result() for future in component_futures]
+        created_resource = self._compose_tree(
+            executor, [resource for resource, _, _ in results]
+        )
+      except BaseException:
+        for future in component_futures:
+          future.cancel()
+        futures.wait(component_futures)
+        self._delete_temporary_resources(executor)
+        raise
+
+      self._delete_temporary_resources(executor)
+
+    if created_resource.crc32c_hash:
+      checksum = hash_util.combine_crc32c_checksums(
+          (part_checksum, length) for _, part_checksum, length in results
+      )
+      # Deletes the object if the hashes do not match.
+      upload_util.validate_uploaded_object(
+          {
+              hash_util.HashAlgorithm.CRC32C: crc32c.get_crc32c_from_checksum(
+                  checksum
+              )
+          },
+          created_resource,
+          self._task_status_queue,
+      )
+    return created_resource
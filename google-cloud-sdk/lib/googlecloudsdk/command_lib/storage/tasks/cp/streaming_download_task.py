@@ -33,6 +33,7 @@ from googlecloudsdk.api_lib.storage.gcs_grpc_bidi_streaming import client as grp
 from googlecloudsdk.command_lib.storage import progress_callbacks
 from googlecloudsdk.command_lib.storage.tasks import task_status
 from googlecloudsdk.command_lib.storage.tasks.cp import copy_util
+from googlecloudsdk.command_lib.storage.tasks.cp import parallel_streaming_download_util
 from googlecloudsdk.core import exceptions as core_exceptions
 from googlecloudsdk.core import properties
 
@@ -124,14 +125,26 @@ class StreamingDownloadTask(copy_util.ObjectCopyTask):
           'Only Simple/Sliced downloads are supported for zonal buckets via'
           ' Grpc Bidi Streaming API.'
       )
-    api.download_object(
-        self._source_resource,
-        self._download_stream,
-        request_config,
-        download_strategy=cloud_api.DownloadStrategy.ONE_SHOT,
-        progress_callback=progress_callback,
-        start_byte=self._start_byte,
-        end_byte=self._end_byte)
+    if parallel_streaming_download_util.should_read_ahead(
+        self._source_resource, self._start_byte, self._end_byte
+    ):
+      parallel_streaming_download_util.download_with_read_ahead(
+          self._source_resource,
+          self._download_stream,
+          request_config,
+          start_byte=self._start_byte,
+          end_byte=self._end_byte,
+          progress_callback=progress_callback,
+      )
+    else:
+      api.download_object(
+          self._source_resource,
+          self._download_stream,
+          request_config,
+          download_strategy=cloud_api.DownloadStrategy.ONE_SHOT,
+          progress_callback=progress_callback,
+          start_byte=self._start_byte,
+          end_byte=self._end_byte)
     self._download_stream.flush()
     self._print_created_message_if_requested(self._destination_resource)
 
@@ -18,18 +18,28 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+import os
+import threading
+
 from googlecloudsdk.api_lib.storage import api_factory
 from googlecloudsdk.api_lib.storage import cloud_api
 from googlecloudsdk.api_lib.storage import request_config_factory
-from googlecloudsdk.command_lib.storage import errors
-from googlecloudsdk.command_lib.storage import user_request_args_factory
+from googlecloudsdk.command_lib.storage import gzip_util
+from googlecloudsdk.command_lib.storage import progress_callbacks
+from googlecloudsdk.command_lib.storage.tasks import task_status
 from googlecloudsdk.command_lib.storage.tasks.cp import copy_util
+from googlecloudsdk.command_lib.storage.tasks.cp import parallel_streaming_upload_util
 from googlecloudsdk.command_lib.storage.tasks.cp import upload_util
 from googlecloudsdk.core import properties
 
 
 class StreamingUploadTask(copy_util.ObjectCopyTask):
-  """Represents a command operation triggering a streaming upload."""
+  """Represents a command operation triggering a streaming upload.
+
+  Also used for files uploaded with gzip content encoding if the
+  storage/stream_gzip_local_uploads property is set, since their compressed
+  size is not known before the upload.
+  """
 
   def __init__(
       self,
@@ -44,8 +54,8 @@ class StreamingUploadTask(copy_util.ObjectCopyTask):
     """Initializes task.
 
     Args:
-      source_resource (FileObjectResource): Points to the stream or named pipe
-        to read from.
+      source_resource (FileObjectResource): Points to the stream, named pipe, or
+        file to read from.
       destination_resource (UnknownResource|ObjectResource): The full path of
         object to upload to.
       posix_to_set (PosixAttributes|None): See parent class.
@@ -66,24 +76,73 @@ class StreamingUploadTask(copy_util.ObjectCopyTask):
     self._source_resource = source_resource
     self._destination_resource = destination_resource
 
+  def _upload_in_parallel(
+      self, api, content_type, gzip_locally, task_status_queue
+  ):
+    """Uploads the stream as composed components and returns the object."""
+    if task_status_queue:
+      progress_callback = progress_callbacks.FilesAndBytesProgressCallback(
+          status_queue=task_status_queue,
+          offset=0,
+          length=None,
+          source_url=self._source_resource.storage_url,
+          destination_url=self._destination_resource.storage_url,
+          operation_name=task_status.OperationName.UPLOADING,
+          process_id=os.getpid(),
+          thread_id=threading.get_ident(),
+      )
+    else:
+      progress_callback = None
+
+    with upload_util.open_source_stream(
+        self._source_resource, gzip_locally
+    ) as stream:
+      return parallel_streaming_upload_util.ParallelStreamingUpload(
+          api,
+          stream,
+          self._source_resource,
+          self._destination_resource,
+          content_type,
+          posix_to_set=self._posix_to_set,
+          progress_callback=progress_callback,
+          task_status_queue=task_status_queue,
+          user_request_args=self._user_request_args,
+      ).run()
+
   def execute(self, task_status_queue=None):
     """Runs upload from stream."""
+    source_url = self._source_resource.storage_url
+    content_type = upload_util.get_content_type(
+        source_url.resource_name, is_stream=source_url.is_stream)
     request_config = request_config_factory.get_request_config(
         self._destination_resource.storage_url,
-        content_type=upload_util.get_content_type(
-            self._source_resource.storage_url.resource_name, is_stream=True),
+        content_type=content_type,
         md5_hash=self._source_resource.md5_hash,
         user_request_args=self._user_request_args)
+    gzip_locally = gzip_util.should_gzip_locally(
+        getattr(request_config, 'gzip_settings', None),
+        source_url.resource_name,
+    )
+
+    provider = self._destination_resource.storage_url.scheme
+    if properties.VALUES.storage.enable_zonal_buckets_bidi_streaming.GetBool():
+      api = api_factory.get_api(
+          provider,
+          bucket_name=self._destination_resource.storage_url.bucket_name,
+      )
+    else:
+      api = api_factory.get_api(provider)
 
-    if getattr(request_config, 'gzip_settings', None):
-      gzip_type = getattr(request_config.gzip_settings, 'type', None)
-      if gzip_type is user_request_args_factory.GzipType.LOCAL:
-        # TODO(b/202729249): Can support this after dropping Python 2.
-        raise errors.Error(
-            'Gzip content encoding is not currently supported for streaming'
-            ' uploads. Remove the compression flag or save the streamed output'
-            ' to a file before uploading.')
+    if parallel_streaming_upload_util.should_upload_in_parallel(
+        api, self._destination_resource, self._user_request_args
+    ):
+      uploaded_object_resource = self._upload_in_parallel(
+          api, content_type, gzip_locally, task_status_queue
+      )
+      self._print_created_message_if_requested(uploaded_object_resource)
+      return
 
+    # Digesters see the compressed data, which is what the object stores.
     digesters = upload_util.get_digesters(
         self._source_resource,
         self._destination_resource)
@@ -91,17 +150,11 @@ class StreamingUploadTask(copy_util.ObjectCopyTask):
         self._source_resource,
         digesters=digesters,
         task_status_queue=task_status_queue,
-        destination_resource=self._destination_resource)
+        destination_resource=self._destination_resource,
+        gzip_locally=gzip_locally,
+    )
 
     with stream:
-      provider = self._destination_resource.storage_url.scheme
-      if properties.VALUES.storage.enable_zonal_buckets_bidi_streaming.GetBool():
-        api = api_factory.get_api(
-            provider,
-            bucket_name=self._destination_resource.storage_url.bucket_name,
-        )
-      else:
-        api = api_factory.get_api(provider)
       uploaded_object_resource = api.upload_object(
           source_stream=stream,
           destination_resource=self._destination_resource,
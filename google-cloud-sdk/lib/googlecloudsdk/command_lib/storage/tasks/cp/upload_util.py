@@ -31,6 +31,7 @@ from googlecloudsdk.command_lib.storage import buffered_upload_stream
 from googlecloudsdk.command_lib.storage import component_stream
 from googlecloudsdk.command_lib.storage import errors
 from googlecloudsdk.command_lib.storage import fast_crc32c_util
+from googlecloudsdk.command_lib.storage import gzip_util
 from googlecloudsdk.command_lib.storage import hash_util
 from googlecloudsdk.command_lib.storage import progress_callbacks
 from googlecloudsdk.command_lib.storage import upload_stream
@@ -148,6 +149,28 @@ def get_digesters(source_resource, destination_resource):
   return {hash_util.HashAlgorithm.MD5: hashing.get_md5()}
 
 
+def open_source_stream(source_resource, gzip_locally=False):
+  """Opens the data to upload without progress reporting or hashing.
+
+  Args:
+    source_resource (resource_reference.FileObjectResource): Contains a path to
+      the source file, or "-" for stdin.
+    gzip_locally (bool): If True, the stream returns the source data gzipped.
+
+  Returns:
+    A readable binary stream.
+  """
+  if source_resource.storage_url.is_stdio:
+    source_stream = os.fdopen(0, 'rb')
+  else:
+    source_stream = files.BinaryFileReader(
+        source_resource.storage_url.resource_name)
+
+  if gzip_locally:
+    return gzip_util.ParallelGzipStream(source_stream)
+  return source_stream
+
+
 def get_stream(source_resource,
                length=None,
                offset=None,
@@ -155,7 +178,8 @@ def get_stream(source_resource,
                task_status_queue=None,
                destination_resource=None,
                component_number=None,
-               total_components=None):
+               total_components=None,
+               gzip_locally=False):
   """Gets a stream to use for an upload.
 
   Args:
@@ -173,6 +197,8 @@ def get_stream(source_resource,
     component_number (int|None): Identifies a component in composite uploads.
     total_components (int|None): The total number of components used in a
       composite upload.
+    gzip_locally (bool): If True, the stream returns the source data gzipped.
+      Progress, digesters, and seeking then apply to the compressed data.
 
   Returns:
     An UploadStream wrapping the file specified by source_resource.
@@ -193,13 +219,9 @@ def get_stream(source_resource,
   else:
     progress_callback = None
 
-  if source_resource.storage_url.is_stdio:
-    source_stream = os.fdopen(0, 'rb')
-  else:
-    source_stream = files.BinaryFileReader(
-        source_resource.storage_url.resource_name)
+  source_stream = open_source_stream(source_resource, gzip_locally)
 
-  if source_resource.storage_url.is_stream:
+  if source_resource.storage_url.is_stream or gzip_locally:
     max_buffer_size = scaled_integer.ParseBinaryInteger(
         properties.VALUES.storage.upload_chunk_size.Get())
     return buffered_upload_stream.BufferedUploadStream(
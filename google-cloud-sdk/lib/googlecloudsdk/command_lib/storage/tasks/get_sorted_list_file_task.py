@@ -18,8 +18,9 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+import collections
+from concurrent import futures
 import errno
-import heapq
 import itertools
 import os
 import threading
@@ -29,30 +30,17 @@ from googlecloudsdk.command_lib.storage import errors
 from googlecloudsdk.command_lib.storage import folder_util
 from googlecloudsdk.command_lib.storage import regex_util
 from googlecloudsdk.command_lib.storage import rsync_command_util
+from googlecloudsdk.command_lib.storage import rsync_sorted_run
 from googlecloudsdk.command_lib.storage import storage_url
 from googlecloudsdk.command_lib.storage import wildcard_iterator
 from googlecloudsdk.command_lib.storage.tasks import task
+from googlecloudsdk.command_lib.storage.tasks import task_graph_executor
 from googlecloudsdk.core import log
 from googlecloudsdk.core import properties
-from googlecloudsdk.core.util import files
 
-
-def sorting_key_for_csv_line(csv_line):
-  """Returns the sorting key for the chunk CSV line.
-
-  This key is based on only the first field of the CSV line, which is the URL of
-  the resource. Since we use comma as a delimiter, we can't use the
-  entire CSV line as the key since there are unicode characters before the comma
-  like #, $, " which if present in the csv line can cause sorting issues.
-
-  Args:
-    csv_line (str): The CSV line to get the sorting key for.
-
-  Returns:
-    str: The sorting key for the CSV line.
-  """
-  fields = rsync_command_util.get_fields_from_csv_line(csv_line)
-  return fields[0]
+# Chunks waiting for a sorting process, per process. Each holds a chunk of CSV
+# lines in memory.
+_PENDING_CHUNKS_PER_SORT_PROCESS = 2
 
 
 class GetSortedContainerContentsTask(task.Task):
@@ -138,6 +126,23 @@ class GetSortedContainerContentsTask(task.Task):
     chunk_file_paths = []
     chunk_file_readers = []
     chunk_size = properties.VALUES.storage.rsync_list_chunk_size.GetInt()
+    # With URL based sorting, only the URL of a line is its sort key. Since we
+    # use comma as a delimiter, the entire CSV line can't be the key when
+    # characters like #, $, " sort before the comma.
+    url_based_sorting = (
+        properties.VALUES.storage.use_url_based_rsync_sorting.GetBool()
+    )
+    sort_process_count = properties.VALUES.storage.rsync_sort_processes.GetInt()
+    if sort_process_count:
+      # Chunks are sorted and written in other processes while this one keeps
+      # listing.
+      executor = futures.ProcessPoolExecutor(
+          max_workers=sort_process_count,
+          mp_context=task_graph_executor.multiprocessing_context,
+      )
+    else:
+      executor = None
+    pending_chunks = collections.deque()
     try:
       while True:
         resources_chunk = list(itertools.islice(file_iterator, chunk_size))
@@ -158,34 +163,35 @@ class GetSortedContainerContentsTask(task.Task):
                 is_managed_folder_list=self._managed_folders_only,
             )
         )
-        if properties.VALUES.storage.use_url_based_rsync_sorting.GetBool():
-          sorted_encoded_chunk = sorted(
-              [
-                  rsync_command_util.get_csv_line_from_resource(x)
-                  for x in resources_chunk
-              ],
-              key=sorting_key_for_csv_line,
+        encoded_chunk = [
+            rsync_command_util.get_csv_line_from_resource(x)
+            for x in resources_chunk
+        ]
+        if executor is None:
+          rsync_sorted_run.write_sorted_run(
+              chunk_file_paths[-1], encoded_chunk, url_based_sorting
           )
-        else:
-          sorted_encoded_chunk = sorted([
-              rsync_command_util.get_csv_line_from_resource(x)
-              for x in resources_chunk
-          ])
-
-        sorted_encoded_chunk.append('')  # Add trailing newline.
-        files.WriteFileContents(
-            chunk_file_paths[-1],
-            '\n'.join(sorted_encoded_chunk),
+          continue
+
+        pending_chunks.append(
+            executor.submit(
+                rsync_sorted_run.write_sorted_run,
+                chunk_file_paths[-1],
+                encoded_chunk,
+                url_based_sorting,
+            )
         )
+        while len(pending_chunks) > (
+            sort_process_count * _PENDING_CHUNKS_PER_SORT_PROCESS
+        ):
+          pending_chunks.popleft().result()
 
-      chunk_file_readers = [files.FileReader(path) for path in chunk_file_paths]
-      with files.FileWriter(self._output_path, create_path=True) as file_writer:
-        if properties.VALUES.storage.use_url_based_rsync_sorting.GetBool():
-          file_writer.writelines(
-              heapq.merge(*chunk_file_readers, key=sorting_key_for_csv_line)
-          )
-        else:
-          file_writer.writelines(heapq.merge(*chunk_file_readers))
+      while pending_chunks:
+        pending_chunks.popleft().result()
+
+      for path in chunk_file_paths:
+        chunk_file_readers.append(rsync_sorted_run.SortedRunReader(path))
+      rsync_sorted_run.merge_sorted_runs(chunk_file_readers, self._output_path)
 
     except OSError as e:
       if e.errno == errno.EMFILE:
@@ -197,11 +203,15 @@ class GetSortedContainerContentsTask(task.Task):
       raise e
 
     finally:
+      if executor is not None:
+        for future in pending_chunks:
+          future.cancel()
+        executor.shutdown(wait=True)
       for reader in chunk_file_readers:
         try:
           reader.close()
         except Exception as e:  # pylint:disable=broad-except
-          log.debug('Failed to close file reader {}: {}'.format(reader.name, e))
+          log.debug('Failed to close file reader {}: {}'.format(reader.path, e))
       for path in chunk_file_paths:
         rsync_command_util.try_to_delete_file(path)
 
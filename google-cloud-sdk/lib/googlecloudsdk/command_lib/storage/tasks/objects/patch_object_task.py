@@ -21,6 +21,7 @@ from __future__ import unicode_literals
 from googlecloudsdk.api_lib.storage import api_factory
 from googlecloudsdk.api_lib.storage import request_config_factory
 from googlecloudsdk.command_lib.storage import progress_callbacks
+from googlecloudsdk.command_lib.storage.tasks import batch_util
 from googlecloudsdk.command_lib.storage.tasks import task
 from googlecloudsdk.core import log
 
@@ -71,3 +72,94 @@ class PatchObjectTask(task.Task):
         and self._posix_to_set == other._posix_to_set
         and self._user_request_args == other._user_request_args
     )
+
+
+class BatchPatchObjectsTask(task.Task):
+  """Updates the metadata of several cloud storage objects in batch requests."""
+
+  def __init__(self, object_resources_and_posix, user_request_args=None):
+    """Initializes task.
+
+    Args:
+      object_resources_and_posix (list[tuple[resource_reference.ObjectResource,
+        PosixAttributes|None]]): The objects to update, all with the same
+        scheme, and POSIX info set as custom cloud metadata on each.
+      user_request_args (UserRequestArgs|None): Describes metadata updates to
+        perform.
+    """
+    super(BatchPatchObjectsTask, self).__init__()
+    self._object_resources_and_posix = object_resources_and_posix
+    self._user_request_args = user_request_args
+
+    self.parallel_processing_key = tuple(
+        object_resource.storage_url.url_string
+        for object_resource, _ in object_resources_and_posix
+    )
+
+  def execute(self, task_status_queue=None):
+    patch_arguments = []
+    for object_resource, posix_to_set in self._object_resources_and_posix:
+      log.status.Print('Patching {}...'.format(object_resource))
+      request_config = request_config_factory.get_request_config(
+          object_resource.storage_url,
+          user_request_args=self._user_request_args)
+      patch_arguments.append((object_resource, request_config, posix_to_set))
+
+    provider = self._object_resources_and_posix[0][0].storage_url.scheme
+    call_errors = api_factory.get_api(provider).patch_objects_metadata(
+        patch_arguments
+    )
+
+    if task_status_queue:
+      for error in call_errors:
+        if error is None:
+          progress_callbacks.increment_count_callback(task_status_queue)
+    batch_util.raise_last_error_and_log_others(call_errors)
+
+  def __eq__(self, other):
+    if not isinstance(other, type(self)):
+      return NotImplemented
+    return (
+        self._object_resources_and_posix == other._object_resources_and_posix
+        and self._user_request_args == other._user_request_args
+    )
+
+
+def _get_patch_batch_key(task_object):
+  """Returns a key shared by object patches that can run in one batch."""
+  # pylint:disable=protected-access
+  if not isinstance(task_object, PatchObjectTask):
+    return None
+  scheme = task_object._object_resource.storage_url.scheme
+  if not batch_util.supports_batch_requests(scheme):
+    return None
+  return (scheme, task_object._user_request_args)
+  # pylint:enable=protected-access
+
+
+def _create_batch_patch_task(patch_object_tasks):
+  # pylint:disable=protected-access
+  return BatchPatchObjectsTask(
+      [
+          (task_object._object_resource, task_object._posix_to_set)
+          for task_object in patch_object_tasks
+      ],
+      user_request_args=patch_object_tasks[0]._user_request_args,
+  )
+  # pylint:enable=protected-access
+
+
+def get_batched_patch_tasks(task_iterator):
+  """Combines consecutive PatchObjectTasks into BatchPatchObjectsTasks.
+
+  Args:
+    task_iterator (Iterable[task.Task]): Tasks, such as those an objects update
+      command runs.
+
+  Returns:
+    Iterable[task.Task]: The tasks, with object patches batched if the
+      storage/object_request_batch_size property is greater than 1.
+  """
+  return batch_util.get_batched_tasks(
+      task_iterator, _get_patch_batch_key, _create_batch_patch_task
+  )
@@ -24,6 +24,7 @@ import os
 from googlecloudsdk.api_lib.storage import api_factory
 from googlecloudsdk.api_lib.storage import request_config_factory
 from googlecloudsdk.command_lib.storage import progress_callbacks
+from googlecloudsdk.command_lib.storage.tasks import batch_util
 from googlecloudsdk.command_lib.storage.tasks import task
 from googlecloudsdk.core import log
 
@@ -149,3 +150,98 @@ class DeleteObjectTask(CloudDeleteTask):
 
   def _make_delete_api_call(self, client, request_config):
     client.delete_object(self._url, request_config)
+
+
+class BatchDeleteObjectsTask(task.Task):
+  """Task to delete several objects with batch requests."""
+
+  def __init__(self, object_urls, user_request_args=None, verbose=True):
+    """Initializes task.
+
+    Args:
+      object_urls (list[storage_url.CloudUrl]): URLs of objects to delete, all
+        with the same scheme.
+      user_request_args (UserRequestArgs|None): Values for RequestConfig.
+      verbose (bool): If true, prints status messages. Otherwise, does not print
+        anything.
+    """
+    super().__init__()
+    self._object_urls = object_urls
+    self._user_request_args = user_request_args
+    self._verbose = verbose
+
+    self.parallel_processing_key = tuple(
+        object_url.url_string for object_url in object_urls
+    )
+
+  def execute(self, task_status_queue=None):
+    if self._verbose:
+      for object_url in self._object_urls:
+        log.status.Print('Removing {}...'.format(object_url))
+
+    client = api_factory.get_api(self._object_urls[0].scheme)
+    call_errors = client.delete_objects([
+        (
+            object_url,
+            request_config_factory.get_request_config(
+                object_url, user_request_args=self._user_request_args
+            ),
+        )
+        for object_url in self._object_urls
+    ])
+
+    if task_status_queue:
+      for error in call_errors:
+        if error is None:
+          progress_callbacks.increment_count_callback(task_status_queue)
+    batch_util.raise_last_error_and_log_others(call_errors)
+
+  def __eq__(self, other):
+    if not isinstance(other, self.__class__):
+      return NotImplemented
+    return (
+        self._object_urls == other._object_urls
+        and self._user_request_args == other._user_request_args
+        and self._verbose == other._verbose
+    )
+
+
+def _get_delete_batch_key(task_object):
+  """Returns a key shared by object deletions that can run in one batch."""
+  # pylint:disable=protected-access
+  if not (
+      isinstance(task_object, DeleteObjectTask)
+      and batch_util.supports_batch_requests(task_object._url.scheme)
+  ):
+    return None
+  return (
+      task_object._url.scheme,
+      task_object._user_request_args,
+      task_object._verbose,
+  )
+  # pylint:enable=protected-access
+
+
+def _create_batch_delete_task(delete_object_tasks):
+  # pylint:disable=protected-access
+  return BatchDeleteObjectsTask(
+      [task_object._url for task_object in delete_object_tasks],
+      user_request_args=delete_object_tasks[0]._user_request_args,
+      verbose=delete_object_tasks[0]._verbose,
+  )
+  # pylint:enable=protected-access
+
+
+def get_batched_delete_tasks(task_iterator):
+  """Combines consecutive DeleteObjectTasks into BatchDeleteObjectsTasks.
+
+  Args:
+    task_iterator (Iterable[task.Task]): Delete tasks.
+
+  Returns:
+    Iterable[task.Task]: The tasks, with object deletions batched if the
+      storage/object_request_batch_size property is greater than 1.
+  """
+  return batch_util.get_batched_tasks(
+      task_iterator, _get_delete_batch_key, _create_batch_delete_task
+  )
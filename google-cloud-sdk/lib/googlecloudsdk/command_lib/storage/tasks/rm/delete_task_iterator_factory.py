@@ -111,4 +111,6 @@ class DeleteTaskIteratorFactory:
     return self._resource_iterator(self._folder_delete_tasks)
 
   def object_iterator(self):
-    return self._resource_iterator(self._object_delete_tasks)
+    return delete_task.get_batched_delete_tasks(
+        self._resource_iterator(self._object_delete_tasks)
+    )
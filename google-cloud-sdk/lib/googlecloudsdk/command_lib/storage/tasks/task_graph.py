@@ -97,7 +97,7 @@ class TaskGraph:
       tasks in it.
   """
 
-  def __init__(self, top_level_task_limit):
+  def __init__(self, top_level_task_limit, top_level_task_callback=None):
     """Initializes a TaskGraph instance.
 
     Args:
@@ -105,6 +105,8 @@ class TaskGraph:
         depend on for completion (i.e. dependent_task_ids is None). Adding
         top-level tasks with TaskGraph.add will block until there are fewer than
         this number of top-level tasks in the graph.
+      top_level_task_callback (Callable[[TaskWrapper], None]|None): Called with
+        each top-level task removed from the graph, while the graph is locked.
     """
 
     self.is_empty = threading.Event()
@@ -122,6 +124,7 @@ class TaskGraph:
     # when a top-level task is completed. This helps keep memory usage under
     # control by limiting the graph size.
     self._top_level_task_semaphore = threading.Semaphore(top_level_task_limit)
+    self._top_level_task_callback = top_level_task_callback
 
   def add(self, task, dependent_task_ids=None):
     """Adds a task to the graph.
@@ -222,6 +225,8 @@ class TaskGraph:
         self._top_level_task_semaphore.release()
         if not self._task_wrappers_in_graph:
           self.is_empty.set()
+        if self._top_level_task_callback:
+          self._top_level_task_callback(task_wrapper)
         return []
 
       # After removing this task, some dependent tasks may now be executable.
@@ -21,6 +21,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import unicode_literals
 
+import collections
 import contextlib
 import functools
 import multiprocessing
@@ -33,6 +34,8 @@ from googlecloudsdk.api_lib.storage.gcs_json import patch_apitools_messages
 from googlecloudsdk.command_lib import crash_handling
 from googlecloudsdk.command_lib.storage import encryption_util
 from googlecloudsdk.command_lib.storage import errors
+from googlecloudsdk.command_lib.storage import status_message_batcher
+from googlecloudsdk.command_lib.storage.tasks import concurrency_controller
 from googlecloudsdk.command_lib.storage.tasks import task
 from googlecloudsdk.command_lib.storage.tasks import task_buffer
 from googlecloudsdk.command_lib.storage.tasks import task_graph as task_graph_module
@@ -148,6 +151,14 @@ _SHUTDOWN = 'SHUTDOWN'
 
 _CREATE_WORKER_PROCESS = 'CREATE_WORKER_PROCESS'
 
+# Kinds of tasks in the deque of a _WorkStealingScheduler.
+_MAIN_TASK = 'main'
+_LOCAL_TASK = 'local'
+_STOLEN_TASK = 'stolen'
+
+# How often idle work stealing processes check for offered tasks.
+_STEAL_POLL_SECONDS = 0.1
+
 
 class _DebugSignalHandler:
   """Signal handler for collecting debug information."""
@@ -242,6 +253,45 @@ class SharedProcessContext:
     self._creds_context_manager.__exit__(exc_type, exc_value, exc_traceback)
 
 
+def _execute_task(task_object, task_status_queue):
+  """Executes a task and returns its output, converting errors to messages.
+
+  Args:
+    task_object (task.Task): The task to execute.
+    task_status_queue (multiprocessing.Queue|None): Used by task to report it
+      progress to a central location.
+
+  Returns:
+    task.Output|None: The output of the task.
+  """
+  task_execution_error = None
+  try:
+    task_output = task_object.execute(task_status_queue=task_status_queue)
+  # pylint: disable=broad-except
+  # If any exception is raised, it will prevent the executor from exiting.
+  except Exception as exception:
+    task_execution_error = exception
+    log.error(exception)
+    log.debug(exception, exc_info=sys.exc_info())
+
+    if isinstance(exception, errors.FatalError):
+      task_output = task.Output(
+          additional_task_iterators=None,
+          messages=[task.Message(topic=task.Topic.FATAL_ERROR, payload={})])
+    elif task_object.change_exit_code:
+      task_output = task.Output(
+          additional_task_iterators=None,
+          messages=[
+              task.Message(topic=task.Topic.CHANGE_EXIT_CODE, payload={})
+          ])
+    else:
+      task_output = None
+  # pylint: enable=broad-except
+  finally:
+    task_object.exit_handler(task_execution_error, task_status_queue)
+  return task_output
+
+
 @crash_handling.CrashManager
 def _thread_worker(task_queue, task_output_queue, task_status_queue,
                    idle_thread_count):
@@ -263,32 +313,7 @@ def _thread_worker(task_queue, task_output_queue, task_status_queue,
       break
     idle_thread_count.acquire()
 
-    task_execution_error = None
-    try:
-      task_output = task_wrapper.task.execute(
-          task_status_queue=task_status_queue)
-    # pylint: disable=broad-except
-    # If any exception is raised, it will prevent the executor from exiting.
-    except Exception as exception:
-      task_execution_error = exception
-      log.error(exception)
-      log.debug(exception, exc_info=sys.exc_info())
-
-      if isinstance(exception, errors.FatalError):
-        task_output = task.Output(
-            additional_task_iterators=None,
-            messages=[task.Message(topic=task.Topic.FATAL_ERROR, payload={})])
-      elif task_wrapper.task.change_exit_code:
-        task_output = task.Output(
-            additional_task_iterators=None,
-            messages=[
-                task.Message(topic=task.Topic.CHANGE_EXIT_CODE, payload={})
-            ])
-      else:
-        task_output = None
-    # pylint: enable=broad-except
-    finally:
-      task_wrapper.task.exit_handler(task_execution_error, task_status_queue)
+    task_output = _execute_task(task_wrapper.task, task_status_queue)
 
     task_output_queue.put((task_wrapper, task_output))
     idle_thread_count.release()
@@ -320,31 +345,324 @@ def _process_worker(
   """
   threads = []
   with shared_process_context:
-    for _ in range(thread_count):
-      thread = threading.Thread(
-          target=_thread_worker,
-          args=(
-              task_queue,
-              task_output_queue,
-              task_status_queue,
-              idle_thread_count,
-          ),
+    # Buffered status messages are sent before the process exits, which is
+    # before the main process stops handling status messages.
+    with status_message_batcher.batching_status_queue(
+        task_status_queue
+    ) as task_status_queue:
+      for _ in range(thread_count):
+        thread = threading.Thread(
+            target=_thread_worker,
+            args=(
+                task_queue,
+                task_output_queue,
+                task_status_queue,
+                idle_thread_count,
+            ),
+        )
+        thread.start()
+        threads.append(thread)
+
+      # TODO: b/354829547 - Update the function to catch the updated stack
+      # traces of the already running worker threads while a new worker process
+      # is not created.
+
+      if task_graph_debugger.is_task_graph_debugging_enabled():
+        stack_trace = task_graph_debugger.yield_stack_traces()
+        task_graph_debugger.write_stack_traces_to_file(
+            stack_trace, stack_trace_file_path
+        )
+
+      for thread in threads:
+        thread.join()
+
+
+class _WorkStealingScheduler:
+  """Runs tasks in a worker process with a local deque and task graph.
+
+  Tasks from the main process arrive through the shared task queue. When one
+  returns additional tasks, they are added to a task graph local to this
+  process and run on its threads, newest first. The main process only sees
+  the completion of the task that started the subtree, once all of it has run.
+
+  While the local deque is longer than the number of local threads and other
+  processes have idle threads, the oldest local tasks are offered on a shared
+  steal queue. A process that takes one sends its output back to the owner's
+  inbox queue, where the owner updates its local graph.
+
+  Messages with the CHANGE_EXIT_CODE and FATAL_ERROR topics of local tasks are
+  sent to the main process right away, since it sets the exit code.
+
+  Duplicate parallel_processing_key values are only detected among tasks of
+  the same process, since tasks run locally are not added to the main graph.
+  """
+
+  def __init__(
+      self,
+      process_index,
+      task_queue,
+      task_output_queue,
+      task_status_queue,
+      thread_count,
+      idle_thread_count,
+      inbox_queues,
+      steal_queue,
+  ):
+    self._process_index = process_index
+    self._task_queue = task_queue
+    self._task_output_queue = task_output_queue
+    self._task_status_queue = task_status_queue
+    self._thread_count = thread_count
+    self._idle_thread_count = idle_thread_count
+    self._inbox_queues = inbox_queues
+    self._steal_queue = steal_queue
+
+    self._condition = threading.Condition()
+    # Holds (kind, item) tuples, see _run.
+    self._tasks = collections.deque()
+    self._idle_threads = 0
+    self._shutting_down = False
+    # Maps ids of local tasks started by main process tasks to the main
+    # process task wrapper and its messages.
+    self._roots = {}
+    # Maps ids of offered local tasks to their wrappers.
+    self._offered_task_wrappers = {}
+    # Tasks are only added by threads of this process, which must not block.
+    self._local_graph = task_graph_module.TaskGraph(
+        top_level_task_limit=sys.maxsize,
+        top_level_task_callback=self._complete_root,
+    )
+
+  def _can_take_more_tasks(self):
+    return self._shutting_down or (self._idle_threads and not self._tasks)
+
+  def _push(self, kind, item):
+    with self._condition:
+      self._tasks.append((kind, item))
+      self._condition.notify_all()
+
+  def _push_local_tasks(self, task_wrappers):
+    for task_wrapper in task_wrappers:
+      task_wrapper.is_submitted = True
+      self._push(_LOCAL_TASK, task_wrapper)
+
+  def _feed(self):
+    """Takes tasks from the main process while there are idle threads."""
+    while True:
+      with self._condition:
+        while not self._can_take_more_tasks():
+          self._condition.wait()
+      with _task_queue_lock():
+        task_wrapper = self._task_queue.get()
+      if task_wrapper == _SHUTDOWN:
+        with self._condition:
+          self._shutting_down = True
+          self._condition.notify_all()
+        break
+      self._push(_MAIN_TASK, task_wrapper)
+
+  def _steal(self):
+    """Takes tasks offered by other processes while there are idle threads."""
+    while True:
+      with self._condition:
+        while not self._can_take_more_tasks():
+          self._condition.wait()
+        if self._shutting_down:
+          break
+      try:
+        offered_task = self._steal_queue.get(timeout=_STEAL_POLL_SECONDS)
+      except queue.Empty:
+        continue
+      self._push(_STOLEN_TASK, offered_task)
+
+  def _receive_stolen_task_outputs(self):
+    """Updates the local graph with outputs of tasks run by other processes."""
+    while True:
+      inbox_item = self._inbox_queues[self._process_index].get()
+      if inbox_item == _SHUTDOWN:
+        break
+      task_id, task_output = inbox_item
+      with self._condition:
+        task_wrapper = self._offered_task_wrappers.pop(task_id)
+      self._push_local_tasks(
+          self._local_graph.update_from_executed_task(task_wrapper, task_output)
       )
-      thread.start()
-      threads.append(thread)
 
-    # TODO: b/354829547 - Update the function to catch the updated stack traces
-    # of the already running worker threads while a new worker process
-    # is not created.
+  def _offer_surplus_task(self):
+    """Offers the oldest local task if other processes have idle threads."""
+    with self._condition:
+      if (
+          len(self._tasks) <= self._thread_count
+          or len(self._offered_task_wrappers) >= 2 * self._thread_count
+          or self._tasks[0][0] != _LOCAL_TASK
+      ):
+        return
+      # All local threads are busy, so idle threads are in other processes.
+      if not self._idle_thread_count.acquire(block=False):
+        return
+      self._idle_thread_count.release()
+      _, task_wrapper = self._tasks.popleft()
+      self._offered_task_wrappers[task_wrapper.id] = task_wrapper
+    self._steal_queue.put(
+        (self._process_index, task_wrapper.id, task_wrapper.task)
+    )
 
-    if task_graph_debugger.is_task_graph_debugging_enabled():
-      stack_trace = task_graph_debugger.yield_stack_traces()
-      task_graph_debugger.write_stack_traces_to_file(
-          stack_trace, stack_trace_file_path
+  def _forward_exit_code_messages(self, task_output):
+    """Sends messages that change the exit code to the main process."""
+    if not (task_output and task_output.messages):
+      return
+    messages = [
+        message
+        for message in task_output.messages
+        if message.topic
+        in (task.Topic.CHANGE_EXIT_CODE, task.Topic.FATAL_ERROR)
+    ]
+    if messages:
+      self._task_output_queue.put(
+          (None, task.Output(additional_task_iterators=None, messages=messages))
       )
 
+  def _complete_root(self, root_task_wrapper):
+    """Reports a main process task whose local subtree completed."""
+    main_task_wrapper, messages = self._roots.pop(root_task_wrapper.id)
+    self._task_output_queue.put((
+        main_task_wrapper,
+        task.Output(additional_task_iterators=None, messages=messages),
+    ))
+
+  def _run_main_task(self, main_task_wrapper):
+    task_output = _execute_task(main_task_wrapper.task, self._task_status_queue)
+    if task_output is None or not task_output.additional_task_iterators:
+      self._task_output_queue.put((main_task_wrapper, task_output))
+      return
+
+    root_task_wrapper = self._local_graph.add(main_task_wrapper.task)
+    if root_task_wrapper is None:
+      # Already running here, let the main process handle the subtasks.
+      self._task_output_queue.put((main_task_wrapper, task_output))
+      return
+    root_task_wrapper.is_submitted = True
+    self._roots[root_task_wrapper.id] = (
+        main_task_wrapper,
+        task_output.messages,
+    )
+    # The messages were saved for the main process, the local root has no
+    # dependents to send them to.
+    self._push_local_tasks(
+        self._local_graph.update_from_executed_task(
+            root_task_wrapper, task_output._replace(messages=None)
+        )
+    )
+
+  def _run(self, kind, item):
+    """Runs a task from the deque.
+
+    Args:
+      kind (str): _MAIN_TASK, _LOCAL_TASK or _STOLEN_TASK.
+      item (task_graph.TaskWrapper|tuple): A task wrapper for main process and
+        local tasks, an (owner process index, task id, task) tuple for stolen
+        tasks.
+    """
+    if kind == _MAIN_TASK:
+      self._run_main_task(item)
+    elif kind == _LOCAL_TASK:
+      task_output = _execute_task(item.task, self._task_status_queue)
+      self._forward_exit_code_messages(task_output)
+      self._push_local_tasks(
+          self._local_graph.update_from_executed_task(item, task_output)
+      )
+    else:
+      owner_process_index, task_id, task_object = item
+      task_output = _execute_task(task_object, self._task_status_queue)
+      self._forward_exit_code_messages(task_output)
+      self._inbox_queues[owner_process_index].put((task_id, task_output))
+
+  def _work(self):
+    """Runs tasks from the local deque until shutdown."""
+    while True:
+      with self._condition:
+        self._idle_threads += 1
+        self._condition.notify_all()
+        while not (self._tasks or self._shutting_down):
+          self._condition.wait()
+        self._idle_threads -= 1
+        if not self._tasks:
+          break
+        kind, item = self._tasks.pop()
+
+      self._idle_thread_count.acquire()
+      try:
+        self._run(kind, item)
+      finally:
+        self._idle_thread_count.release()
+      self._offer_surplus_task()
+
+  def run(self):
+    """Starts the threads of the process and waits for shutdown."""
+    worker_threads = [
+        threading.Thread(target=crash_handling.CrashManager(self._work))
+        for _ in range(self._thread_count)
+    ]
+    helper_threads = [
+        threading.Thread(target=crash_handling.CrashManager(self._feed)),
+        threading.Thread(target=crash_handling.CrashManager(self._steal)),
+    ]
+    inbox_thread = threading.Thread(
+        target=crash_handling.CrashManager(self._receive_stolen_task_outputs)
+    )
+    threads = worker_threads + helper_threads + [inbox_thread]
     for thread in threads:
+      thread.start()
+    for thread in worker_threads + helper_threads:
       thread.join()
+    self._inbox_queues[self._process_index].put(_SHUTDOWN)
+    inbox_thread.join()
+
+
+@crash_handling.CrashManager
+def _work_stealing_process_worker(
+    process_index,
+    task_queue,
+    task_output_queue,
+    task_status_queue,
+    thread_count,
+    idle_thread_count,
+    inbox_queues,
+    steal_queue,
+    shared_process_context,
+):
+  """Runs a _WorkStealingScheduler in a child process.
+
+  Args:
+    process_index (int): The index of this process's queue in inbox_queues.
+    task_queue (multiprocessing.Queue): Holds task_graph.TaskWrapper instances.
+    task_output_queue (multiprocessing.Queue): Sends information about completed
+      tasks back to the main process.
+    task_status_queue (multiprocessing.Queue|None): Used by task to report it
+      progress to a central location.
+    thread_count (int): Number of threads the process should spawn.
+    idle_thread_count (multiprocessing.Semaphore): Keeps track of how many
+      threads are busy across processes.
+    inbox_queues (list[multiprocessing.Queue]): Receive the outputs of offered
+      tasks, one per process.
+    steal_queue (multiprocessing.Queue): Holds tasks offered by processes.
+    shared_process_context (SharedProcessContext): Holds values from global
+      state that need to be replicated in child processes.
+  """
+  with shared_process_context:
+    with status_message_batcher.batching_status_queue(
+        task_status_queue
+    ) as task_status_queue:
+      _WorkStealingScheduler(
+          process_index,
+          task_queue,
+          task_output_queue,
+          task_status_queue,
+          thread_count,
+          idle_thread_count,
+          inbox_queues,
+          steal_queue,
+      ).run()
 
 
 @crash_handling.CrashManager
@@ -356,7 +674,9 @@ def _process_factory(
     idle_thread_count,
     signal_queue,
     shared_process_context,
-    stack_trace_file_path
+    stack_trace_file_path,
+    inbox_queues=None,
+    steal_queue=None,
 ):
   """Create worker processes.
 
@@ -378,32 +698,54 @@ def _process_factory(
     shared_process_context (SharedProcessContext): Holds values from global
       state that need to be replicated in child processes.
     stack_trace_file_path (str): File path to write stack traces to.
+    inbox_queues (list[multiprocessing.Queue]|None): If not None, workers are
+      _WorkStealingScheduler processes, and each gets one of these queues.
+    steal_queue (multiprocessing.Queue|None): Shared by work stealing workers.
   """
+  work_stealing = inbox_queues is not None
   processes = []
   while True:
     # We receive one signal message for each process to be created.
     signal = signal_queue.get()
     if signal == _SHUTDOWN:
+      # Work stealing processes take main process tasks on a single thread.
+      shutdown_count_per_process = 1 if work_stealing else thread_count
       for _ in processes:
-        for _ in range(thread_count):
+        for _ in range(shutdown_count_per_process):
           task_queue.put(_SHUTDOWN)
       break
     elif signal == _CREATE_WORKER_PROCESS:
       for _ in range(thread_count):
         idle_thread_count.release()
 
-      process = multiprocessing_context.Process(
-          target=_process_worker,
-          args=(
-              task_queue,
-              task_output_queue,
-              task_status_queue,
-              thread_count,
-              idle_thread_count,
-              shared_process_context,
-              stack_trace_file_path,
-          ),
-      )
+      if work_stealing:
+        process = multiprocessing_context.Process(
+            target=_work_stealing_process_worker,
+            args=(
+                len(processes),
+                task_queue,
+                task_output_queue,
+                task_status_queue,
+                thread_count,
+                idle_thread_count,
+                inbox_queues,
+                steal_queue,
+                shared_process_context,
+            ),
+        )
+      else:
+        process = multiprocessing_context.Process(
+            target=_process_worker,
+            args=(
+                task_queue,
+                task_output_queue,
+                task_status_queue,
+                thread_count,
+                idle_thread_count,
+                shared_process_context,
+                stack_trace_file_path,
+            ),
+        )
       processes.append(process)
       log.debug('Adding 1 process with {} threads.'
                 ' Total processes: {}. Total threads: {}.'.format(
@@ -508,6 +850,22 @@ class TaskGraphExecutor:
     # Holds tasks without any dependencies.
     self._executable_tasks = task_buffer.TaskBuffer()
 
+    # With work stealing, worker processes run the tasks returned by tasks
+    # locally. See _WorkStealingScheduler.
+    if properties.VALUES.storage.use_work_stealing_task_executor.GetBool():
+      self._inbox_queues = [
+          multiprocessing_context.Queue()
+          for _ in range(self._max_process_count)
+      ]
+      self._steal_queue = multiprocessing_context.Queue()
+    else:
+      self._inbox_queues = self._steal_queue = None
+
+    # Limits how many tasks run at once if adaptive concurrency is enabled.
+    self._concurrency_controller = concurrency_controller.get_controller(
+        self._max_process_count, self._thread_count
+    )
+
     # For storing exceptions.
     self.thread_exception = None
     self.thread_exception_lock = threading.Lock()
@@ -565,6 +923,11 @@ class TaskGraphExecutor:
         task_wrapper = self._executable_tasks.get()
         if task_wrapper == _SHUTDOWN:
           break
+        if (
+            self._concurrency_controller
+            and not self._concurrency_controller.acquire_slot()
+        ):
+          break
 
       reached_process_limit = self._process_count >= self._max_process_count
 
@@ -595,6 +958,15 @@ class TaskGraphExecutor:
             if message.topic == task.Topic.FATAL_ERROR:
               self._accepting_new_tasks = False
 
+      if executed_task_wrapper is None:
+        # Exit code messages of a task run locally by a work stealing process.
+        if self._concurrency_controller:
+          self._concurrency_controller.add_task_output(task_output)
+        continue
+
+      if self._concurrency_controller:
+        self._concurrency_controller.release_slot(task_output)
+
       submittable_tasks = self._task_graph.update_from_executed_task(
           executed_task_wrapper, task_output)
 
@@ -636,7 +1008,9 @@ class TaskGraphExecutor:
             self._idle_thread_count,
             self._signal_queue,
             shared_process_context,
-            self.stack_trace_file_path
+            self.stack_trace_file_path,
+            self._inbox_queues,
+            self._steal_queue,
         ),
     )
 
@@ -645,8 +1019,16 @@ class TaskGraphExecutor:
       worker_process_spawner.start()
       # It is now safe to start the progress_manager thread, since new processes
       # are started by a child process.
+      if self._concurrency_controller:
+        status_message_observer = (
+            self._concurrency_controller.add_status_message
+        )
+      else:
+        status_message_observer = None
       with task_status.progress_manager(
-          self._task_status_queue, self._progress_manager_args
+          self._task_status_queue,
+          self._progress_manager_args,
+          status_message_observer,
       ):
         try:
           self._add_worker_process()
@@ -698,6 +1080,9 @@ class TaskGraphExecutor:
           self._task_output_queue.put(_SHUTDOWN)
 
           handle_task_output_thread.join()
+          if self._concurrency_controller:
+            # No more slots are released, so waiting threads must stop.
+            self._concurrency_controller.shutdown()
           add_executable_tasks_to_queue_thread.join()
         finally:
           # By calling the clean in the finally block, we ensure that the
@@ -726,6 +1111,10 @@ class TaskGraphExecutor:
     # manager since the task queue need to be open for the shutdown logic.
     self._task_queue.close()
     self._task_output_queue.close()
+    if self._steal_queue is not None:
+      for inbox_queue in self._inbox_queues:
+        inbox_queue.close()
+      self._steal_queue.close()
 
     with self.thread_exception_lock:
       if self.thread_exception:
@@ -23,6 +23,7 @@ import collections
 import datetime
 import enum
 import threading
+import time
 
 from googlecloudsdk.command_lib.storage import errors
 from googlecloudsdk.command_lib.storage import manifest_util
@@ -307,6 +308,8 @@ class _FilesAndBytesStatusTracker(_StatusTracker, metrics_util.MetricsReporter):
 
   def stop(self, exc_type, exc_val, exc_tb):
     super(_FilesAndBytesStatusTracker, self).stop(exc_type, exc_val, exc_tb)
+    if self._manifest_manager:
+      self._manifest_manager.close()
 
     if (self._first_operation_time is not None and
         self._last_operation_time is not None and
@@ -320,25 +323,57 @@ class _FilesAndBytesStatusTracker(_StatusTracker, metrics_util.MetricsReporter):
                            self._completed_files)
 
 
-def status_message_handler(task_status_queue, status_tracker):
+def status_message_handler(
+    task_status_queue, status_tracker, status_message_observer=None
+):
   """Thread method for submiting items from queue to tracker for processing."""
   unhandled_message_exists = False
+  start_time = time.time()
+  # For reporting how many queue transfers batching saved.
+  received_item_count = 0
+  sent_message_count = 0
 
   while True:
     status_message = task_status_queue.get()
     if status_message == '_SHUTDOWN':
       break
-    if status_tracker:
-      status_tracker.add_message(status_message)
+    received_item_count += 1
+    if isinstance(status_message, thread_messages.StatusMessageBatch):
+      sent_message_count += status_message.sent_message_count
+      status_messages = status_message.messages
     else:
-      unhandled_message_exists = True
+      sent_message_count += 1
+      status_messages = (status_message,)
+
+    for message in status_messages:
+      if status_message_observer:
+        status_message_observer(message)
+      if status_tracker:
+        status_tracker.add_message(message)
+      else:
+        unhandled_message_exists = True
+
+  if sent_message_count > received_item_count:
+    time_delta = max(time.time() - start_time, 0.001)
+    log.debug(
+        'Received {} status messages in {} queue items, saving {:.1f} queue'
+        ' items/s.'.format(
+            sent_message_count,
+            received_item_count,
+            (sent_message_count - received_item_count) / time_delta,
+        )
+    )
 
   if unhandled_message_exists:
     log.warning('Status message submitted to task_status_queue without a'
                 ' manager to print it.')
 
 
-def progress_manager(task_status_queue=None, progress_manager_args=None):
+def progress_manager(
+    task_status_queue=None,
+    progress_manager_args=None,
+    status_message_observer=None,
+):
   """Factory function that returns a ProgressManager instance.
 
   Args:
@@ -346,12 +381,16 @@ def progress_manager(task_status_queue=None, progress_manager_args=None):
       progress messages here.
     progress_manager_args (ProgressManagerArgs|None): Determines what type of
       progress indicator to display.
+    status_message_observer (Callable|None): Called with every status message
+      before it is passed to the status tracker.
 
   Returns:
     An instance of _ProgressManager or _NoOpProgressManager.
   """
   if task_status_queue is not None:
-    return _ProgressManager(task_status_queue, progress_manager_args)
+    return _ProgressManager(
+        task_status_queue, progress_manager_args, status_message_observer
+    )
   else:
     return _NoOpProgressManager()
 
@@ -363,7 +402,12 @@ class _ProgressManager:
   processes (if any) are started to prevent deadlock.
   """
 
-  def __init__(self, task_status_queue, progress_manager_args=None):
+  def __init__(
+      self,
+      task_status_queue,
+      progress_manager_args=None,
+      status_message_observer=None,
+  ):
     """Initializes context manager.
 
     Args:
@@ -371,8 +415,11 @@ class _ProgressManager:
         messages here.
       progress_manager_args (ProgressManagerArgs|None): Determines what type of
         progress indicator to display.
+      status_message_observer (Callable|None): Called with every status
+        message before it is passed to the status tracker.
     """
     self._progress_manager_args = progress_manager_args
+    self._status_message_observer = status_message_observer
     self._status_message_handler_thread = None
     self._status_tracker = None
     self._task_status_queue = task_status_queue
@@ -388,7 +435,12 @@ class _ProgressManager:
 
     self._status_message_handler_thread = threading.Thread(
         target=status_message_handler,
-        args=(self._task_status_queue, self._status_tracker))
+        args=(
+            self._task_status_queue,
+            self._status_tracker,
+            self._status_message_observer,
+        ),
+    )
     self._status_message_handler_thread.start()
 
     if self._status_tracker:
@@ -221,3 +221,36 @@ class WorkloadEstimatorMessage(ThreadMessage):
         class_name=self.__class__.__name__,
         item_count=self.item_count,
         size=self.size)
+
+
+class StatusMessageBatch(ThreadMessage):
+  """Message class for sending several messages from a worker at once.
+
+  Attributes:
+    messages (list[ThreadMessage]): Messages in the order they were sent.
+    sent_message_count (int): Number of messages tasks sent to make up this
+      batch, including progress updates combined into later ones.
+  """
+
+  def __init__(self, messages, sent_message_count):
+    # pylint:disable=g-doc-args
+    """Initializes StatusMessageBatch. Args in attributes docstring."""
+    # pylint:enable=g-doc-args
+    self.messages = messages
+    self.sent_message_count = sent_message_count
+
+  def __eq__(self, other):
+    if not isinstance(other, self.__class__):
+      return NotImplemented
+    return self.__dict__ == other.__dict__
+
+  def __repr__(self):
+    """Returns a string with a valid constructor for this message."""
+    return (
+        '{class_name}(messages={messages},'
+        ' sent_message_count={sent_message_count})'
+    ).format(
+        class_name=self.__class__.__name__,
+        messages=self.messages,
+        sent_message_count=self.sent_message_count,
+    )
@@ -20,6 +20,7 @@ from __future__ import unicode_literals
 
 import collections
 import enum
+import glob
 import hashlib
 import json
 import os
@@ -27,6 +28,7 @@ import re
 
 from googlecloudsdk.command_lib.storage import encryption_util
 from googlecloudsdk.command_lib.storage import errors
+from googlecloudsdk.command_lib.storage import tracker_journal
 from googlecloudsdk.core import log
 from googlecloudsdk.core import properties
 from googlecloudsdk.core.util import files
@@ -80,6 +82,35 @@ def _get_unwritable_tracker_file_error(error, tracker_file_path):
       ).format(tracker_file_path, original_error_text))
 
 
+def _read_tracker_file(tracker_file_path):
+  """Returns the contents of a tracker file or None if it does not exist.
+
+  Reads from the tracker journal instead if it is enabled.
+
+  Args:
+    tracker_file_path (str): The path to the tracker file.
+
+  Returns:
+    The tracker file contents (str) or None.
+  """
+  journal = tracker_journal.get_journal()
+  if journal:
+    return journal.read(tracker_file_path)
+  try:
+    with files.FileReader(tracker_file_path) as tracker_file:
+      return tracker_file.read()
+  except files.MissingFileError:
+    return None
+
+
+def get_tracker_file_paths_with_prefix(tracker_file_path_prefix):
+  """Returns paths of existing tracker files that start with a prefix."""
+  journal = tracker_journal.get_journal()
+  if journal:
+    return journal.get_paths_with_prefix(tracker_file_path_prefix)
+  return glob.glob(tracker_file_path_prefix + '*')
+
+
 def _create_tracker_directory_if_needed():
   """Looks up or creates the gcloud storage tracker file directory.
 
@@ -276,15 +307,10 @@ def _get_sliced_download_tracker_file_paths(destination_url):
       destination_url, TrackerFileType.SLICED_DOWNLOAD)
   tracker_file_paths = [parallel_tracker_file_path]
 
-  tracker_file = None
-  try:
-    tracker_file = files.FileReader(parallel_tracker_file_path)
-    total_components = json.load(tracker_file)['total_components']
-  except files.MissingFileError:
+  tracker_data = _read_tracker_file(parallel_tracker_file_path)
+  if tracker_data is None:
     return tracker_file_paths
-  finally:
-    if tracker_file:
-      tracker_file.close()
+  total_components = json.loads(tracker_data)['total_components']
 
   for i in range(total_components):
     tracker_file_paths.append(
@@ -298,7 +324,12 @@ def _get_sliced_download_tracker_file_paths(destination_url):
 
 def delete_tracker_file(tracker_file_path):
   """Deletes tracker file if it exists."""
-  if tracker_file_path and os.path.exists(tracker_file_path):
+  if not tracker_file_path:
+    return
+  journal = tracker_journal.get_journal()
+  if journal:
+    journal.delete(tracker_file_path)
+  elif os.path.exists(tracker_file_path):
     os.remove(tracker_file_path)
 
 
@@ -389,6 +420,10 @@ def hash_gcs_rewrite_parameters_for_tracker_file(source_object_resource,
 def _write_tracker_file(tracker_file_path, data):
   """Creates a tracker file, storing the input data."""
   log.debug('Writing tracker file to {}.'.format(tracker_file_path))
+  journal = tracker_journal.get_journal()
+  if journal:
+    journal.write(tracker_file_path, data)
+    return
   try:
     file_descriptor = os.open(tracker_file_path,
                               os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
@@ -502,11 +537,10 @@ def write_rewrite_tracker_file(tracker_file_name, rewrite_parameters_hash,
 
 def _read_namedtuple_from_json_file(named_tuple_class, tracker_file_path):
   """Returns an instance of named_tuple_class with data at tracker_file_path."""
-  if not os.path.exists(tracker_file_path):
+  tracker_data = _read_tracker_file(tracker_file_path)
+  if tracker_data is None:
     return None
-  with files.FileReader(tracker_file_path) as tracker_file:
-    tracker_dict = json.load(tracker_file)
-    return named_tuple_class(**tracker_dict)
+  return named_tuple_class(**json.loads(tracker_data))
 
 
 def read_composite_upload_tracker_file(tracker_file_path):
@@ -588,17 +622,16 @@ def read_or_create_download_tracker_file(source_object_resource,
   tracker_file_path = get_tracker_file_path(
       destination_url, tracker_file_type, component_number=component_number)
   log.debug('Searching for tracker file at {}.'.format(tracker_file_path))
-  tracker_file = None
+  tracker_data = _read_tracker_file(tracker_file_path)
   does_tracker_file_match = False
   # Check to see if we already have a matching tracker file.
-  try:
-    tracker_file = files.FileReader(tracker_file_path)
+  if tracker_data is not None:
     if tracker_file_type is TrackerFileType.DOWNLOAD:
-      etag_value = tracker_file.readline().rstrip('\n')
+      etag_value = tracker_data.split('\n', 1)[0]
       if etag_value == source_object_resource.etag:
         does_tracker_file_match = True
     else:
-      component_data = json.loads(tracker_file.read())
+      component_data = json.loads(tracker_data)
       if (component_data['etag'] == source_object_resource.etag and
           component_data['generation'] == source_object_resource.generation):
         if (tracker_file_type is TrackerFileType.SLICED_DOWNLOAD and
@@ -612,15 +645,7 @@ def read_or_create_download_tracker_file(source_object_resource,
       log.debug('Found tracker file for {}.'.format(download_name_for_logger))
       return tracker_file_path, True
 
-  except files.MissingFileError:
-    # Cannot read from file.
-    pass
-
-  finally:
-    if tracker_file:
-      tracker_file.close()
-
-  if tracker_file:
+  if tracker_data is not None:
     # The tracker file exists, but it's not valid.
     delete_download_tracker_files(destination_url)
 
@@ -652,12 +677,10 @@ def get_rewrite_token_from_tracker_file(tracker_file_path,
   Returns:
     String token for resuming rewrites if a matching tracker file exists.
   """
-  if not os.path.exists(tracker_file_path):
+  tracker_data = _read_tracker_file(tracker_file_path)
+  if tracker_data is None:
     return None
-  with files.FileReader(tracker_file_path) as tracker_file:
-    existing_hash, rewrite_token = [
-        line.rstrip('\n') for line in tracker_file.readlines()
-    ]
-    if existing_hash == rewrite_parameters_hash:
-      return rewrite_token
+  existing_hash, rewrite_token = tracker_data.splitlines()
+  if existing_hash == rewrite_parameters_hash:
+    return rewrite_token
   return None
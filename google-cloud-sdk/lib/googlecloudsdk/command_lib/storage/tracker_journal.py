@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Journal of tracker data for resumable storage operations.
+
+With the storage/use_tracker_journal property set, tracker_file_util stores the
+contents of tracker files in an SQLite database in the tracker files directory,
+keyed on the tracker file path it would otherwise write. Copying many files
+then updates rows of one file instead of creating and deleting a file per
+operation.
+
+The database runs in WAL mode with synchronous=NORMAL: every write commits, so
+worker processes see each other's entries right away, and SQLite syncs the
+log to disk in batches at checkpoints. A process crash loses nothing, and an
+operating system crash loses at most the writes since the last checkpoint,
+which restarts those operations instead of resuming them.
+
+Entries not updated for storage/tracker_journal_max_age_days are deleted when
+the journal is opened, or with:
+
+  python -m googlecloudsdk.command_lib.storage.tracker_journal gc
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+from googlecloudsdk.core import properties
+from googlecloudsdk.core.util import files
+
+_JOURNAL_FILE_NAME = 'tracker_journal.db'
+_SECONDS_PER_DAY = 24 * 60 * 60
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS trackers ('
+    ' path TEXT PRIMARY KEY,'
+    ' data TEXT NOT NULL,'
+    ' updated REAL NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS trackers_updated ON trackers (updated)',
+)
+
+_lock = threading.Lock()
+# Connections cannot be shared with forked processes, so the journal is only
+# reused by the process that opened it.
+_journal = None
+_journal_pid = None
+
+
+class TrackerJournal(object):
+  """SQLite backed map of tracker file paths to their contents.
+
+  Methods are thread safe.
+  """
+
+  def __init__(self, journal_path):
+    self.journal_path = journal_path
+    self._connection = sqlite3.connect(
+        journal_path, timeout=60, check_same_thread=False
+    )
+    self._connection.execute('PRAGMA journal_mode=WAL')
+    self._connection.execute('PRAGMA synchronous=NORMAL')
+    for statement in _SCHEMA:
+      self._connection.execute(statement)
+    self._connection.commit()
+    self._lock = threading.Lock()
+
+  def read(self, path):
+    """Returns the data stored for path or None."""
+    with self._lock:
+      row = self._connection.execute(
+          'SELECT data FROM trackers WHERE path = ?', (path,)
+      ).fetchone()
+    return row[0] if row else None
+
+  def write(self, path, data):
+    with self._lock:
+      self._connection.execute(
+          'INSERT OR REPLACE INTO trackers VALUES (?, ?, ?)',
+          (path, data, time.time()),
+      )
+      self._connection.commit()
+
+  def delete(self, path):
+    with self._lock:
+      self._connection.execute('DELETE FROM trackers WHERE path = ?', (path,))
+      self._connection.commit()
+
+  def get_paths_with_prefix(self, prefix):
+    """Returns the stored paths that start with prefix."""
+    with self._lock:
+      # Compared as a range since LIKE treats _ in paths as a wildcard.
+      rows = self._connection.execute(
+          'SELECT path FROM trackers WHERE path >= ? AND path < ?',
+          (prefix, prefix + '\U0010ffff'),
+      ).fetchall()
+    return [row[0] for row in rows]
+
+  def delete_stale_entries(self, max_age_seconds):
+    """Deletes entries older than max_age_seconds and returns their count."""
+    with self._lock:
+      cursor = self._connection.execute(
+          'DELETE FROM trackers WHERE updated < ?',
+          (time.time() - max_age_seconds,),
+      )
+      self._connection.commit()
+    return cursor.rowcount
+
+  def close(self):
+    with self._lock:
+      self._connection.close()
+
+
+def _get_max_age_seconds():
+  return (
+      properties.VALUES.storage.tracker_journal_max_age_days.GetInt()
+      * _SECONDS_PER_DAY
+  )
+
+
+def _open_journal():
+  tracker_directory = properties.VALUES.storage.tracker_files_directory.Get()
+  files.MakeDir(tracker_directory)
+  return TrackerJournal(os.path.join(tracker_directory, _JOURNAL_FILE_NAME))
+
+
+def get_journal():
+  """Returns the journal of this process or None if it is not enabled."""
+  global _journal, _journal_pid
+  if not properties.VALUES.storage.use_tracker_journal.GetBool():
+    return None
+  with _lock:
+    if _journal is None or _journal_pid != os.getpid():
+      _journal = _open_journal()
+      _journal_pid = os.getpid()
+      _journal.delete_stale_entries(_get_max_age_seconds())
+    return _journal
+
+
+def main(argv=None):
+  argv = sys.argv[1:] if argv is None else argv
+  if argv != ['gc']:
+    sys.stderr.write('usage: {} gc\n'.format(__name__))
+    return 2
+  journal = _open_journal()
+  try:
+    removed = journal.delete_stale_entries(_get_max_age_seconds())
+  finally:
+    journal.close()
+  sys.stdout.write('Removed {} stale entries from {}.\n'.format(
+      removed, journal.journal_path))
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -34,6 +34,7 @@ from googlecloudsdk.api_lib.storage import errors as api_errors
 from googlecloudsdk.api_lib.storage import request_config_factory
 from googlecloudsdk.command_lib.storage import errors as command_errors
 from googlecloudsdk.command_lib.storage import folder_util
+from googlecloudsdk.command_lib.storage import parallel_list_util
 from googlecloudsdk.command_lib.storage import storage_url
 from googlecloudsdk.command_lib.storage.resources import resource_reference
 from googlecloudsdk.core import log
@@ -672,17 +673,27 @@ class CloudWildcardIterator(WildcardIterator):
 
       # TODO(b/299973762): Allow the list_objects API method to only yield
       # prefixes if we want managed folders without objects.
-      object_iterator = self._client.list_objects(
-          bucket_name=bucket_name,
-          delimiter=wildcard_parts.delimiter,
-          fields_scope=self._fields_scope,
-          halt_on_empty_response=self._halt_on_empty_response,
-          include_folders_as_prefixes=include_folders_as_prefixes,
-          next_page_token=self._next_page_token,
-          prefix=wildcard_parts.prefix or None,
-          object_state=self._object_state_for_listing,
-          list_filter=self._list_filter,
-      )
+      if self._can_list_in_parallel(wildcard_parts):
+        object_iterator = parallel_list_util.list_objects(
+            self._url.scheme,
+            bucket_name,
+            prefix=wildcard_parts.prefix or None,
+            fields_scope=self._fields_scope,
+            halt_on_empty_response=self._halt_on_empty_response,
+            list_filter=self._list_filter,
+        )
+      else:
+        object_iterator = self._client.list_objects(
+            bucket_name=bucket_name,
+            delimiter=wildcard_parts.delimiter,
+            fields_scope=self._fields_scope,
+            halt_on_empty_response=self._halt_on_empty_response,
+            include_folders_as_prefixes=include_folders_as_prefixes,
+            next_page_token=self._next_page_token,
+            prefix=wildcard_parts.prefix or None,
+            object_state=self._object_state_for_listing,
+            list_filter=self._list_filter,
+        )
     else:
       object_iterator = []
 
@@ -701,6 +712,27 @@ class CloudWildcardIterator(WildcardIterator):
         key=lambda resource: resource.storage_url.url_string,
     )
 
+  def _can_list_in_parallel(self, wildcard_parts):
+    """Returns True if the objects of wildcard_parts can be listed in shards.
+
+    Sharded listing restarts after the last listed name, so it is limited to
+    recursive listings of live objects, and it can't resume from a page token.
+
+    Args:
+      wildcard_parts (CloudWildcardParts): The expansion being listed.
+
+    Returns:
+      bool: True if the storage/parallel_listing_threads property enables
+        sharded listing and the listing supports it.
+    """
+    return (
+        wildcard_parts.delimiter is None
+        and self._next_page_token is None
+        and self._object_state_for_listing is cloud_api.ObjectState.LIVE
+        and cloud_api.Capability.LIST_OFFSETS in self._client.capabilities
+        and parallel_list_util.get_parallel_listing_threads() > 1
+    )
+
   def _maybe_convert_prefix_to_managed_folder(self, resource):
     """If resource is a prefix, attempts to convert it to a managed folder."""
     if (
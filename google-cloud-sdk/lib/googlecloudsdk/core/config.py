@@ -653,6 +653,11 @@ class Paths(object):
     """Gets the dir path that will contain all cache objects."""
     return os.path.join(self.global_config_dir, 'cache')
 
+  @property
+  def command_index_dir(self):
+    """Gets the dir path that will contain the persistent command tree index."""
+    return os.path.join(self.cache_dir, 'command_index')
+
   @property
   def credentials_db_path(self):
     """Gets the path to the file to store credentials in.
@@ -28,6 +28,7 @@ from googlecloudsdk.core import exceptions
 from googlecloudsdk.core.configurations import properties_file
 from googlecloudsdk.core.util import encoding
 from googlecloudsdk.core.util import files as file_utils
+from googlecloudsdk.core.util import startup_profiler
 
 # The special configuration named NONE contains no properties
 _NO_ACTIVE_CONFIG_NAME = 'NONE'
@@ -444,9 +445,10 @@ class ActivePropertiesFile(object):
     ActivePropertiesFile._LOCK.acquire()
     try:
       if not ActivePropertiesFile._PROPERTIES:
-        ActivePropertiesFile._PROPERTIES = properties_file.PropertiesFile(
-            [config.Paths().installation_properties_path, ActiveConfig(
-                force_create=False).file_path])
+        with startup_profiler.Phase('properties'):
+          ActivePropertiesFile._PROPERTIES = properties_file.PropertiesFile(
+              [config.Paths().installation_properties_path, ActiveConfig(
+                  force_create=False).file_path])
     finally:
       ActivePropertiesFile._LOCK.release()
     return ActivePropertiesFile._PROPERTIES
@@ -27,6 +27,7 @@ from __future__ import unicode_literals
 
 from googlecloudsdk.api_lib.iamcredentials import util as iamcred_util
 from googlecloudsdk.core.credentials import store
+from googlecloudsdk.core.util import startup_profiler
 
 
 class CredentialProvidersManager(object):
@@ -43,15 +44,16 @@ class CredentialProvidersManager(object):
 
   def __enter__(self):
     """Registers sources for credentials and project for use by commands."""
-    self._credential_providers = self._credential_providers or [
-        store.GceCredentialProvider(),
-    ]
-    for provider in self._credential_providers:
-      provider.Register()
+    with startup_profiler.Phase('credential_providers'):
+      self._credential_providers = self._credential_providers or [
+          store.GceCredentialProvider(),
+      ]
+      for provider in self._credential_providers:
+        provider.Register()
 
-    # Register support for service account impersonation.
-    store.IMPERSONATION_TOKEN_PROVIDER = (
-        iamcred_util.ImpersonationAccessTokenProvider())
+      # Register support for service account impersonation.
+      store.IMPERSONATION_TOKEN_PROVIDER = (
+          iamcred_util.ImpersonationAccessTokenProvider())
     return self
 
   def __exit__(self, exc_type, exc_value, exc_traceback):
@@ -2049,6 +2049,45 @@ class _SectionCompute(_Section):
         default=False,
         help_text='Bool that force all requests are sent as batch request',
         hidden=True)
+    self.batch_concurrency = self._Add(
+        'batch_concurrency',
+        validator=_IntegerValidator,
+        help_text=(
+            'The maximum number of batch requests sent concurrently. When set '
+            'to more than 1, large request sets are split into that many '
+            'batches, throttled requests are retried individually and the '
+            'concurrency backs off while the API responds with 429 or 503.'
+        ),
+        hidden=True)
+    self.list_concurrency = self._Add(
+        'list_concurrency',
+        validator=_IntegerValidator,
+        help_text=(
+            'The maximum number of list pages fetched concurrently. When set '
+            'to more than 1, every project and scope of a list command is '
+            'paged independently on that many threads instead of in batch '
+            'request rounds, and results are printed as pages arrive.'
+        ),
+        hidden=True)
+    self.list_unordered = self._AddBool(
+        'list_unordered',
+        default=False,
+        help_text=(
+            'If True, concurrently listed pages are returned as soon as they '
+            'arrive instead of in project, page and scope order.'
+        ),
+        hidden=True)
+    self.operations_list_threshold = self._Add(
+        'operations_list_threshold',
+        default=0,
+        validator=_IntegerValidator,
+        help_text=(
+            'If set, the minimum number of pending operations in one zone, '
+            'region or global scope that are polled with a single filtered '
+            'list request instead of one wait request each. By default (0) '
+            'each operation is polled individually.'
+        ),
+        hidden=True)
     self.allow_partial_error = self._AddBool(
         'allow_partial_error',
         default=True,
@@ -2476,6 +2515,15 @@ class _SectionCore(_Section):
         help_text='If True, `gcloud` will not store logs to a file. This may '
         'be useful if disk space is limited.')
 
+    self.enable_command_index = self._AddBool(
+        'enable_command_index',
+        default=False,
+        help_text='If True, `gcloud` will keep a persistent index of its '
+        'command tree in the cache directory and consult it at startup instead '
+        'of listing the command directories on every invocation. The index is '
+        'invalidated automatically when components are installed, updated or '
+        'removed.')
+
     self.parse_error_details = self._Add(
         'parse_error_details',
         help_text=(
@@ -3794,6 +3842,82 @@ class _SectionStorage(_Section):
         help_text='Target size and upper bound for files to be sliced into.'
         ' Analogous to parallel_composite_upload_component_size.')
 
+    self.parallel_hashing_thread_count = self._Add(
+        'parallel_hashing_thread_count',
+        validator=_IntegerValidator,
+        default=4,
+        hidden=True,
+        help_text=(
+            'The number of threads used to calculate the CRC32C hash of large'
+            ' local files, for example to validate resumed downloads or to'
+            ' compare files in rsync. Requires the google-crc32c C extension.'
+            ' Set to 1 to hash files on a single thread.'
+        ),
+    )
+
+    self.parallel_gzip_thread_count = self._Add(
+        'parallel_gzip_thread_count',
+        validator=_IntegerValidator,
+        default=4,
+        hidden=True,
+        help_text=(
+            'The number of threads used to compress each file uploaded with'
+            ' gzip content encoding. Set to 1 to compress files on a single'
+            ' thread.'
+        ),
+    )
+
+    self.streaming_download_thread_count = self._Add(
+        'streaming_download_thread_count',
+        default=1,
+        hidden=True,
+        validator=_IntegerValidator,
+        help_text=(
+            'The number of byte ranges fetched at once when an object is'
+            ' streamed to stdout or a pipe, for example by `gcloud storage'
+            ' cat`. Ranges are written in order. Set to 1 to stream objects'
+            ' over a single connection.'
+        ),
+    )
+
+    self.streaming_download_buffer_size = self._Add(
+        'streaming_download_buffer_size',
+        default='256Mi',
+        hidden=True,
+        validator=_HumanReadableByteAmountValidator,
+        help_text=(
+            'The approximate memory used to hold byte ranges fetched ahead of'
+            ' the data being written when streaming_download_thread_count is'
+            ' greater than 1.'
+        ),
+    )
+
+    self.parallel_streaming_upload_thread_count = self._Add(
+        'parallel_streaming_upload_thread_count',
+        default=1,
+        hidden=True,
+        validator=_IntegerValidator,
+        help_text=(
+            'The number of parts uploaded at once when uploading from stdin'
+            ' or a named pipe. If greater than 1, the stream is split into'
+            ' parts of parallel_composite_upload_component_size held in'
+            ' memory, which are uploaded as temporary objects and composed.'
+            ' Ignored if parallel_composite_upload_enabled is False.'
+        ),
+    )
+
+    self.stream_gzip_local_uploads = self._AddBool(
+        'stream_gzip_local_uploads',
+        default=False,
+        hidden=True,
+        help_text=(
+            'If True, files uploaded with gzip content encoding are compressed'
+            ' while they are uploaded instead of being written to a temporary'
+            ' file first. These uploads cannot be resumed in a later run or'
+            ' split into parallel composite uploads.'
+        ),
+    )
+
     self.sliced_object_download_max_components = self._Add(
         'sliced_object_download_max_components',
         help_text='Specifies the maximum number of slices to be used when'
@@ -3812,6 +3936,79 @@ class _SectionStorage(_Section):
         'process. When process_count and thread_count are both 1, commands use '
         'sequential execution.')
 
+    self.use_adaptive_concurrency = self._AddBool(
+        'use_adaptive_concurrency',
+        default=False,
+        hidden=True,
+        help_text=(
+            'If True, parallel storage commands start with the threads of one'
+            ' process and grow or shrink the number of tasks running at once'
+            ' based on measured throughput and errors, up to process_count'
+            ' times thread_count.'
+        ),
+    )
+
+    self.adaptive_concurrency_interval = self._Add(
+        'adaptive_concurrency_interval',
+        default=3,
+        hidden=True,
+        validator=_IntegerValidator,
+        help_text=(
+            'The number of seconds of throughput measured by the adaptive'
+            ' concurrency controller before each adjustment.'
+        ),
+    )
+
+    self.adaptive_concurrency_log_file = self._Add(
+        'adaptive_concurrency_log_file',
+        hidden=True,
+        help_text=(
+            'If set, the adaptive concurrency controller appends each of its'
+            ' decisions to this file as a line of JSON, for offline tuning.'
+        ),
+    )
+
+    self.status_message_batch_interval_ms = self._Add(
+        'status_message_batch_interval_ms',
+        default=100,
+        hidden=True,
+        validator=_IntegerValidator,
+        help_text=(
+            'The number of milliseconds worker processes of parallel storage'
+            ' commands collect progress and status messages before sending'
+            ' them to the main process in one batch. Progress updates for the'
+            ' same file collected in that time are combined. Set to 0 to send'
+            ' every message right away.'
+        ),
+    )
+    self.object_request_batch_size = self._Add(
+        'object_request_batch_size',
+        default=1,
+        hidden=True,
+        validator=_IntegerValidator,
+        help_text=(
+            'If greater than 1, storage commands that delete objects or update'
+            ' their metadata combine up to this many consecutive objects into'
+            ' one task. For APIs that support batch requests, such as the'
+            ' Cloud Storage JSON API, the task sends its calls in batch'
+            ' requests of up to 100 calls, and failed calls are reported for'
+            ' each object. This also applies to rsync and to deleting the'
+            ' temporary components of parallel streaming uploads.'
+        ),
+    )
+
+    self.parallel_listing_threads = self._Add(
+        'parallel_listing_threads',
+        validator=_IntegerValidator,
+        hidden=True,
+        help_text=(
+            'The number of threads that list a recursively expanded prefix'
+            ' of a Cloud Storage bucket concurrently. When set to more than'
+            ' 1, the prefix is split into key ranges that are listed in'
+            ' parallel and merged back in name order.'
+        ),
+    )
+
     self.parallel_composite_upload_component_prefix = self._Add(
         'parallel_composite_upload_component_prefix',
         default=(
@@ -3924,6 +4121,42 @@ class _SectionStorage(_Section):
         ),
     )
 
+    self.rsync_sort_processes = self._Add(
+        'rsync_sort_processes',
+        validator=_IntegerValidator,
+        default=0,
+        hidden=True,
+        help_text=(
+            'Number of processes the rsync command uses to sort chunks of'
+            ' the list of files while it keeps listing. If 0, chunks are'
+            ' sorted by the listing task itself.'
+        ),
+    )
+
+    self.use_rsync_file_index = self._AddBool(
+        'use_rsync_file_index',
+        default=False,
+        hidden=True,
+        help_text=(
+            'If True, rsync stores the hashes of local files in an index in'
+            ' the rsync_files_directory and reuses them while the file size,'
+            ' inode and modification time are unchanged, instead of reading'
+            ' the files again.'
+        ),
+    )
+
+    self.use_work_stealing_task_executor = self._AddBool(
+        'use_work_stealing_task_executor',
+        default=False,
+        hidden=True,
+        help_text=(
+            'If True, worker processes of parallel storage commands run the'
+            ' tasks created by their tasks themselves, and idle processes take'
+            ' queued tasks from busy ones. This reduces the work of the main'
+            ' process for workloads with many small tasks.'
+        ),
+    )
+
     self.use_url_based_rsync_sorting = self._AddBool(
         'use_url_based_rsync_sorting',
         default=False,
@@ -3981,6 +4214,31 @@ class _SectionStorage(_Section):
         help_text='Directory path to tracker files for resumable operations.',
     )
 
+    self.use_tracker_journal = self._AddBool(
+        'use_tracker_journal',
+        default=False,
+        hidden=True,
+        help_text=(
+            'If True, resumable operations keep their tracker data in a'
+            ' single SQLite journal in tracker_files_directory instead of one'
+            ' file per operation. This avoids creating and deleting many small'
+            ' files, which is slow on network file systems. Operations'
+            ' started with the other setting are not resumed.'
+        ),
+    )
+
+    self.tracker_journal_max_age_days = self._Add(
+        'tracker_journal_max_age_days',
+        default=7,
+        hidden=True,
+        validator=_IntegerValidator,
+        help_text=(
+            'Entries of the tracker journal that were not updated for this'
+            ' many days are deleted, since their operations are unlikely to'
+            ' be resumed.'
+        ),
+    )
+
     self.use_gcloud_crc32c = self._AddBool(
         'use_gcloud_crc32c',
         default=None,
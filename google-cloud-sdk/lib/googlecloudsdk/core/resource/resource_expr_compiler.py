@@ -0,0 +1,418 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compiles resource_expr expression trees into Python closures.
+
+The resource_expr backend produces a tree of node objects that is interpreted
+for every resource: each node dispatches to its children through method calls
+and each term resolves its key with the general purpose resource_property.Get.
+Compile() flattens the tree into nested closures with the logical operators
+inlined and with a specialized getter for each key, which makes client side
+filtering of large resource lists several times cheaper.
+
+The closures call back into the tree nodes for everything with observable
+semantics (term normalization, Apply, transforms, global restrictions), so the
+results are identical to resource_expr Evaluate().
+
+Usage:
+
+  expr = resource_expr_compiler.Compile(expression, defaults=defaults)
+  for resource in resources:
+    if expr.Evaluate(resource):
+      ProcessMatchedResource(resource)
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import re
+
+from googlecloudsdk.core import log
+from googlecloudsdk.core.resource import resource_expr
+from googlecloudsdk.core.resource import resource_filter
+from googlecloudsdk.core.resource import resource_lex
+from googlecloudsdk.core.resource import resource_property
+from googlecloudsdk.core.util import times
+
+import six
+
+# Key getters are pure functions of the key, so they are shared by every
+# compiled expression.
+_GETTERS = {}
+
+# NormalizeForSearch() of string resource values. Listings repeat the same
+# values (statuses, zones, labels) over and over again.
+_NORMALIZED_TEXT = {}
+_NORMALIZED_TEXT_MAX_SIZE = 10000
+
+_NOT_A_NUMBER = object()
+
+
+def _NormalizeTextForSearch(value):
+  """Returns resource_expr.NormalizeForSearch(value, html=True), cached."""
+  if type(value) is not six.text_type:  # pylint: disable=unidiomatic-typecheck
+    return resource_expr.NormalizeForSearch(value, html=True)
+  text = _NORMALIZED_TEXT.get(value)
+  if text is None:
+    if len(_NORMALIZED_TEXT) >= _NORMALIZED_TEXT_MAX_SIZE:
+      _NORMALIZED_TEXT.clear()
+    text = resource_expr.NormalizeForSearch(value, html=True)
+    _NORMALIZED_TEXT[value] = text
+  return text
+
+
+def _CompileGetter(key):
+  """Returns a function that returns resource_property.Get(obj, key).
+
+  Resources being filtered are almost always serialized dicts. The getter
+  walks dicts directly while every key name is present and defers to the
+  general resource_property.Get() for everything else (objects, list indices,
+  slices, case conversion and metadata lookups).
+
+  Args:
+    key: The parsed key tuple.
+
+  Returns:
+    The getter function.
+  """
+  getter = _GETTERS.get(key)
+  if getter:
+    return getter
+
+  if not all(isinstance(name, six.string_types) for name in key):
+
+    def _GeneralGet(obj):
+      return resource_property.Get(obj, key)
+
+    getter = _GeneralGet
+  elif len(key) == 1:
+    (name,) = key
+
+    def _GetOne(obj):
+      if type(obj) is dict and name in obj:  # pylint: disable=unidiomatic-typecheck
+        return obj[name]
+      if obj is None:
+        return None
+      return resource_property.Get(obj, key)
+
+    getter = _GetOne
+  else:
+
+    def _GetPath(obj):
+      value = obj
+      for name in key:
+        if type(value) is dict and name in value:  # pylint: disable=unidiomatic-typecheck
+          value = value[name]
+        elif value is None:
+          return None
+        else:
+          return resource_property.Get(obj, key)
+      return value
+
+    getter = _GetPath
+
+  _GETTERS[key] = getter
+  return getter
+
+
+class _WordPattern(object):
+  """A resource_expr word match pattern with its operand conversions.
+
+  Attributes:
+    operand: The operand string.
+    standard_regex: The standard match RE.
+    deprecated_regex: The deprecated match RE or None.
+    numeric_operand: The operand converted to a number or _NOT_A_NUMBER.
+    lower_operand: The lower case operand.
+  """
+
+  def __init__(self, pattern):
+    self.operand, self.standard_regex, self.deprecated_regex = pattern
+    try:
+      self.numeric_operand = resource_expr._NumericType(self.operand)  # pylint: disable=protected-access
+    except ValueError:
+      self.numeric_operand = _NOT_A_NUMBER
+    self.lower_operand = self.operand.lower()
+
+
+def _CompileWordMatch(node):
+  """Compiles the Apply() of a resource_expr._ExprWordMatchBase term.
+
+  This mirrors resource_expr._WordMatch() and _MatchOneWordInText(), with the
+  operand conversions done once at compile time and the value normalization
+  cached across resources.
+
+  Args:
+    node: The resource_expr._ExprWordMatchBase term node.
+
+  Returns:
+    The Apply(value, operand) replacement function.
+  """
+  # pylint: disable=protected-access, The node types are private to this
+  # package.
+  backend = node.backend
+  key = node._key
+  op = node._op
+  patterns = [_WordPattern(pattern) for pattern in node._patterns]
+  negate = isinstance(node, resource_expr._ExprNE)
+  match_segment = len(key) == 1 and key[0] in ['zone', 'region']
+  stringize = resource_expr._Stringize
+
+  def _MatchOneWordInText(warned_attribute, value, pattern):
+    operand = pattern.operand
+    if isinstance(value, (int, float)):
+      if (pattern.numeric_operand is not _NOT_A_NUMBER and
+          value == pattern.numeric_operand):
+        return True
+      if value == 0 and pattern.lower_operand == 'false':
+        return True
+      if value == 1 and pattern.lower_operand == 'true':
+        return True
+      # Stringize float with trailing .0's stripped.
+      text = re.sub(r'\.0*$', '', stringize(value))
+    elif value == operand:
+      return True
+    elif value is None:
+      if operand in ('', None):
+        return True
+      if operand == '*' and op == ':':
+        return False
+      text = 'null'
+    elif operand and isinstance(value, times.datetime.datetime):
+      try:
+        tzinfo = times.LOCAL if value.tzinfo else None
+        if value == times.ParseDateTime(operand, tzinfo=tzinfo):
+          return True
+      except (ValueError, times.DateTimeSyntaxError,
+              times.DateTimeValueError):
+        pass
+      text = resource_expr.NormalizeForSearch(value, html=True)
+    else:
+      text = _NormalizeTextForSearch(value)
+
+    matched = bool(pattern.standard_regex.search(text))
+    deprecated_regex = pattern.deprecated_regex
+    if not deprecated_regex:
+      return matched
+
+    deprecated_matched = bool(deprecated_regex.search(text))
+    if match_segment:
+      deprecated_matched |= bool(deprecated_regex.search(text.split('/')[-1]))
+
+    if (matched != deprecated_matched and warned_attribute and
+        not getattr(backend, warned_attribute, False)):
+      setattr(backend, warned_attribute, True)
+      old_match = 'matches' if deprecated_matched else 'does not match'
+      new_match = 'will match' if matched else 'will not match'
+      log.warning('--filter : operator evaluation is changing for '
+                  'consistency across Google APIs.  {key}{op}{operand} '
+                  'currently {old_match} but {new_match} in the near future.  '
+                  'Run `gcloud topic filters` for details.'.format(
+                      key=resource_lex.GetKeyName(key),
+                      op=op,
+                      operand=operand,
+                      old_match=old_match,
+                      new_match=new_match))
+    return deprecated_matched
+
+  def _WordMatch(value, unused_operand):
+    warned_attribute = node._warned_attribute
+    if isinstance(value, dict):
+      # Deprecated match differences are not checked on dicts, as in
+      # resource_expr._WordMatch().
+      warned_attribute = None
+      values = []
+      if value:
+        values.extend(six.iterkeys(value))
+        values.extend(six.itervalues(value))
+    elif isinstance(value, (list, tuple)):
+      values = value
+    else:
+      values = (value,)
+    for v in values:
+      for pattern in patterns:
+        if _MatchOneWordInText(warned_attribute, v, pattern):
+          return not negate
+    return negate
+
+  return _WordMatch
+
+
+def _CompileOperator(node):
+  """Compiles a resource_expr._ExprOperator term.
+
+  This mirrors resource_expr._ExprOperator.Evaluate(). Operand values and the
+  normalization function are read from the node on each call because the first
+  non-empty resource value may switch the term to datetime normalization and
+  re-initialize the operand.
+
+  Args:
+    node: The resource_expr._ExprOperator term node.
+
+  Returns:
+    The term evaluation function.
+  """
+  # pylint: disable=protected-access, The node types are private to this
+  # package.
+  get = _CompileGetter(tuple(node.key))
+  transform = node._transform
+  operand = node._operand
+  if isinstance(node, resource_expr._ExprWordMatchBase):
+    apply = _CompileWordMatch(node)
+  else:
+    apply = node.Apply
+  time_types = node._TIME_TYPES
+  numeric_type = resource_expr._NumericType
+  stringize = resource_expr._Stringize
+  string_types = six.string_types
+  unconverted = object()
+
+  def _Evaluate(obj):
+    value = get(obj)
+    if transform:
+      value = transform.Evaluate(value)
+    # Arbitrary choice: value == []  =>  values = [[]]
+    if value and isinstance(value, (list, tuple)):
+      resource_values = value
+    else:
+      resource_values = (value,)
+    values = []
+    for value in resource_values:
+      if value:
+        try:
+          value = node._normalize(value)
+        except (TypeError, ValueError):
+          pass
+      values.append(value)
+
+    operands = operand.list_value or (operand,)
+
+    for value in values:
+      # The numeric conversion of value is the same for every operand.
+      numeric_value = unconverted
+      for op in operands:
+        if op.numeric_value is not None:
+          try:
+            if numeric_value is unconverted:
+              numeric_value = None
+              numeric_value = numeric_type(value)
+            if numeric_value is None:
+              raise TypeError
+            if apply(numeric_value, op.numeric_value):
+              return True
+            if not op.numeric_constant:
+              continue
+          except (TypeError, ValueError):
+            pass
+
+        if not value and isinstance(op.string_value, time_types):
+          continue
+
+        try:
+          if apply(value, op.string_value):
+            return True
+        except (AttributeError, ValueError):
+          pass
+        except TypeError:
+          if (
+              value is not None
+              and not isinstance(value, (string_types, dict, list))
+              and apply(stringize(value), op.string_value)
+          ):
+            return True
+          if (
+              six.PY3
+              and value is None
+              and apply('', op.string_value)
+          ):
+            return True
+
+    return False
+
+  return _Evaluate
+
+
+def _CompileNode(node):
+  """Recursively compiles a resource_expr expression tree node.
+
+  Args:
+    node: The resource_expr._Expr node.
+
+  Returns:
+    A function of one resource argument that returns the same value as
+    node.Evaluate().
+  """
+  # pylint: disable=protected-access, The node types are private to this
+  # package.
+  if isinstance(node, resource_expr._ExprTRUE):
+    return lambda unused_obj: True
+
+  if isinstance(node, resource_expr._ExprAND):
+    left = _CompileNode(node._left)
+    right = _CompileNode(node._right)
+    return lambda obj: bool(left(obj)) and bool(right(obj))
+
+  if isinstance(node, resource_expr._ExprOR):
+    left = _CompileNode(node._left)
+    right = _CompileNode(node._right)
+    return lambda obj: bool(left(obj)) or bool(right(obj))
+
+  if isinstance(node, resource_expr._ExprNOT):
+    expr = _CompileNode(node._expr)
+    return lambda obj: not expr(obj)
+
+  if isinstance(node, resource_expr._ExprOperator):
+    return _CompileOperator(node)
+
+  # Global restrictions and any other node type are evaluated as is.
+  return node.Evaluate
+
+
+class CompiledExpression(object):
+  """A compiled resource filter expression.
+
+  Attributes:
+    tree: The resource_expr expression tree that was compiled. It is kept so
+      that resource_filter.GetAllKeys() works on compiled expressions.
+    Evaluate: The compiled function. Evaluate(obj) returns True if obj matches
+      the expression.
+  """
+
+  def __init__(self, tree):
+    self.tree = tree
+    self.Evaluate = _CompileNode(tree)  # pylint: disable=invalid-name
+
+  @property
+  def contains_key(self):
+    return False
+
+
+def Compile(expression, defaults=None):
+  """Compiles a resource list filter expression into a closure.
+
+  Only the default resource_expr backend can be compiled. The parsed tree is
+  not shared between calls: terms learn their normalization from the first
+  resource they see, so every caller gets its own tree.
+
+  Args:
+    expression: A resource list filter expression string.
+    defaults: Resource projection defaults (for default symbols and aliases).
+
+  Returns:
+    A CompiledExpression.
+  """
+  return CompiledExpression(
+      resource_filter.Compile(expression, defaults=defaults))
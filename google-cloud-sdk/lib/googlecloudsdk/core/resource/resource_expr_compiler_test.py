@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Differential tests of resource_expr_compiler against resource_expr.
+
+Every expression is evaluated by the interpreted resource_filter tree and by
+the compiled closure on the same pseudo-random resources, in the same order,
+and the results (or the types of the raised exceptions) must be identical.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import random
+import unittest
+
+from googlecloudsdk.core.resource import resource_expr_compiler
+from googlecloudsdk.core.resource import resource_filter
+
+_SEED = 1
+_RESOURCES_PER_EXPRESSION = 300
+
+_VALUES = (
+    None, '', 'RUNNING', 'running', 'us-central1-a', 'zones/us-central1-a',
+    0, 1, 2.0, 10, True, False, '2020-01-01T00:00:00Z',
+    '2021-06-01T12:00:00Z', ['a', 'b'], [], {'env': 'prod', 'x': 'y'}, {},
+    'foo-bar', '10', 'abc*', 'Ünïcode', '<b>html</b>',
+)
+
+_KEYS = ('status', 'zone', 'n', 'labels', 'tags', 'createTime', 'name')
+
+# Expressions covering the operators, value types, logical operators, nested
+# keys and lists of the filter grammar.
+_EXPRESSIONS = (
+    'status=RUNNING',
+    'status:run*',
+    'zone:us-central1-a',
+    'zone=us-central1-a',
+    'zone:(us-central1-a,x)',
+    'n>1',
+    'n<=1',
+    'n=1',
+    'n!=1',
+    'n>=1.5',
+    'n:true',
+    'n:false',
+    'labels.env=prod',
+    'labels:prod',
+    'labels:*',
+    'labels.env:*',
+    'tags:a',
+    'tags=(a,b)',
+    'NOT status:RUNNING',
+    '-status:RUNNING',
+    'status:(RUNNING foo)',
+    'status=running OR n>0',
+    'status:* AND -n:1',
+    '(status:RUNNING OR zone:x) AND n<2',
+    'status=""',
+    'createTime>2020-06-01',
+    'createTime<2021-01-01',
+    'name~^foo',
+    'name!~bar',
+    'name:abc*',
+    'name:html',
+    'name:unicode',
+    'a.b=RUNNING',
+    'a.b:*',
+    'RUNNING',
+    'prod',
+)
+
+
+def _Resource(rng):
+  resource = {}
+  for key in _KEYS:
+    if rng.random() < 0.8:
+      resource[key] = rng.choice(_VALUES)
+  if rng.random() < 0.5:
+    resource['a'] = {'b': rng.choice(_VALUES)}
+  return resource
+
+
+def _Result(expression, resource):
+  try:
+    return bool(expression.Evaluate(resource))
+  except Exception as e:  # pylint: disable=broad-except
+    return type(e).__name__
+
+
+class ResourceExprCompilerDifferentialTest(unittest.TestCase):
+
+  def testCompiledMatchesInterpreted(self):
+    rng = random.Random(_SEED)
+    for expression in _EXPRESSIONS:
+      resources = [_Resource(rng) for _ in range(_RESOURCES_PER_EXPRESSION)]
+      interpreted = resource_filter.Compile(expression)
+      compiled = resource_expr_compiler.Compile(expression)
+      for resource in resources:
+        self.assertEqual(
+            _Result(interpreted, resource),
+            _Result(compiled, resource),
+            '{!r} differs on {!r}'.format(expression, resource))
+
+  def testCompiledKeepsTree(self):
+    compiled = resource_expr_compiler.Compile('a.b=1 AND status:x')
+    self.assertEqual(
+        resource_filter.GetAllKeys(compiled),
+        resource_filter.GetAllKeys(
+            resource_filter.Compile('a.b=1 AND status:x')))
+
+
+if __name__ == '__main__':
+  unittest.main()
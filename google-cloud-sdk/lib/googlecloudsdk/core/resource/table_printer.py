@@ -39,6 +39,9 @@ _BOX_CHAR_LENGTH = 1
 # Default min width.
 _MIN_WIDTH = 10
 
+# Default number of rows used to compute the column widths of a streamed table.
+_STREAM_WINDOW = 1000
+
 
 def _Stringify(value):  # pylint: disable=invalid-name
   """Represents value as a JSON string if it's not a string."""
@@ -110,6 +113,25 @@ class SubFormat(object):
     self.wrap = wrap
 
 
+class _StreamLayout(object):
+  """The column layout of a streamed table.
+
+  Attributes:
+    col_widths: The list of column widths, widened as rows are printed.
+    align: The list of column justification functions, None for left.
+    heading: The list of heading cells, None if there is no heading.
+    pad: The column horizontal pad.
+    wrap: The dict of wrapped column indexes.
+  """
+
+  def __init__(self, col_widths, align, heading, pad, wrap):
+    self.col_widths = col_widths
+    self.align = align
+    self.heading = heading
+    self.pad = pad
+    self.wrap = wrap
+
+
 class TablePrinter(resource_printer_base.ResourcePrinter):
   """A printer for printing human-readable tables.
 
@@ -138,6 +160,13 @@ class TablePrinter(resource_printer_base.ResourcePrinter):
     margin=N: Right hand side padding when one or more columns are wrapped.
     pad=N: Sets the column horizontal pad to _N_ spaces. The default is 1 for
       box, 2 otherwise.
+    stream: Prints rows as they arrive instead of buffering the entire table.
+      Column widths are computed from the first *stream-window* rows. If a
+      later row does not fit, the column is widened and the heading is printed
+      again. Ignored for sorted, boxed, optional column, nested format and
+      *pager* tables, which must see every row first.
+    stream-window=N: The number of rows used to compute the column widths of
+      a *stream* table. The default is 1000.
     title=_TITLE_: Prints a centered _TITLE_ at the top of the table, within
       the table box if *box* is enabled.
 
@@ -146,6 +175,10 @@ class TablePrinter(resource_printer_base.ResourcePrinter):
       not displayed if it contains no data.
     _page_count: The output page count, incremented before each page.
     _rows: The list of all resource columns indexed by row.
+    _stream_layout: The column layout of a streamed table after the first
+      window of rows has been printed, None otherwise.
+    _stream_window: The number of rows buffered before streaming starts, 0 if
+      the table is not streamed.
     _visible: Ordered list of visible column indexes.
     _wrap: True if at least one column can be text wrapped.
   """
@@ -212,16 +245,59 @@ class TablePrinter(resource_printer_base.ResourcePrinter):
         if not subformat.hidden and not subformat.printer:
           self._visible.append(subformat.index)
 
+    self._stream_layout = None
+    self._stream_window = 0
+    if ('stream' in self.attributes and not self._pager and
+        not self._has_subprinters and not self._aggregate and
+        not self._optional and
+        'box' not in self.attributes and
+        'all-box' not in self.attributes and
+        not (self.column_attributes and self.column_attributes.Order()) and
+        not properties.VALUES.accessibility.screen_reader.GetBool()):
+      self._stream_window = max(
+          1, self.attributes.get('stream-window', _STREAM_WINDOW))
+
   def _AddRecord(self, record, delimit=True):
     """Adds a list of columns.
 
-    Output delayed until Finish().
+    Output delayed until Finish(), or until the first window of rows has been
+    added for a streamed table.
 
     Args:
       record: A JSON-serializable object.
       delimit: Prints resource delimiters if True.
     """
+    if self._stream_layout:
+      self._StreamRow(record)
+      return
     self._rows.append(record)
+    if self._stream_window and len(self._rows) >= self._stream_window:
+      # Print the window with widths computed from its rows. Finish() saves the
+      # layout for the rows that follow.
+      self.Finish()
+
+  def _StreamRow(self, record):
+    """Prints one row of a streamed table.
+
+    Args:
+      record: A JSON-serializable object.
+    """
+    layout = self._stream_layout
+    row = [_Stringify(cell) for cell in self._Visible(record)]
+    widened = False
+    for i, cell in enumerate(row):
+      if i in layout.wrap:
+        # Wrapped columns keep their width and wrap the cell instead.
+        continue
+      width = self._console_attr.DisplayWidth(cell)
+      if width > layout.col_widths[i]:
+        layout.col_widths[i] = width
+        widened = True
+    if widened and layout.heading:
+      self._out.write('\n')
+      self._WriteRow(list(layout.heading), layout.col_widths, layout.align,
+                     layout.pad)
+    self._WriteRow(row, layout.col_widths, layout.align, layout.pad)
 
   def _Visible(self, row):
     """Return the visible list items in row."""
@@ -300,8 +376,100 @@ class TablePrinter(resource_printer_base.ResourcePrinter):
         return self._Visible(self.column_attributes.Labels())
     return None
 
+  def _WriteLine(self, row, col_widths, align, table_column_pad, box=None):
+    """Writes the next output line of a row, without the trailing newline.
+
+    Cells wider than their column are wrapped: the line gets the first part of
+    the cell and the remainder is left in row for the next line.
+
+    Args:
+      row: The list of stringified row cells, updated in place.
+      col_widths: The list of column widths.
+      align: The list of column justification functions, None for left.
+      table_column_pad: The column horizontal pad.
+      box: The box line characters, None for no box.
+
+    Returns:
+      True if the entire row has been written.
+    """
+    pad = 0
+    row_finished = True
+    for i in range(len(row)):
+      width = col_widths[i]
+      if box:
+        self._out.write(box.v + ' ')
+      justify = align[i] if align else lambda s, w: s.ljust(w)
+      # Wrap text if needed.
+      s = row[i]
+      is_colorizer = isinstance(s, console_attr.Colorizer)
+      if (self._console_attr.DisplayWidth(s) > width or
+          '\n' in six.text_type(s)):
+        cell_value, remainder = self._GetNextLineAndRemainder(
+            six.text_type(s), width, include_all_whitespace=is_colorizer)
+        if is_colorizer:
+          # pylint:disable=protected-access
+          cell = console_attr.Colorizer(cell_value, s._color, s._justify)
+          row[i] = console_attr.Colorizer(remainder, s._color, s._justify)
+          # pylint:disable=protected-access
+        else:
+          cell = cell_value
+          row[i] = remainder
+        if remainder:
+          row_finished = False
+      else:
+        cell = s
+        row[i] = ' '
+      if is_colorizer:
+        if pad:
+          self._out.write(' ' * pad)
+          pad = 0
+        # NOTICE: This may result in trailing space after the last column.
+        cell.Render(self._out, justify=lambda s: justify(s, width))  # pylint: disable=cell-var-from-loop
+        if box:
+          self._out.write(' ' * table_column_pad)
+        else:
+          pad = table_column_pad
+      else:
+        value = justify(_Justify(self._console_attr, cell), width)
+        if box:
+          self._out.write(value)
+          self._out.write(' ' * table_column_pad)
+        elif value.strip():
+          if pad:
+            self._out.write(' ' * pad)
+            pad = 0
+          stripped = value.rstrip()
+          self._out.write(stripped)
+          pad = (
+              table_column_pad + self._console_attr.DisplayWidth(value) -
+              self._console_attr.DisplayWidth(stripped))
+        else:
+          pad += table_column_pad + self._console_attr.DisplayWidth(value)
+    if box:
+      self._out.write(box.v)
+    return row_finished
+
+  def _WriteRow(self, row, col_widths, align, table_column_pad):
+    """Writes all output lines of a row.
+
+    Args:
+      row: The list of stringified row cells, updated in place.
+      col_widths: The list of column widths.
+      align: The list of column justification functions, None for left.
+      table_column_pad: The column horizontal pad.
+    """
+    while not self._WriteLine(row, col_widths, align, table_column_pad):
+      self._out.write('\n')
+    self._out.write('\n')
+
   def Finish(self):
     """Prints the table."""
+    if self._stream_layout:
+      # The rows have already been printed.
+      self._stream_layout = None
+      super(TablePrinter, self).Finish()
+      return
+
     if not self._rows:
       # Table is empty.
       return
@@ -563,6 +731,15 @@ class TablePrinter(resource_printer_base.ResourcePrinter):
       self._out.write(line)
       self._out.write('\n')
 
+    if self._stream_window:
+      # Later rows are printed by _StreamRow() with this layout.
+      self._stream_layout = _StreamLayout(
+          col_widths=col_widths,
+          align=align,
+          heading=list(heading[0]) if heading else None,
+          pad=table_column_pad,
+          wrap=wrap)
+
     # Set up box borders.
     if box:
       t_sep = box.vr if title else box.dr
@@ -617,61 +794,8 @@ class TablePrinter(resource_printer_base.ResourcePrinter):
           self._out.write('\n')
       row_finished = False
       while not row_finished:
-        pad = 0
-        row_finished = True
-        for i in range(len(row)):
-          width = col_widths[i]
-          if box:
-            self._out.write(box.v + ' ')
-          justify = align[i] if align else lambda s, w: s.ljust(w)
-          # Wrap text if needed.
-          s = row[i]
-          is_colorizer = isinstance(s, console_attr.Colorizer)
-          if (self._console_attr.DisplayWidth(s) > width or
-              '\n' in six.text_type(s)):
-            cell_value, remainder = self._GetNextLineAndRemainder(
-                six.text_type(s), width, include_all_whitespace=is_colorizer)
-            if is_colorizer:
-              # pylint:disable=protected-access
-              cell = console_attr.Colorizer(cell_value, s._color, s._justify)
-              row[i] = console_attr.Colorizer(remainder, s._color, s._justify)
-              # pylint:disable=protected-access
-            else:
-              cell = cell_value
-              row[i] = remainder
-            if remainder:
-              row_finished = False
-          else:
-            cell = s
-            row[i] = ' '
-          if is_colorizer:
-            if pad:
-              self._out.write(' ' * pad)
-              pad = 0
-            # NOTICE: This may result in trailing space after the last column.
-            cell.Render(self._out, justify=lambda s: justify(s, width))  # pylint: disable=cell-var-from-loop
-            if box:
-              self._out.write(' ' * table_column_pad)
-            else:
-              pad = table_column_pad
-          else:
-            value = justify(_Justify(self._console_attr, cell), width)
-            if box:
-              self._out.write(value)
-              self._out.write(' ' * table_column_pad)
-            elif value.strip():
-              if pad:
-                self._out.write(' ' * pad)
-                pad = 0
-              stripped = value.rstrip()
-              self._out.write(stripped)
-              pad = (
-                  table_column_pad + self._console_attr.DisplayWidth(value) -
-                  self._console_attr.DisplayWidth(stripped))
-            else:
-              pad += table_column_pad + self._console_attr.DisplayWidth(value)
-        if box:
-          self._out.write(box.v)
+        row_finished = self._WriteLine(
+            row, col_widths, align, table_column_pad, box)
         if self._rows:
           self._out.write('\n')
           if heading:
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Startup profiling for gcloud.
+
+When the CLOUDSDK_STARTUP_PROFILE environment variable is set to a file path
+(or to `-` for stderr), gcloud records the wall time spent in each startup
+phase and in executing each imported module, and writes them as JSON when the
+process exits:
+
+  {
+    "argv": [...],
+    "total_ms": 812.4,
+    "phases": {"cli_generate": {"ms": 120.3, "count": 1}, ...},
+    "modules": [{"name": "...", "self_ms": 12.1, "cumulative_ms": 40.2}, ...]
+  }
+
+Module times are measured around module execution, so `cumulative_ms` includes
+the time spent importing the module's own dependencies for the first time and
+`self_ms` excludes it.
+
+This module must only depend on the standard library because it is imported
+before anything else in gcloud_main.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import atexit
+import contextlib
+import json
+import os
+import sys
+import time
+
+ENV_VAR = 'CLOUDSDK_STARTUP_PROFILE'
+
+_PROFILER = None
+
+
+class _TimedLoader(object):
+  """Wraps a module loader to time the execution of the module."""
+
+  def __init__(self, loader, profiler):
+    self._loader = loader
+    self._profiler = profiler
+
+  def __getattr__(self, name):
+    return getattr(self._loader, name)
+
+  def create_module(self, spec):
+    return self._loader.create_module(spec)
+
+  def exec_module(self, module):
+    # Hand the real loader back to the module so that resource lookups through
+    # __loader__ or __spec__.loader behave exactly as without profiling.
+    module.__loader__ = self._loader
+    if getattr(module, '__spec__', None) is not None:
+      module.__spec__.loader = self._loader
+    self._profiler.ModuleStarted(module.__name__)
+    try:
+      self._loader.exec_module(module)
+    finally:
+      self._profiler.ModuleFinished(module.__name__)
+
+
+class _ImportTimer(object):
+  """A sys.meta_path finder that times the modules found by other finders."""
+
+  def __init__(self, profiler):
+    self._profiler = profiler
+
+  def find_spec(self, fullname, path, target=None):
+    """Finds the spec using the remaining finders and wraps its loader."""
+    for finder in sys.meta_path:
+      if finder is self:
+        continue
+      find_spec = getattr(finder, 'find_spec', None)
+      if not find_spec:
+        continue
+      spec = find_spec(fullname, path, target)
+      if spec is not None:
+        break
+    else:
+      return None
+    if spec.loader is None or not hasattr(spec.loader, 'exec_module'):
+      return spec
+    spec.loader = _TimedLoader(spec.loader, self._profiler)
+    return spec
+
+
+class StartupProfiler(object):
+  """Accumulates phase and module timings for a single process."""
+
+  def __init__(self, start_time, output_path):
+    self._start_time = start_time
+    self._output_path = output_path
+    self._phases = {}
+    self._modules = {}
+    # Stack of [name, start time, time spent in nested module executions].
+    self._module_stack = []
+    self._import_timer = _ImportTimer(self)
+
+  def InstallImportHook(self):
+    sys.meta_path.insert(0, self._import_timer)
+
+  def UninstallImportHook(self):
+    if self._import_timer in sys.meta_path:
+      sys.meta_path.remove(self._import_timer)
+
+  def ModuleStarted(self, name):
+    self._module_stack.append([name, time.time(), 0.0])
+
+  def ModuleFinished(self, name):
+    del name  # Modules always finish in the reverse order they started.
+    started_name, started, nested = self._module_stack.pop()
+    elapsed = time.time() - started
+    self._modules[started_name] = (elapsed - nested, elapsed)
+    if self._module_stack:
+      self._module_stack[-1][2] += elapsed
+
+  def AddPhase(self, name, elapsed):
+    phase = self._phases.setdefault(name, [0.0, 0])
+    phase[0] += elapsed
+    phase[1] += 1
+
+  def Results(self):
+    """Returns the profile as a JSON serializable dict."""
+    modules = [
+        {
+            'name': name,
+            'self_ms': round(self_time * 1000, 3),
+            'cumulative_ms': round(cumulative * 1000, 3),
+        }
+        for name, (self_time, cumulative) in self._modules.items()
+    ]
+    modules.sort(key=lambda m: m['self_ms'], reverse=True)
+    return {
+        'argv': sys.argv,
+        'total_ms': round((time.time() - self._start_time) * 1000, 3),
+        'phases': {
+            name: {'ms': round(elapsed * 1000, 3), 'count': count}
+            for name, (elapsed, count) in self._phases.items()
+        },
+        'modules': modules,
+    }
+
+  def Write(self):
+    """Writes the profile to the configured output, never raising."""
+    self.UninstallImportHook()
+    try:
+      contents = json.dumps(self.Results(), indent=2, sort_keys=True)
+      if self._output_path == '-':
+        sys.stderr.write(contents + '\n')
+      else:
+        with open(self._output_path, 'w') as f:
+          f.write(contents + '\n')
+    # pylint:disable=broad-except, Profiling must never fail the command.
+    except Exception:
+      pass
+
+
+def Start(start_time):
+  """Starts profiling if it was requested in the environment.
+
+  Args:
+    start_time: float, The time the process started in seconds since epoch.
+
+  Returns:
+    StartupProfiler, The active profiler or None if profiling is off.
+  """
+  global _PROFILER
+  output_path = os.environ.get(ENV_VAR)
+  if _PROFILER or not output_path:
+    return _PROFILER
+  _PROFILER = StartupProfiler(start_time, output_path)
+  _PROFILER.InstallImportHook()
+  atexit.register(_PROFILER.Write)
+  return _PROFILER
+
+
+def IsActive():
+  return _PROFILER is not None
+
+
+def RecordPhase(name, started):
+  """Records the time since started as the named startup phase.
+
+  Args:
+    name: str, The name of the phase.
+    started: float, The time the phase started in seconds since epoch.
+  """
+  if _PROFILER:
+    _PROFILER.AddPhase(name, time.time() - started)
+
+
+@contextlib.contextmanager
+def Phase(name):
+  """Times the enclosed block as the named startup phase.
+
+  Phases may be entered more than once; their times accumulate.
+
+  Args:
+    name: str, The name of the phase.
+
+  Yields:
+    None.
+  """
+  if not _PROFILER:
+    yield
+    return
+  started = time.time()
+  try:
+    yield
+  finally:
+    _PROFILER.AddPhase(name, time.time() - started)
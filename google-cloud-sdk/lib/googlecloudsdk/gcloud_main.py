@@ -26,6 +26,12 @@ START_TIME = time.time()
 
 # pylint:disable=g-bad-import-order
 # pylint:disable=g-import-not-at-top, We want to get the start time first.
+# The startup profiler must be started before any other gcloud module is
+# imported so that their import times are recorded.
+from googlecloudsdk.core.util import startup_profiler
+
+startup_profiler.Start(START_TIME)
+
 import atexit
 import errno
 import os
@@ -48,6 +54,8 @@ from googlecloudsdk.core.util import keyboard_interrupt
 from googlecloudsdk.core.util import platforms
 import surface
 
+startup_profiler.RecordPhase('imports', START_TIME)
+
 # Disable stack traces when the command is interrupted.
 keyboard_interrupt.InstallHandler()
 
@@ -170,7 +178,8 @@ def CreateCLI(surfaces, translator=None):
   exclude_commands = r'gcloud\.components\..*|gcloud\.version'
   loader.RegisterPostRunHook(UpdateCheck, exclude_commands=exclude_commands)
   loader.RegisterPostRunHook(SurveyPromptCheck)
-  generated_cli = loader.Generate()
+  with startup_profiler.Phase('cli_generate'):
+    generated_cli = loader.Generate()
   return generated_cli
 
 
@@ -179,10 +188,11 @@ def main(gcloud_cli=None, credential_providers=None):
   atexit.register(metrics.Shutdown)
   if not platforms.PythonVersion().IsCompatible():
     sys.exit(1)
-  metrics.Started(START_TIME)
-  metrics.Executions(
-      'gcloud',
-      local_state.InstallationState.VersionForInstalledComponent('core'))
+  with startup_profiler.Phase('metrics'):
+    metrics.Started(START_TIME)
+    metrics.Executions(
+        'gcloud',
+        local_state.InstallationState.VersionForInstalledComponent('core'))
   if gcloud_cli is None:
     gcloud_cli = CreateCLI([])
 
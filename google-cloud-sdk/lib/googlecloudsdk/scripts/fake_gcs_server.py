@@ -0,0 +1,660 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An in-memory stand-in for the Cloud Storage JSON API.
+
+Implements the subset of the JSON API that gcloud storage uses through
+googlecloudsdk.api_lib.storage.gcs_json.client for copies, listings and
+deletions: bucket get and list, object get, list, patch, delete, compose and
+rewrite, media downloads with ranges, media, multipart and resumable uploads,
+and batch requests of object calls. Latency, bandwidth and error rates can be
+injected so that benchmarks see a predictable, reproducible server.
+
+Point gcloud at a running server with:
+
+  CLOUDSDK_API_ENDPOINT_OVERRIDES_STORAGE=http://127.0.0.1:PORT/storage/v1/
+  CLOUDSDK_AUTH_DISABLE_CREDENTIALS=true
+
+Usage:
+
+  fake_gcs_server.py --port=8080 --bucket=my-bucket --latency-ms=20
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import argparse
+import base64
+import email.parser
+import hashlib
+import http.server
+import io
+import json
+import random
+import sys
+import threading
+import time
+import urllib.parse
+import uuid
+
+from googlecloudsdk.command_lib.util import crc32c
+
+_TIMESTAMP = '2026-01-01T00:00:00.000Z'
+_PROJECT_NUMBER = '123456789012'
+_DEFAULT_PAGE_SIZE = 1000
+_THROTTLE_CHUNK_SIZE = 64 * 1024
+
+
+class _Throttle:
+  """Limits the bytes per second sent and received across all connections."""
+
+  def __init__(self, bytes_per_second):
+    self._bytes_per_second = bytes_per_second
+    self._lock = threading.Lock()
+    self._next_free_time = time.time()
+
+  def Consume(self, byte_count):
+    """Blocks until byte_count bytes fit in the bandwidth budget."""
+    if not self._bytes_per_second:
+      return
+    with self._lock:
+      now = time.time()
+      start = max(now, self._next_free_time)
+      self._next_free_time = start + byte_count / self._bytes_per_second
+      delay = self._next_free_time - now
+    time.sleep(delay)
+
+
+class _Object:
+  """Holds the data and metadata of a stored object."""
+
+  def __init__(self, bucket, name, data, generation, metadata=None,
+               component_count=None):
+    self.bucket = bucket
+    self.name = name
+    self.data = data
+    self.generation = generation
+    self.metageneration = 1
+    self.metadata = dict(metadata or {})
+    self.component_count = component_count
+    self.crc32c = crc32c.get_hash(crc32c.get_crc32c(data))
+    # Like Cloud Storage, composite objects have no MD5 hash.
+    if component_count is None:
+      self.md5 = base64.b64encode(hashlib.md5(data).digest()).decode('ascii')
+    else:
+      self.md5 = None
+
+  def ToJson(self, host):
+    """Returns the JSON API representation of the object."""
+    quoted_name = urllib.parse.quote(self.name, safe='')
+    result = {
+        'kind': 'storage#object',
+        'id': '{}/{}/{}'.format(self.bucket, self.name, self.generation),
+        'bucket': self.bucket,
+        'name': self.name,
+        'generation': str(self.generation),
+        'metageneration': str(self.metageneration),
+        'size': str(len(self.data)),
+        'crc32c': self.crc32c,
+        'etag': 'CAE=',
+        'storageClass': 'STANDARD',
+        'timeCreated': _TIMESTAMP,
+        'updated': _TIMESTAMP,
+        'timeStorageClassUpdated': _TIMESTAMP,
+        'selfLink': 'http://{}/storage/v1/b/{}/o/{}'.format(
+            host, self.bucket, quoted_name),
+        'mediaLink': (
+            'http://{}/download/storage/v1/b/{}/o/{}?generation={}&alt=media'
+            .format(host, self.bucket, quoted_name, self.generation)),
+    }
+    result.update(self.metadata)
+    if self.md5:
+      result['md5Hash'] = self.md5
+    if self.component_count is not None:
+      result['componentCount'] = self.component_count
+    return result
+
+
+class FakeGcs:
+  """The buckets and objects served by a fake server, and its fault settings.
+
+  Attributes:
+    latency_seconds: float, Added to every request before it is answered.
+    throttle: _Throttle, Limits the bandwidth of request and response bodies.
+    error_rate: float, The fraction of requests answered with error_status.
+    error_status: int, The HTTP status of injected errors, e.g. 429 or 503.
+    request_count: int, The number of requests received.
+    error_count: int, The number of injected errors.
+  """
+
+  def __init__(self, buckets, latency_seconds=0, bytes_per_second=0,
+               error_rate=0, error_status=503, seed=0):
+    self.latency_seconds = latency_seconds
+    self.throttle = _Throttle(bytes_per_second)
+    self.error_rate = error_rate
+    self.error_status = error_status
+    self.request_count = 0
+    self.error_count = 0
+
+    self._lock = threading.Lock()
+    self._random = random.Random(seed)
+    self._buckets = {name: {} for name in buckets}
+    # Maps upload IDs to (bucket, metadata, received bytes).
+    self._uploads = {}
+    self._next_generation = 1
+
+  def ShouldInjectError(self):
+    with self._lock:
+      self.request_count += 1
+      if self.error_rate and self._random.random() < self.error_rate:
+        self.error_count += 1
+        return True
+      return False
+
+  def HasBucket(self, bucket):
+    return bucket in self._buckets
+
+  def BucketNames(self):
+    return sorted(self._buckets)
+
+  def AddObject(self, bucket, name, data, metadata=None, component_count=None):
+    """Stores an object, replacing any live object with the same name."""
+    with self._lock:
+      generation = self._next_generation
+      self._next_generation += 1
+    stored = _Object(bucket, name, data, generation, metadata, component_count)
+    with self._lock:
+      self._buckets[bucket][name] = stored
+    return stored
+
+  def GetObject(self, bucket, name):
+    return self._buckets.get(bucket, {}).get(name)
+
+  def DeleteObject(self, bucket, name):
+    with self._lock:
+      return self._buckets.get(bucket, {}).pop(name, None)
+
+  def ClearPrefix(self, bucket, prefix):
+    with self._lock:
+      objects = self._buckets[bucket]
+      for name in [name for name in objects if name.startswith(prefix)]:
+        del objects[name]
+
+  def ListObjects(self, bucket, prefix='', delimiter=None, start_after='',
+                  start_offset='', end_offset='', max_results=None):
+    """Returns a page of (objects, prefixes, next page token)."""
+    with self._lock:
+      names = sorted(self._buckets[bucket])
+    max_results = max_results or _DEFAULT_PAGE_SIZE
+    objects = []
+    prefixes = []
+    last_name = None
+    for name in names:
+      if (not name.startswith(prefix) or name <= start_after or
+          name < start_offset or (end_offset and name >= end_offset)):
+        continue
+      if len(objects) + len(prefixes) >= max_results:
+        return objects, prefixes, last_name
+      if delimiter:
+        index = name.find(delimiter, len(prefix))
+        if index != -1:
+          sub_prefix = name[:index + len(delimiter)]
+          if not prefixes or prefixes[-1] != sub_prefix:
+            prefixes.append(sub_prefix)
+          # Tokens skip the rest of the prefix.
+          last_name = sub_prefix + '\U0010ffff'
+          continue
+      stored = self.GetObject(bucket, name)
+      if stored:
+        objects.append(stored)
+        last_name = name
+    return objects, prefixes, None
+
+  def StartUpload(self, bucket, metadata):
+    upload_id = uuid.uuid4().hex
+    with self._lock:
+      self._uploads[upload_id] = (bucket, metadata, bytearray())
+    return upload_id
+
+  def GetUpload(self, upload_id):
+    return self._uploads.get(upload_id)
+
+  def FinishUpload(self, upload_id):
+    with self._lock:
+      bucket, metadata, data = self._uploads.pop(upload_id)
+    return self.AddObject(bucket, metadata.pop('name'), bytes(data), metadata)
+
+
+def _ObjectMetadata(metadata):
+  """Returns the user settable fields of an uploaded object resource."""
+  return {
+      key: value for key, value in metadata.items()
+      if key in ('name', 'contentType', 'contentEncoding', 'contentLanguage',
+                 'contentDisposition', 'cacheControl', 'metadata',
+                 'customTime', 'storageClass')
+  }
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+  """Serves the JSON API from the FakeGcs instance of the server."""
+
+  protocol_version = 'HTTP/1.1'
+
+  @property
+  def _gcs(self):
+    return self.server.gcs
+
+  def log_message(self, *args):  # pylint: disable=arguments-differ
+    pass
+
+  def _ReadBody(self):
+    """Reads the request body, throttled by the bandwidth limit."""
+    if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+      chunks = []
+      while True:
+        size = int(self.rfile.readline().split(b';')[0], 16)
+        if not size:
+          self.rfile.readline()
+          break
+        chunks.append(self.rfile.read(size))
+        self.rfile.readline()
+      body = b''.join(chunks)
+    else:
+      body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+    self._gcs.throttle.Consume(len(body))
+    return body
+
+  def _Send(self, status, body=b'', headers=None):
+    self.send_response(status)
+    for key, value in (headers or {}).items():
+      self.send_header(key, value)
+    self.send_header('Content-Length', str(len(body)))
+    self.end_headers()
+    for i in range(0, len(body), _THROTTLE_CHUNK_SIZE):
+      chunk = body[i:i + _THROTTLE_CHUNK_SIZE]
+      self._gcs.throttle.Consume(len(chunk))
+      self.wfile.write(chunk)
+
+  def _SendJson(self, status, value):
+    self._Send(status, json.dumps(value).encode('utf-8'),
+               {'Content-Type': 'application/json; charset=UTF-8'})
+
+  def _SendError(self, status, message, reason):
+    self._SendJson(status, {
+        'error': {
+            'code': status,
+            'message': message,
+            'errors': [{'message': message, 'reason': reason}],
+        }
+    })
+
+  def _SendNotFound(self, bucket, name=None):
+    if name is None:
+      self._SendError(404, 'The specified bucket does not exist.', 'notFound')
+    else:
+      self._SendError(404, 'No such object: {}/{}'.format(bucket, name),
+                      'notFound')
+
+  def _SendObject(self, stored):
+    self._SendJson(200, stored.ToJson(self.headers.get('Host')))
+
+  def _SendMedia(self, stored):
+    """Sends object data, honoring a Range header."""
+    data = stored.data
+    hashes = ['crc32c=' + stored.crc32c]
+    if stored.md5:
+      hashes.append('md5=' + stored.md5)
+    headers = {
+        'Content-Type': 'application/octet-stream',
+        'X-Goog-Generation': str(stored.generation),
+        'X-Goog-Hash': ','.join(hashes),
+    }
+    byte_range = self.headers.get('Range')
+    if not byte_range or not data:
+      self._Send(200, data, headers)
+      return
+    start_string, _, end_string = byte_range.split('=', 1)[1].partition('-')
+    if start_string:
+      start = int(start_string)
+      end = int(end_string) if end_string else len(data) - 1
+    else:
+      start = max(len(data) - int(end_string), 0)
+      end = len(data) - 1
+    end = min(end, len(data) - 1)
+    headers['Content-Range'] = 'bytes {}-{}/{}'.format(start, end, len(data))
+    self._Send(206, data[start:end + 1], headers)
+
+  def _Route(self, method):
+    """Dispatches a request after injecting latency."""
+    if self._gcs.latency_seconds:
+      time.sleep(self._gcs.latency_seconds)
+    self._Dispatch(method)
+
+  def _Dispatch(self, method):
+    """Dispatches a request or a call in a batch after injecting errors."""
+    parsed = urllib.parse.urlsplit(self.path)
+    query = dict(urllib.parse.parse_qsl(parsed.query))
+    # Split before unquoting, since object names may contain %2F.
+    parts = [urllib.parse.unquote(part) for part in parsed.path.split('/')[1:]]
+    if self._gcs.ShouldInjectError():
+      self._ReadBody()
+      self._SendError(self._gcs.error_status, 'Injected error.',
+                      'rateLimitExceeded'
+                      if self._gcs.error_status == 429 else 'backendError')
+      return
+
+    if parts[:3] == ['batch', 'storage', 'v1']:
+      self._HandleBatch()
+    elif parts[:1] == ['upload']:
+      self._HandleUpload(method, parts[3:], query)
+    elif parts[:1] == ['download']:
+      self._HandleObject(method, parts[3:], dict(query, alt='media'))
+    elif parts[:3] == ['storage', 'v1', 'b']:
+      self._HandleObject(method, parts[2:], query)
+    else:
+      self._SendError(404, 'Unknown path: ' + parsed.path, 'notFound')
+
+  def _HandleBatch(self):
+    """Handles a multipart/mixed batch request of JSON API calls.
+
+    Calls are answered in order, each with its own injected errors, like the
+    calls in a Cloud Storage batch request.
+    """
+    message = email.parser.BytesParser().parsebytes(
+        b'Content-Type: ' + self.headers['Content-Type'].encode('ascii') +
+        b'\r\n\r\n' + self._ReadBody())
+    boundary = uuid.uuid4().hex
+    body = io.BytesIO()
+    for part in message.get_payload():
+      body.write(
+          '--{}\r\nContent-Type: application/http\r\n'
+          'Content-ID: <response-{}>\r\n\r\n'.format(
+              boundary, part['Content-ID'][1:-1]).encode('utf-8'))
+      body.write(self._CallInBatch(part.get_payload(decode=True)))
+      body.write(b'\r\n')
+    body.write('--{}--\r\n'.format(boundary).encode('utf-8'))
+    self._Send(200, body.getvalue(),
+               {'Content-Type': 'multipart/mixed; boundary=' + boundary})
+
+  def _CallInBatch(self, http_request):
+    """Runs an application/http call of a batch and returns its response."""
+    request_line, _, rest = http_request.partition(b'\n')
+    method, path, _ = request_line.decode('utf-8').strip().split(' ', 2)
+    headers = email.parser.BytesParser().parsebytes(rest)
+    call_body = headers.get_payload(decode=True) or b''
+    del headers['Content-Length']
+    headers['Content-Length'] = str(len(call_body))
+
+    saved = self.rfile, self.wfile, self.headers, self.path
+    self.rfile = io.BytesIO(call_body)
+    self.wfile = io.BytesIO()
+    self.headers = headers
+    self.path = path
+    try:
+      self._Dispatch(method)
+      return self.wfile.getvalue()
+    finally:
+      self.rfile, self.wfile, self.headers, self.path = saved
+
+  def _HandleObject(self, method, parts, query):
+    """Handles requests under /storage/v1/b, parts starting with 'b'."""
+    if len(parts) == 1:
+      self._SendJson(200, {
+          'kind': 'storage#buckets',
+          'items': [self._BucketJson(b) for b in self._gcs.BucketNames()],
+      })
+      return
+    bucket = parts[1]
+    if not self._gcs.HasBucket(bucket):
+      self._ReadBody()
+      self._SendNotFound(bucket)
+    elif len(parts) == 2:
+      self._SendJson(200, self._BucketJson(bucket))
+    elif len(parts) == 3:
+      self._HandleList(bucket, query)
+    elif len(parts) == 5 and parts[4] == 'compose':
+      self._HandleCompose(bucket, parts[3])
+    elif len(parts) == 9 and parts[4] in ('rewriteTo', 'copyTo'):
+      self._HandleRewrite(bucket, parts[3], parts[6], parts[8])
+    elif method == 'DELETE':
+      if self._gcs.DeleteObject(bucket, parts[3]):
+        self._Send(204)
+      else:
+        self._SendNotFound(bucket, parts[3])
+    else:
+      stored = self._gcs.GetObject(bucket, parts[3])
+      if stored is None:
+        self._ReadBody()
+        self._SendNotFound(bucket, parts[3])
+      elif method == 'PATCH':
+        patch = json.loads(self._ReadBody() or b'{}')
+        custom_metadata = dict(stored.metadata.get('metadata') or {})
+        custom_metadata.update(patch.pop('metadata', None) or {})
+        stored.metadata.update(_ObjectMetadata(patch))
+        stored.metadata['metadata'] = custom_metadata
+        stored.metageneration += 1
+        self._SendObject(stored)
+      elif query.get('alt') == 'media':
+        self._SendMedia(stored)
+      else:
+        self._SendObject(stored)
+
+  def _BucketJson(self, bucket):
+    return {
+        'kind': 'storage#bucket',
+        'id': bucket,
+        'name': bucket,
+        'projectNumber': _PROJECT_NUMBER,
+        'location': 'US-CENTRAL1',
+        'locationType': 'region',
+        'storageClass': 'STANDARD',
+        'metageneration': '1',
+        'etag': 'CAE=',
+        'timeCreated': _TIMESTAMP,
+        'updated': _TIMESTAMP,
+    }
+
+  def _HandleList(self, bucket, query):
+    objects, prefixes, next_page_token = self._gcs.ListObjects(
+        bucket,
+        prefix=query.get('prefix', ''),
+        delimiter=query.get('delimiter'),
+        start_after=query.get('pageToken', ''),
+        start_offset=query.get('startOffset', ''),
+        end_offset=query.get('endOffset', ''),
+        max_results=int(query.get('maxResults', 0)))
+    response = {'kind': 'storage#objects'}
+    host = self.headers.get('Host')
+    if objects:
+      response['items'] = [stored.ToJson(host) for stored in objects]
+    if prefixes:
+      response['prefixes'] = prefixes
+    if next_page_token:
+      response['nextPageToken'] = next_page_token
+    self._SendJson(200, response)
+
+  def _HandleCompose(self, bucket, name):
+    request = json.loads(self._ReadBody())
+    sources = [self._gcs.GetObject(bucket, source['name'])
+               for source in request['sourceObjects']]
+    if None in sources:
+      self._SendNotFound(bucket, 'compose source')
+      return
+    metadata = _ObjectMetadata(request.get('destination') or {})
+    metadata.pop('name', None)
+    stored = self._gcs.AddObject(
+        bucket, name, b''.join(source.data for source in sources), metadata,
+        component_count=len(sources))
+    self._SendObject(stored)
+
+  def _HandleRewrite(self, bucket, name, destination_bucket,
+                     destination_name):
+    body = self._ReadBody()
+    source = self._gcs.GetObject(bucket, name)
+    if source is None:
+      self._SendNotFound(bucket, name)
+      return
+    if not self._gcs.HasBucket(destination_bucket):
+      self._SendNotFound(destination_bucket)
+      return
+    metadata = dict(source.metadata)
+    metadata.update(_ObjectMetadata(json.loads(body or b'{}')))
+    metadata.pop('name', None)
+    stored = self._gcs.AddObject(destination_bucket, destination_name,
+                                 source.data, metadata)
+    self._SendJson(200, {
+        'kind': 'storage#rewriteResponse',
+        'totalBytesRewritten': str(len(source.data)),
+        'objectSize': str(len(source.data)),
+        'done': True,
+        'resource': stored.ToJson(self.headers.get('Host')),
+    })
+
+  def _HandleUpload(self, method, parts, query):
+    """Handles requests under /upload/storage/v1."""
+    bucket = parts[1] if len(parts) > 1 else None
+    if bucket is None or not self._gcs.HasBucket(bucket):
+      self._ReadBody()
+      self._SendNotFound(bucket)
+      return
+    upload_type = query.get('uploadType')
+    if 'upload_id' in query:
+      self._HandleResumableChunk(query['upload_id'])
+      return
+
+    body = self._ReadBody()
+    if upload_type == 'resumable':
+      metadata = _ObjectMetadata(json.loads(body or b'{}'))
+      metadata.setdefault('name', query.get('name'))
+      upload_id = self._gcs.StartUpload(bucket, metadata)
+      location = 'http://{}/upload/storage/v1/b/{}/o?{}'.format(
+          self.headers.get('Host'), bucket, urllib.parse.urlencode(
+              {'uploadType': 'resumable', 'upload_id': upload_id}))
+      self._Send(200, headers={'Location': location})
+      return
+
+    if upload_type == 'multipart':
+      message = email.parser.BytesParser().parsebytes(
+          b'Content-Type: ' + self.headers['Content-Type'].encode('ascii') +
+          b'\r\n\r\n' + body)
+      metadata_part, media_part = message.get_payload()
+      metadata = _ObjectMetadata(
+          json.loads(metadata_part.get_payload(decode=True) or b'{}'))
+      data = media_part.get_payload(decode=True) or b''
+    else:
+      metadata = {}
+      data = body
+    name = metadata.pop('name', None) or query.get('name')
+    self._SendObject(self._gcs.AddObject(bucket, name, data, metadata))
+
+  def _HandleResumableChunk(self, upload_id):
+    """Appends a chunk to a resumable upload or reports its progress."""
+    body = self._ReadBody()
+    upload = self._gcs.GetUpload(upload_id)
+    if upload is None:
+      self._SendError(404, 'No such upload.', 'notFound')
+      return
+    received = upload[2]
+    content_range = self.headers.get('Content-Range', 'bytes */*')
+    byte_range, _, total = content_range.split(' ', 1)[1].partition('/')
+    if byte_range != '*':
+      start = int(byte_range.split('-')[0])
+      # Chunks may overlap data that was already received.
+      del received[start:]
+      received.extend(body)
+    if total != '*' and len(received) >= int(total):
+      self._SendObject(self._gcs.FinishUpload(upload_id))
+      return
+    headers = {}
+    if received:
+      headers['Range'] = 'bytes=0-{}'.format(len(received) - 1)
+    self._Send(308, headers=headers)
+
+  def do_GET(self):  # pylint: disable=invalid-name
+    self._Route('GET')
+
+  def do_POST(self):  # pylint: disable=invalid-name
+    self._Route('POST')
+
+  def do_PUT(self):  # pylint: disable=invalid-name
+    self._Route('PUT')
+
+  def do_PATCH(self):  # pylint: disable=invalid-name
+    self._Route('PATCH')
+
+  def do_DELETE(self):  # pylint: disable=invalid-name
+    self._Route('DELETE')
+
+
+def StartServer(gcs, port=0):
+  """Serves gcs on a background thread.
+
+  Args:
+    gcs: FakeGcs, The buckets, objects and fault settings to serve.
+    port: int, The port to listen on, or 0 to pick a free one.
+
+  Returns:
+    http.server.ThreadingHTTPServer, The running server. Its port is
+    server.server_address[1]; call server.shutdown() to stop it.
+  """
+  server = http.server.ThreadingHTTPServer(('127.0.0.1', port), _Handler)
+  server.daemon_threads = True
+  server.gcs = gcs
+  thread = threading.Thread(target=server.serve_forever)
+  thread.daemon = True
+  thread.start()
+  return server
+
+
+def main(argv=None):
+  parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+  parser.add_argument('--port', type=int, default=8080)
+  parser.add_argument(
+      '--bucket', action='append', default=[],
+      help='A bucket to create. May be repeated.')
+  parser.add_argument(
+      '--latency-ms', type=float, default=0,
+      help='Delay added to every request.')
+  parser.add_argument(
+      '--bandwidth-mbps', type=float, default=0,
+      help='Shared limit on body bytes sent and received, in MiB/s.')
+  parser.add_argument(
+      '--error-rate', type=float, default=0,
+      help='The fraction of requests answered with --error-status.')
+  parser.add_argument('--error-status', type=int, default=503)
+  parser.add_argument('--seed', type=int, default=0)
+  args = parser.parse_args(argv)
+
+  gcs = FakeGcs(
+      args.bucket or ['benchmark-bucket'],
+      latency_seconds=args.latency_ms / 1000,
+      bytes_per_second=args.bandwidth_mbps * 1024 * 1024,
+      error_rate=args.error_rate,
+      error_status=args.error_status,
+      seed=args.seed)
+  server = StartServer(gcs, args.port)
+  print('Serving {} on http://127.0.0.1:{}/storage/v1/'.format(
+      ', '.join(gcs.BucketNames()), server.server_address[1]))
+  try:
+    while True:
+      time.sleep(3600)
+  except KeyboardInterrupt:
+    server.shutdown()
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks the memory of resources created for storage object listings.
+
+Each mode converts the same synthetic objects.list items into resources in a
+fresh process and keeps every resource alive, like a command that holds a
+whole listing. The items have the fields requested by `ls` and `du`, and the
+URL and size of every resource are read, as those commands do.
+
+Modes:
+
+  eager: GcsObjectResource, which converts every field up front.
+  listed: GcsListedObjectResource, which gcs_json/client.py returns for
+    listings and which converts fields when they are read.
+
+Usage:
+
+  listing_memory_benchmark.py --objects=10000000
+  listing_memory_benchmark.py --objects=10000000 --memory-limit-mb=16384
+
+With --memory-limit-mb each mode runs with its address space capped, and a
+mode that runs out of memory is reported as failed.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+from googlecloudsdk.api_lib.storage.gcs_json import metadata_util
+from googlecloudsdk.api_lib.util import apis
+
+MODES = {
+    'eager': metadata_util.get_object_resource_from_metadata,
+    'listed': metadata_util.get_listed_object_resource_from_metadata,
+}
+
+
+def _Items(count):
+  """Generates count objects.list items with the fields of a short listing."""
+  messages = apis.GetMessagesModule('storage', 'v1')
+  for i in range(count):
+    yield messages.Object(
+        bucket='benchmark-bucket',
+        name='dir-{}/object-{:010d}'.format(i % 1000, i),
+        size=i % 65536,
+        generation=1700000000000000 + i,
+    )
+
+
+def _MaxRssMb():
+  # ru_maxrss is in kilobytes on Linux.
+  return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def RunMode(mode, objects):
+  """Creates and reads resources for listed objects in this process.
+
+  Args:
+    mode: str, A key of MODES.
+    objects: int, The number of listed objects.
+
+  Returns:
+    dict, The elapsed seconds, peak resident memory of this process, and its
+    growth per object.
+  """
+  get_resource = MODES[mode]
+  start_rss_mb = _MaxRssMb()
+  start = time.time()
+  resources = []
+  total_size = 0
+  for item in _Items(objects):
+    listed_resource = get_resource(item)
+    if listed_resource.storage_url.url_string and listed_resource.size:
+      total_size += listed_resource.size
+    resources.append(listed_resource)
+  max_rss_mb = _MaxRssMb()
+  return {
+      'seconds': round(time.time() - start, 3),
+      'max_rss_mb': round(max_rss_mb, 1),
+      'bytes_per_object': round(
+          (max_rss_mb - start_rss_mb) * 1024 * 1024 / max(1, len(resources))),
+  }
+
+
+def _RunModeInSubprocess(mode, objects, memory_limit_mb):
+  """Runs RunMode() in a fresh process and returns its result."""
+  args = [sys.executable, os.path.abspath(__file__), '--run-mode=' + mode,
+          '--objects={}'.format(objects)]
+  if memory_limit_mb:
+    args.append('--memory-limit-mb={}'.format(memory_limit_mb))
+  proc = subprocess.run(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+  if proc.returncode:
+    error = proc.stderr.decode('utf-8', 'replace').strip().splitlines()
+    return {'failed': error[-1] if error else proc.returncode}
+  return json.loads(proc.stdout.decode('utf-8'))
+
+
+def main(argv=None):
+  parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+  parser.add_argument(
+      '--objects', type=int, default=10000000,
+      help='The number of synthetic listed objects.')
+  parser.add_argument(
+      '--memory-limit-mb', type=int,
+      help='Cap the address space of each mode to this many megabytes.')
+  parser.add_argument('--run-mode', choices=sorted(MODES), help='Internal.')
+  args = parser.parse_args(argv)
+
+  if args.run_mode:
+    if args.memory_limit_mb:
+      limit = args.memory_limit_mb * 1024 * 1024
+      resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    print(json.dumps(RunMode(args.run_mode, args.objects)))
+    return 0
+
+  results = {
+      mode: _RunModeInSubprocess(mode, args.objects, args.memory_limit_mb)
+      for mode in sorted(MODES)
+  }
+  print(json.dumps(results, indent=2, sort_keys=True))
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks gcloud cold-start latency on a fixed set of commands.
+
+Each command runs in a fresh process with an empty configuration directory and
+with the startup profiler (googlecloudsdk.core.util.startup_profiler) enabled.
+Commands that call APIs are pointed at a local stub server through endpoint
+overrides and run without credentials, so the benchmark never leaves the
+machine.
+
+Usage:
+
+  startup_benchmark.py --output=results.json
+  startup_benchmark.py --baseline=results.json --threshold=0.15
+
+Runs in which a command fails are reported and left out of its medians. With
+--baseline, the script exits with a non-zero status if the median total time
+of any command regressed by more than the threshold, or if a command failed
+more often than in the baseline.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import argparse
+import http.server
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+
+from googlecloudsdk.core.util import startup_profiler
+
+# Commands whose startup is representative of scripted use. Each is a list of
+# arguments to gcloud; {project} is replaced by a fake project ID.
+BENCHMARK_COMMANDS = (
+    ('version',),
+    ('config', 'get', 'core/project'),
+    ('config', 'list'),
+    ('auth', 'list'),
+    ('compute', 'zones', 'list', '--project={project}'),
+    ('compute', 'instances', 'describe', 'benchmark-instance',
+     '--zone=us-central1-a', '--project={project}'),
+)
+
+_FAKE_PROJECT = 'startup-benchmark-project'
+
+# The APIs the benchmark commands call, overridden to point at the stub.
+_STUBBED_APIS = ('compute',)
+
+
+class _StubHandler(http.server.BaseHTTPRequestHandler):
+  """Answers every API request with an empty, successful JSON response."""
+
+  def _Reply(self):
+    body = json.dumps({'kind': 'stub', 'items': [], 'name': 'stub'}).encode()
+    self.send_response(200)
+    self.send_header('Content-Type', 'application/json')
+    self.send_header('Content-Length', str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+  do_GET = _Reply  # pylint: disable=invalid-name
+  do_POST = _Reply  # pylint: disable=invalid-name
+
+  def log_message(self, *args):  # pylint: disable=arguments-differ
+    pass
+
+
+def _StartStubServer():
+  server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+  thread = threading.Thread(target=server.serve_forever)
+  thread.daemon = True
+  thread.start()
+  return server
+
+
+def _Environment(config_dir, profile_path, stub_port):
+  """Returns the environment for a single benchmark run."""
+  env = dict(os.environ)
+  env.update({
+      'CLOUDSDK_CONFIG': config_dir,
+      startup_profiler.ENV_VAR: profile_path,
+      'CLOUDSDK_CORE_DISABLE_PROMPTS': '1',
+      'CLOUDSDK_CORE_DISABLE_USAGE_REPORTING': 'true',
+      'CLOUDSDK_COMPONENT_MANAGER_DISABLE_UPDATE_CHECK': 'true',
+      'CLOUDSDK_SURVEY_DISABLE_PROMPTS': 'true',
+      'CLOUDSDK_AUTH_DISABLE_CREDENTIALS': 'true',
+  })
+  for api in _STUBBED_APIS:
+    env['CLOUDSDK_API_ENDPOINT_OVERRIDES_' + api.upper()] = (
+        'http://127.0.0.1:{}/{}/v1/'.format(stub_port, api))
+  return env
+
+
+def _RunOnce(gcloud, command, stub_port):
+  """Runs a command in a cold process and returns its startup profile.
+
+  Args:
+    gcloud: [str], The command prefix that runs gcloud.
+    command: [str], The arguments of the benchmark command.
+    stub_port: int, The port of the stub API server.
+
+  Returns:
+    dict, The startup profile, or None if the command failed.
+  """
+  config_dir = tempfile.mkdtemp(prefix='gcloud-startup-benchmark-')
+  profile_path = os.path.join(config_dir, 'profile.json')
+  try:
+    args = gcloud + [arg.format(project=_FAKE_PROJECT) for arg in command]
+    process = subprocess.run(
+        args,
+        env=_Environment(config_dir, profile_path, stub_port),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=False)
+    if process.returncode:
+      error = 'exit status {}'.format(process.returncode)
+    elif not os.path.exists(profile_path):
+      error = 'no startup profile written'
+    else:
+      with open(profile_path) as f:
+        return json.load(f)
+    # The last lines of stderr usually hold the error gcloud reported.
+    stderr = process.stderr.decode('utf-8', 'replace').strip().splitlines()
+    print('Failed run of [{}] ({}).'.format(' '.join(args), error),
+          file=sys.stderr)
+    for line in stderr[-5:]:
+      print('  ' + line, file=sys.stderr)
+    return None
+  finally:
+    shutil.rmtree(config_dir, ignore_errors=True)
+
+
+def _Summarize(profiles, failed_runs):
+  """Reduces the profiles of repeated runs of a command to medians."""
+  phases = {}
+  for profile in profiles:
+    for name, phase in profile['phases'].items():
+      phases.setdefault(name, []).append(phase['ms'])
+  return {
+      'failed_runs': failed_runs,
+      'total_ms': (
+          statistics.median(p['total_ms'] for p in profiles)
+          if profiles else None),
+      'phases_ms': {
+          name: statistics.median(times) for name, times in phases.items()
+      },
+      'modules_imported': (
+          statistics.median(len(p['modules']) for p in profiles)
+          if profiles else None),
+  }
+
+
+def RunBenchmark(gcloud, repeat):
+  """Runs every benchmark command repeat times.
+
+  Args:
+    gcloud: [str], The command prefix that runs gcloud.
+    repeat: int, The number of cold runs per command.
+
+  Returns:
+    {str: dict}, The summary for each command keyed by its command line.
+      Failed runs are counted in failed_runs and left out of the medians,
+      which are None if every run failed.
+  """
+  server = _StartStubServer()
+  try:
+    results = {}
+    for command in BENCHMARK_COMMANDS:
+      profiles = [
+          _RunOnce(gcloud, command, server.server_address[1])
+          for _ in range(repeat)
+      ]
+      successful_profiles = [p for p in profiles if p is not None]
+      results[' '.join(command)] = _Summarize(
+          successful_profiles, len(profiles) - len(successful_profiles))
+    return results
+  finally:
+    server.shutdown()
+
+
+def FindRegressions(results, baseline, threshold):
+  """Compares results against a baseline.
+
+  Args:
+    results: {str: dict}, The output of RunBenchmark.
+    baseline: {str: dict}, A previous output of RunBenchmark.
+    threshold: float, The allowed relative slowdown, e.g. 0.1 for 10%.
+
+  Returns:
+    [str], A description of each command that regressed.
+  """
+  regressions = []
+  for command, summary in sorted(results.items()):
+    if command not in baseline:
+      continue
+    if summary['failed_runs'] > (baseline[command].get('failed_runs') or 0):
+      regressions.append('{}: {} failed runs'.format(
+          command, summary['failed_runs']))
+    before = baseline[command].get('total_ms')
+    after = summary['total_ms']
+    if before is None or after is None:
+      continue
+    if after > before * (1 + threshold):
+      regressions.append('{}: {:.1f}ms -> {:.1f}ms (+{:.0%})'.format(
+          command, before, after, after / before - 1))
+  return regressions
+
+
+def main(argv=None):
+  parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+  parser.add_argument(
+      '--gcloud', default=shutil.which('gcloud') or 'gcloud',
+      help='The gcloud executable to benchmark.')
+  parser.add_argument(
+      '--repeat', type=int, default=5,
+      help='The number of cold runs of each command.')
+  parser.add_argument(
+      '--output', help='Write the results as JSON to this file.')
+  parser.add_argument(
+      '--baseline', help='Compare the results to this previous output.')
+  parser.add_argument(
+      '--threshold', type=float, default=0.1,
+      help='The allowed relative slowdown against the baseline.')
+  args = parser.parse_args(argv)
+
+  results = RunBenchmark([args.gcloud], args.repeat)
+  contents = json.dumps(results, indent=2, sort_keys=True)
+  if args.output:
+    with open(args.output, 'w') as f:
+      f.write(contents + '\n')
+  else:
+    print(contents)
+
+  if args.baseline:
+    with open(args.baseline) as f:
+      baseline = json.load(f)
+    regressions = FindRegressions(results, baseline, args.threshold)
+    for regression in regressions:
+      print('Startup regression: ' + regression, file=sys.stderr)
+    if regressions:
+      return 1
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the startup_benchmark.py script."""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from googlecloudsdk.scripts import startup_benchmark
+
+# Stands in for gcloud: writes a profile like the startup profiler does, fails
+# compute commands and exits without a profile for config list.
+_FAKE_GCLOUD = """
+import json
+import os
+import sys
+
+if 'compute' in sys.argv:
+  sys.stderr.write('ERROR: (gcloud.compute) fake failure\\n')
+  sys.exit(1)
+if 'list' in sys.argv and 'config' in sys.argv:
+  sys.exit(0)
+with open(os.environ['{env_var}'], 'w') as f:
+  json.dump({{'total_ms': 10.0, 'phases': {{'imports': {{'ms': 4.0}}}},
+             'modules': {{'a': {{}}, 'b': {{}}}}}}, f)
+"""
+
+
+class RunBenchmarkTest(unittest.TestCase):
+
+  def setUp(self):
+    self.temp_dir = tempfile.mkdtemp()
+    self.fake_gcloud = os.path.join(self.temp_dir, 'fake_gcloud.py')
+    with open(self.fake_gcloud, 'w') as f:
+      f.write(_FAKE_GCLOUD.format(
+          env_var=startup_benchmark.startup_profiler.ENV_VAR))
+
+  def tearDown(self):
+    shutil.rmtree(self.temp_dir)
+
+  def testFailedRunsAreCountedAndSkipped(self):
+    results = startup_benchmark.RunBenchmark(
+        [sys.executable, self.fake_gcloud], repeat=2)
+
+    self.assertEqual(
+        sorted(results),
+        sorted(' '.join(c) for c in startup_benchmark.BENCHMARK_COMMANDS))
+    self.assertEqual(results['version'], {
+        'failed_runs': 0,
+        'total_ms': 10.0,
+        'phases_ms': {'imports': 4.0},
+        'modules_imported': 2,
+    })
+    self.assertEqual(results['config list']['failed_runs'], 2)
+    self.assertIsNone(results['config list']['total_ms'])
+    compute_results = [
+        summary for command, summary in results.items()
+        if command.startswith('compute')]
+    self.assertEqual(len(compute_results), 2)
+    for summary in compute_results:
+      self.assertEqual(summary['failed_runs'], 2)
+      self.assertIsNone(summary['total_ms'])
+
+
+class FindRegressionsTest(unittest.TestCase):
+
+  def _Summary(self, total_ms=10.0, failed_runs=0):
+    return {'failed_runs': failed_runs, 'total_ms': total_ms}
+
+  def testNoRegressionWithinThreshold(self):
+    self.assertEqual(
+        startup_benchmark.FindRegressions(
+            {'version': self._Summary(10.5)}, {'version': self._Summary()},
+            0.1),
+        [])
+
+  def testSlowerCommandRegresses(self):
+    self.assertEqual(
+        startup_benchmark.FindRegressions(
+            {'version': self._Summary(20.0)}, {'version': self._Summary()},
+            0.1),
+        ['version: 10.0ms -> 20.0ms (+100%)'])
+
+  def testNewFailuresRegressAndAreNotTimed(self):
+    self.assertEqual(
+        startup_benchmark.FindRegressions(
+            {'version': self._Summary(None, failed_runs=5)},
+            {'version': self._Summary()}, 0.1),
+        ['version: 5 failed runs'])
+
+  def testBaselineWithoutFailedRuns(self):
+    self.assertEqual(
+        startup_benchmark.FindRegressions(
+            {'version': self._Summary()}, {'version': {'total_ms': 10.0}},
+            0.1),
+        [])
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,479 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks gcloud storage transfers against a local Cloud Storage stand-in.
+
+Each scenario runs a gcloud storage command against the in-memory server in
+googlecloudsdk.scripts.fake_gcs_server, which can add latency, limit bandwidth
+and fail a fraction of requests. Scenarios are seeded directly on the server
+before they run, so each one measures a single command:
+
+  cp_upload        cp -r of many small files to a bucket.
+  cp_download      cp -r of many small objects to a directory.
+  rsync_upload     rsync -r of many small files to an empty prefix.
+  rsync_unchanged  rsync -r of the same files again, with nothing to copy.
+  ls_recursive     ls -r of a prefix with many objects.
+  rm_recursive     rm of every object under a prefix.
+  rm_batched       rm_recursive with deletions sent in batch requests.
+  composite_upload cp of a large file as a parallel composite upload.
+  sliced_download  cp of a large object as a sliced download.
+
+For every scenario the script reports files/s, MiB/s, the CPU time of gcloud
+and its worker processes, and the peak resident memory of the largest of them.
+
+Usage:
+
+  storage_benchmark.py --output=results.json
+  storage_benchmark.py --latency-ms=20 --error-rate=0.01 --scenario=cp_upload
+  storage_benchmark.py --threshold=0.15
+  storage_benchmark.py --update-baseline
+
+The results are compared to storage_benchmark_baseline.json next to this
+script, or to the file given with --baseline, and the script exits with a
+non-zero status if the median time or peak memory of any scenario regressed by
+more than the threshold. Metrics that the baseline does not record (null) are
+not compared. --update-baseline records the results in the baseline file
+instead; record baselines with the default workload on the release build and
+machine that later runs are compared on.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import argparse
+import collections
+import json
+import os
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from googlecloudsdk.scripts import fake_gcs_server
+
+_BUCKET = 'benchmark-bucket'
+_FAKE_PROJECT = 'storage-benchmark-project'
+
+_MIB = 1024 * 1024
+
+DEFAULT_BASELINE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    'storage_benchmark_baseline.json')
+
+# args: gcloud storage arguments, formatted with the paths of the run.
+# setup: Called with (gcs, workload, paths) before the command runs.
+# workload: Returns (file count, byte count) moved by the command.
+# env: Property overrides for the command, without the CLOUDSDK_ prefix.
+Scenario = collections.namedtuple(
+    'Scenario', ['name', 'args', 'setup', 'workload', 'env'])
+
+Workload = collections.namedtuple(
+    'Workload',
+    ['file_count', 'file_size', 'large_file_size', 'list_object_count'])
+
+
+def _Data(size):
+  """Returns size bytes that do not compress well."""
+  if not size:
+    return b''
+  block = os.urandom(min(size, _MIB))
+  return (block * (size // len(block) + 1))[:size]
+
+
+def _WriteFiles(directory, workload):
+  os.makedirs(directory)
+  for i in range(workload.file_count):
+    with open(os.path.join(directory, 'file-{:06d}'.format(i)), 'wb') as f:
+      f.write(_Data(workload.file_size))
+
+
+def _SeedObjects(gcs, prefix, count, size):
+  gcs.ClearPrefix(_BUCKET, prefix)
+  data = _Data(size)
+  for i in range(count):
+    gcs.AddObject(_BUCKET, '{}object-{:06d}'.format(prefix, i), data)
+
+
+def _SetUpCpUpload(gcs, workload, paths):
+  del workload, paths  # Unused.
+  gcs.ClearPrefix(_BUCKET, 'cp_upload/')
+
+
+def _SetUpCpDownload(gcs, workload, paths):
+  _SeedObjects(gcs, 'cp_download/', workload.file_count, workload.file_size)
+  shutil.rmtree(paths['download_dir'], ignore_errors=True)
+  os.makedirs(paths['download_dir'])
+
+
+def _SetUpRsyncUpload(gcs, workload, paths):
+  del workload, paths  # Unused.
+  gcs.ClearPrefix(_BUCKET, 'rsync/')
+
+
+def _SetUpNothing(gcs, workload, paths):
+  del gcs, workload, paths  # Unused.
+
+
+def _SetUpLsRecursive(gcs, workload, paths):
+  del paths  # Unused.
+  _SeedObjects(gcs, 'ls/', workload.list_object_count, 0)
+
+
+def _SetUpRmRecursive(gcs, workload, paths):
+  del paths  # Unused.
+  _SeedObjects(gcs, 'rm/', workload.file_count, workload.file_size)
+
+
+def _SetUpCompositeUpload(gcs, workload, paths):
+  del workload, paths  # Unused.
+  gcs.ClearPrefix(_BUCKET, 'composite/')
+
+
+def _SetUpSlicedDownload(gcs, workload, paths):
+  _SeedObjects(gcs, 'sliced/', 1, workload.large_file_size)
+  shutil.rmtree(paths['download_dir'], ignore_errors=True)
+  os.makedirs(paths['download_dir'])
+
+
+def _SmallFiles(workload):
+  return workload.file_count, workload.file_count * workload.file_size
+
+
+def _ListedObjects(workload):
+  return workload.list_object_count, 0
+
+
+def _DeletedObjects(workload):
+  return workload.file_count, 0
+
+
+def _LargeFile(workload):
+  return 1, workload.large_file_size
+
+
+SCENARIOS = (
+    Scenario(
+        'cp_upload',
+        ('cp', '-r', '{small_dir}', 'gs://{bucket}/cp_upload/'),
+        _SetUpCpUpload, _SmallFiles, {}),
+    Scenario(
+        'cp_download',
+        ('cp', '-r', 'gs://{bucket}/cp_download', '{download_dir}'),
+        _SetUpCpDownload, _SmallFiles, {}),
+    Scenario(
+        'rsync_upload',
+        ('rsync', '-r', '{small_dir}', 'gs://{bucket}/rsync'),
+        _SetUpRsyncUpload, _SmallFiles, {}),
+    Scenario(
+        'rsync_unchanged',
+        ('rsync', '-r', '{small_dir}', 'gs://{bucket}/rsync'),
+        _SetUpNothing, _SmallFiles, {}),
+    Scenario(
+        'ls_recursive',
+        ('ls', '-r', 'gs://{bucket}/ls/'),
+        _SetUpLsRecursive, _ListedObjects, {}),
+    Scenario(
+        'rm_recursive',
+        ('rm', 'gs://{bucket}/rm/**'),
+        _SetUpRmRecursive, _DeletedObjects, {}),
+    Scenario(
+        'rm_batched',
+        ('rm', 'gs://{bucket}/rm/**'),
+        _SetUpRmRecursive, _DeletedObjects, {
+            'STORAGE_OBJECT_REQUEST_BATCH_SIZE': '100',
+        }),
+    Scenario(
+        'composite_upload',
+        ('cp', '{large_file}', 'gs://{bucket}/composite/large'),
+        _SetUpCompositeUpload, _LargeFile, {
+            'STORAGE_PARALLEL_COMPOSITE_UPLOAD_ENABLED': 'True',
+            'STORAGE_PARALLEL_COMPOSITE_UPLOAD_THRESHOLD': '1Mi',
+            'STORAGE_PARALLEL_COMPOSITE_UPLOAD_COMPONENT_SIZE': '4Mi',
+            'STORAGE_PARALLEL_COMPOSITE_UPLOAD_COMPATIBILITY_CHECK': 'False',
+        }),
+    Scenario(
+        'sliced_download',
+        ('cp', 'gs://{bucket}/sliced/object-000000', '{download_dir}/large'),
+        _SetUpSlicedDownload, _LargeFile, {
+            'STORAGE_SLICED_OBJECT_DOWNLOAD_THRESHOLD': '1Mi',
+            'STORAGE_SLICED_OBJECT_DOWNLOAD_COMPONENT_SIZE': '4Mi',
+        }),
+)
+
+
+def _Environment(config_dir, port, scenario):
+  """Returns the environment for a single benchmark run."""
+  env = dict(os.environ)
+  env.update({
+      'CLOUDSDK_CONFIG': config_dir,
+      'CLOUDSDK_CORE_PROJECT': _FAKE_PROJECT,
+      'CLOUDSDK_CORE_DISABLE_PROMPTS': '1',
+      'CLOUDSDK_CORE_DISABLE_USAGE_REPORTING': 'true',
+      'CLOUDSDK_COMPONENT_MANAGER_DISABLE_UPDATE_CHECK': 'true',
+      'CLOUDSDK_SURVEY_DISABLE_PROMPTS': 'true',
+      'CLOUDSDK_AUTH_DISABLE_CREDENTIALS': 'true',
+      'CLOUDSDK_API_ENDPOINT_OVERRIDES_STORAGE': (
+          'http://127.0.0.1:{}/storage/v1/'.format(port)),
+  })
+  for key, value in scenario.env.items():
+    env['CLOUDSDK_' + key] = value
+  return env
+
+
+def Measure(args):
+  """Runs a command in a child process and measures it and its children.
+
+  Args:
+    args: [str], The command line to run.
+
+  Returns:
+    dict, The exit code, elapsed seconds, CPU seconds and peak resident memory
+    of the command. CPU time includes every descendant process the command
+    waited for, and peak memory is that of the largest such process.
+  """
+  start = time.time()
+  exit_code = subprocess.call(
+      args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+  seconds = time.time() - start
+  usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+  return {
+      'exit_code': exit_code,
+      'seconds': seconds,
+      'cpu_seconds': usage.ru_utime + usage.ru_stime,
+      # ru_maxrss is in kilobytes on Linux.
+      'max_rss_mb': usage.ru_maxrss / 1024,
+  }
+
+
+def _MeasureInSubprocess(args, env):
+  """Runs Measure() in a fresh process so usage is not mixed across runs."""
+  proc = subprocess.run(
+      [sys.executable, os.path.abspath(__file__), '--measure', '--'] + args,
+      env=env, stdout=subprocess.PIPE)
+  return json.loads(proc.stdout.decode('utf-8'))
+
+
+def _RunOnce(gcloud, scenario, gcs, port, workload, paths):
+  """Sets up and runs a scenario once and returns its measurements."""
+  scenario.setup(gcs, workload, paths)
+  config_dir = tempfile.mkdtemp(prefix='gcloud-storage-benchmark-config-')
+  try:
+    args = gcloud + ['storage'] + [
+        arg.format(bucket=_BUCKET, **paths) for arg in scenario.args]
+    requests_before = gcs.request_count
+    errors_before = gcs.error_count
+    result = _MeasureInSubprocess(
+        args, _Environment(config_dir, port, scenario))
+    result['requests'] = gcs.request_count - requests_before
+    result['injected_errors'] = gcs.error_count - errors_before
+    return result
+  finally:
+    shutil.rmtree(config_dir, ignore_errors=True)
+
+
+def _Summarize(runs, file_count, byte_count):
+  """Reduces repeated runs of a scenario to medians."""
+  seconds = statistics.median(run['seconds'] for run in runs)
+  return {
+      'failed_runs': sum(1 for run in runs if run['exit_code']),
+      'seconds': round(seconds, 3),
+      'files_per_second': round(file_count / seconds, 1),
+      'mib_per_second': round(byte_count / _MIB / seconds, 2),
+      'cpu_seconds': round(
+          statistics.median(run['cpu_seconds'] for run in runs), 3),
+      'max_rss_mb': round(
+          statistics.median(run['max_rss_mb'] for run in runs), 1),
+      'requests': statistics.median(run['requests'] for run in runs),
+      'injected_errors': statistics.median(
+          run['injected_errors'] for run in runs),
+  }
+
+
+def RunBenchmark(gcloud, scenario_names, repeat, workload, gcs):
+  """Runs the given scenarios repeat times each against a fake server.
+
+  Args:
+    gcloud: [str], The command prefix that runs gcloud.
+    scenario_names: [str], Names of SCENARIOS to run, in order.
+    repeat: int, The number of runs per scenario.
+    workload: Workload, The sizes of the generated data.
+    gcs: fake_gcs_server.FakeGcs, The server state and fault settings.
+
+  Returns:
+    {str: dict}, The summary for each scenario keyed by its name.
+  """
+  server = fake_gcs_server.StartServer(gcs)
+  work_dir = tempfile.mkdtemp(prefix='gcloud-storage-benchmark-')
+  paths = {
+      'small_dir': os.path.join(work_dir, 'small'),
+      'large_file': os.path.join(work_dir, 'large'),
+      'download_dir': os.path.join(work_dir, 'download'),
+  }
+  try:
+    _WriteFiles(paths['small_dir'], workload)
+    with open(paths['large_file'], 'wb') as f:
+      f.write(_Data(workload.large_file_size))
+
+    results = {}
+    for scenario in SCENARIOS:
+      if scenario.name not in scenario_names:
+        continue
+      runs = [
+          _RunOnce(gcloud, scenario, gcs, server.server_address[1], workload,
+                   paths)
+          for _ in range(repeat)
+      ]
+      results[scenario.name] = _Summarize(runs, *scenario.workload(workload))
+    return results
+  finally:
+    server.shutdown()
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def FindRegressions(results, baseline, threshold):
+  """Compares results against a baseline.
+
+  Args:
+    results: {str: dict}, The output of RunBenchmark.
+    baseline: {str: dict}, A previous output of RunBenchmark. Scenarios and
+      metrics that are missing or null are not compared.
+    threshold: float, The allowed relative slowdown or growth, e.g. 0.1 for
+      10%.
+
+  Returns:
+    [str], A description of each scenario metric that regressed.
+  """
+  regressions = []
+  for name, summary in sorted(results.items()):
+    if not baseline.get(name):
+      continue
+    if summary['failed_runs'] > (baseline[name].get('failed_runs') or 0):
+      regressions.append('{}: {} failed runs'.format(
+          name, summary['failed_runs']))
+    for metric in ('seconds', 'max_rss_mb'):
+      before = baseline[name].get(metric)
+      after = summary[metric]
+      if before and after > before * (1 + threshold):
+        regressions.append('{}: {} {} -> {} (+{:.0%})'.format(
+            name, metric, before, after, after / before - 1))
+  return regressions
+
+
+def main(argv=None):
+  parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+  parser.add_argument(
+      '--gcloud', default=shutil.which('gcloud') or 'gcloud',
+      help='The gcloud executable to benchmark.')
+  parser.add_argument(
+      '--scenario', action='append', choices=[s.name for s in SCENARIOS],
+      help='A scenario to run. May be repeated. Defaults to all scenarios.')
+  parser.add_argument(
+      '--repeat', type=int, default=3,
+      help='The number of runs of each scenario.')
+  parser.add_argument(
+      '--file-count', type=int, default=500,
+      help='The number of small files in the cp, rsync and rm scenarios.')
+  parser.add_argument(
+      '--file-size', type=int, default=64 * 1024,
+      help='The size of each small file in bytes.')
+  parser.add_argument(
+      '--large-file-size', type=int, default=64 * _MIB,
+      help='The size of the composite upload and sliced download in bytes.')
+  parser.add_argument(
+      '--list-object-count', type=int, default=10000,
+      help='The number of objects in the ls scenario.')
+  parser.add_argument(
+      '--latency-ms', type=float, default=0,
+      help='Delay the fake server adds to every request.')
+  parser.add_argument(
+      '--bandwidth-mbps', type=float, default=0,
+      help='Limit on body bytes the fake server sends and receives, in MiB/s.')
+  parser.add_argument(
+      '--error-rate', type=float, default=0,
+      help='The fraction of requests the fake server fails.')
+  parser.add_argument(
+      '--error-status', type=int, default=503,
+      help='The HTTP status of failed requests, e.g. 429 or 503.')
+  parser.add_argument(
+      '--seed', type=int, default=0,
+      help='Seeds the choice of failed requests.')
+  parser.add_argument(
+      '--output', help='Write the results as JSON to this file.')
+  parser.add_argument(
+      '--baseline', default=DEFAULT_BASELINE,
+      help='Compare the results to this previous output. Pass an empty value '
+      'to skip the comparison.')
+  parser.add_argument(
+      '--update-baseline', action='store_true',
+      help='Write the results to the --baseline file instead of comparing.')
+  parser.add_argument(
+      '--threshold', type=float, default=0.1,
+      help='The allowed relative regression against the baseline.')
+  parser.add_argument(
+      '--measure', action='store_true', help='Internal.')
+  parser.add_argument('command', nargs='*', help=argparse.SUPPRESS)
+  args = parser.parse_args(argv)
+
+  if args.measure:
+    print(json.dumps(Measure(args.command)))
+    return 0
+
+  gcs = fake_gcs_server.FakeGcs(
+      [_BUCKET],
+      latency_seconds=args.latency_ms / 1000,
+      bytes_per_second=args.bandwidth_mbps * _MIB,
+      error_rate=args.error_rate,
+      error_status=args.error_status,
+      seed=args.seed)
+  workload = Workload(
+      file_count=args.file_count,
+      file_size=args.file_size,
+      large_file_size=args.large_file_size,
+      list_object_count=args.list_object_count)
+  scenario_names = args.scenario or [s.name for s in SCENARIOS]
+  results = RunBenchmark(
+      [args.gcloud], scenario_names, args.repeat, workload, gcs)
+  contents = json.dumps(results, indent=2, sort_keys=True)
+  if args.output:
+    with open(args.output, 'w') as f:
+      f.write(contents + '\n')
+  else:
+    print(contents)
+
+  if args.baseline and args.update_baseline:
+    baseline = {}
+    if os.path.exists(args.baseline):
+      with open(args.baseline) as f:
+        baseline = json.load(f)
+    baseline.update(results)
+    with open(args.baseline, 'w') as f:
+      f.write(json.dumps(baseline, indent=2, sort_keys=True) + '\n')
+  elif args.baseline:
+    with open(args.baseline) as f:
+      baseline = json.load(f)
+    regressions = FindRegressions(results, baseline, args.threshold)
+    for regression in regressions:
+      print('Storage regression: ' + regression, file=sys.stderr)
+    if regressions:
+      return 1
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
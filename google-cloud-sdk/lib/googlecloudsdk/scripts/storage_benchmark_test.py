@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the storage_benchmark.py and fake_gcs_server.py scripts."""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import email.parser
+import json
+import unittest
+import urllib.request
+
+from googlecloudsdk.scripts import fake_gcs_server
+from googlecloudsdk.scripts import storage_benchmark
+
+
+class FindRegressionsTest(unittest.TestCase):
+
+  def _Summary(self, seconds=1.0, max_rss_mb=100.0, failed_runs=0):
+    return {
+        'seconds': seconds,
+        'max_rss_mb': max_rss_mb,
+        'failed_runs': failed_runs,
+    }
+
+  def testNoRegressionWithinThreshold(self):
+    self.assertEqual(
+        storage_benchmark.FindRegressions(
+            {'cp_upload': self._Summary(seconds=1.05)},
+            {'cp_upload': self._Summary()}, 0.1),
+        [])
+
+  def testSlowerAndLargerScenariosRegress(self):
+    regressions = storage_benchmark.FindRegressions(
+        {'cp_upload': self._Summary(seconds=2.0, max_rss_mb=200.0)},
+        {'cp_upload': self._Summary()}, 0.1)
+    self.assertEqual(len(regressions), 2)
+    self.assertTrue(regressions[0].startswith('cp_upload: seconds 1.0 -> 2.0'))
+
+  def testFailedRunsRegress(self):
+    self.assertEqual(
+        storage_benchmark.FindRegressions(
+            {'rm_batched': self._Summary(failed_runs=1)},
+            {'rm_batched': self._Summary()}, 0.1),
+        ['rm_batched: 1 failed runs'])
+
+  def testUnrecordedMetricsAndScenariosAreSkipped(self):
+    self.assertEqual(
+        storage_benchmark.FindRegressions(
+            {'cp_upload': self._Summary(seconds=9.0),
+             'ls_recursive': self._Summary(seconds=9.0)},
+            {'cp_upload': self._Summary(seconds=None, max_rss_mb=None)}, 0.1),
+        [])
+
+  def testBaselineCoversEveryScenario(self):
+    with open(storage_benchmark.DEFAULT_BASELINE) as f:
+      baseline = json.load(f)
+    self.assertEqual(
+        sorted(baseline),
+        sorted(scenario.name for scenario in storage_benchmark.SCENARIOS))
+
+
+class FakeGcsServerTest(unittest.TestCase):
+
+  def setUp(self):
+    self.gcs = fake_gcs_server.FakeGcs(['bucket'])
+    self.server = fake_gcs_server.StartServer(self.gcs)
+    self.base_url = 'http://127.0.0.1:{}'.format(self.server.server_address[1])
+
+  def tearDown(self):
+    self.server.shutdown()
+
+  def testListObjects(self):
+    self.gcs.AddObject('bucket', 'dir/a', b'a')
+    self.gcs.AddObject('bucket', 'dir/b', b'bb')
+    with urllib.request.urlopen(
+        self.base_url + '/storage/v1/b/bucket/o?prefix=dir/') as response:
+      listing = json.loads(response.read())
+    self.assertEqual([item['name'] for item in listing['items']],
+                     ['dir/a', 'dir/b'])
+    self.assertEqual([item['size'] for item in listing['items']], ['1', '2'])
+
+  def testBatchDeleteAndPatch(self):
+    self.gcs.AddObject('bucket', 'a', b'a')
+    self.gcs.AddObject('bucket', 'b', b'b')
+    calls = [
+        ('DELETE /storage/v1/b/bucket/o/a HTTP/1.1\n\n'),
+        ('DELETE /storage/v1/b/bucket/o/missing HTTP/1.1\n\n'),
+        ('PATCH /storage/v1/b/bucket/o/b HTTP/1.1\n'
+         'Content-Type: application/json\n\n'
+         '{"contentType": "text/plain"}'),
+    ]
+    body = ''.join(
+        '--boundary\r\nContent-Type: application/http\r\n'
+        'Content-ID: <id+{}>\r\n\r\n{}\r\n'.format(i, call)
+        for i, call in enumerate(calls)) + '--boundary--\r\n'
+    request = urllib.request.Request(
+        self.base_url + '/batch/storage/v1', data=body.encode('utf-8'),
+        headers={'Content-Type': 'multipart/mixed; boundary=boundary'})
+    with urllib.request.urlopen(request) as response:
+      message = email.parser.BytesParser().parsebytes(
+          b'Content-Type: ' + response.headers['Content-Type'].encode('ascii')
+          + b'\r\n\r\n' + response.read())
+
+    parts = message.get_payload()
+    self.assertEqual([part['Content-ID'] for part in parts],
+                     ['<response-id+0>', '<response-id+1>', '<response-id+2>'])
+    self.assertEqual(
+        [part.get_payload().split(' ', 2)[1] for part in parts],
+        ['204', '404', '200'])
+    self.assertIsNone(self.gcs.GetObject('bucket', 'a'))
+    self.assertEqual(
+        self.gcs.GetObject('bucket', 'b').metadata['contentType'],
+        'text/plain')
+    self.assertEqual(self.gcs.request_count, 4)
+
+
+if __name__ == '__main__':
+  unittest.main()
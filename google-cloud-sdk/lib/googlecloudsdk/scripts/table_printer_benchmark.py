@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks buffered and streamed --format=table on synthetic resources.
+
+Each mode prints the same generated resources to /dev/null in a fresh process
+so that the peak resident memory of one mode does not hide the other. The
+streamed table should run in memory bounded by its width window regardless of
+the number of rows, while the buffered table grows with every row.
+
+Usage:
+
+  table_printer_benchmark.py --rows=1000000
+  table_printer_benchmark.py --rows=1000000 --memory-limit-mb=512
+
+With --memory-limit-mb each mode runs with its address space capped, and a
+mode that runs out of memory is reported as failed.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import unicode_literals
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+from googlecloudsdk.core.resource import resource_printer
+
+_COLUMNS = ('name, zone.basename(), machineType.basename(), status, '
+            'cpus:align=right, creationTimestamp')
+
+MODES = {
+    'buffered': 'table({})'.format(_COLUMNS),
+    'stream': 'table[stream]({})'.format(_COLUMNS),
+}
+
+_ZONES = ('us-central1-a', 'us-east1-b', 'europe-west4-c', 'asia-east1-a')
+_MACHINE_TYPES = ('e2-medium', 'n2-standard-8', 'c3-highcpu-176')
+_STATUSES = ('RUNNING', 'TERMINATED', 'STAGING')
+
+
+def _Resources(count):
+  """Generates count synthetic compute instance like resources."""
+  for i in range(count):
+    yield {
+        'name': 'instance-{}'.format(i),
+        'zone': 'projects/p/zones/' + _ZONES[i % len(_ZONES)],
+        'machineType': 'zones/z/machineTypes/' + _MACHINE_TYPES[
+            i % len(_MACHINE_TYPES)],
+        'status': _STATUSES[i % len(_STATUSES)],
+        'cpus': 2 ** (i % 8),
+        'creationTimestamp': '2026-01-{:02d}T12:00:00.000-07:00'.format(
+            i % 28 + 1),
+    }
+
+
+def RunMode(mode, rows):
+  """Prints rows resources in mode in this process.
+
+  Args:
+    mode: str, A key of MODES.
+    rows: int, The number of resources to print.
+
+  Returns:
+    dict, The elapsed seconds and peak resident memory of this process.
+  """
+  start = time.time()
+  with open(os.devnull, 'w') as out:
+    resource_printer.Print(_Resources(rows), MODES[mode], out=out)
+  return {
+      'seconds': round(time.time() - start, 3),
+      # ru_maxrss is in kilobytes on Linux.
+      'max_rss_mb': round(
+          resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+  }
+
+
+def _RunModeInSubprocess(mode, rows, memory_limit_mb):
+  """Runs RunMode() in a fresh process and returns its result."""
+  args = [sys.executable, os.path.abspath(__file__), '--run-mode=' + mode,
+          '--rows={}'.format(rows)]
+  if memory_limit_mb:
+    args.append('--memory-limit-mb={}'.format(memory_limit_mb))
+  proc = subprocess.run(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+  if proc.returncode:
+    error = proc.stderr.decode('utf-8', 'replace').strip().splitlines()
+    return {'failed': error[-1] if error else proc.returncode}
+  return json.loads(proc.stdout.decode('utf-8'))
+
+
+def main(argv=None):
+  parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+  parser.add_argument(
+      '--rows', type=int, default=1000000,
+      help='The number of synthetic resources to print.')
+  parser.add_argument(
+      '--memory-limit-mb', type=int,
+      help='Cap the address space of each mode to this many megabytes.')
+  parser.add_argument('--run-mode', choices=sorted(MODES), help='Internal.')
+  args = parser.parse_args(argv)
+
+  if args.run_mode:
+    if args.memory_limit_mb:
+      limit = args.memory_limit_mb * 1024 * 1024
+      resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    print(json.dumps(RunMode(args.run_mode, args.rows)))
+    return 0
+
+  results = {
+      mode: _RunModeInSubprocess(mode, args.rows, args.memory_limit_mb)
+      for mode in sorted(MODES)
+  }
+  print(json.dumps(results, indent=2, sort_keys=True))
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
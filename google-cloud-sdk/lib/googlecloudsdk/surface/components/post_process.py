@@ -2,8 +2,14 @@
 
 """The command to perform any necessary post installation steps."""
 
+import os
+
 from googlecloudsdk.calliope import base
+from googlecloudsdk.calliope import command_index
+from googlecloudsdk.core import log
+from googlecloudsdk.core import properties
 from googlecloudsdk.core.updater import local_state
+import surface
 
 
 @base.Hidden
@@ -17,3 +23,17 @@ class PostProcess(base.Command):
   def Run(self, args):
     state = local_state.InstallationState.ForCurrent()
     state.CompilePythonFiles()
+    if properties.VALUES.core.enable_command_index.GetBool():
+      self._RebuildCommandIndex()
+
+  def _RebuildCommandIndex(self):
+    command_root = os.path.dirname(surface.__file__)
+    try:
+      index = command_index.Rebuild(
+          command_root, self._cli_power_users_only.name)
+    # pylint:disable=broad-except, The index is an optimization only; gcloud
+    # falls back to listing the command directories without it.
+    except Exception as e:
+      log.debug('Failed to rebuild the command index: %s', e)
+      return
+    log.debug('Rebuilt the command index [%s].', index.path)
@@ -0,0 +1,51 @@
+# Copyright 2026 Google Inc. All Rights Reserved.
+
+"""A command that serves gcloud commands from a resident process."""
+
+import os
+
+from googlecloudsdk.calliope import base
+from googlecloudsdk.command_lib.daemon import protocol
+from googlecloudsdk.command_lib.daemon import server
+from googlecloudsdk.core import config
+from googlecloudsdk.core import log
+
+
+class Daemon(base.Command):
+  """Serve gcloud commands from a warm resident process.
+
+  Runs in the foreground and serves commands forwarded by the client shim:
+
+    $ export CLOUDSDK_DAEMON_SOCKET=$HOME/.gcloud-daemon.sock
+    $ gcloud meta daemon &
+    $ python -m googlecloudsdk.command_lib.daemon.client compute zones list
+
+  Each command runs in a process forked from the daemon with the caller's
+  arguments, environment, working directory and standard streams, so only
+  the interpreter startup and module imports are shared between commands.
+  """
+
+  @staticmethod
+  def Args(parser):
+    parser.add_argument(
+        '--socket',
+        help=('The path of the Unix socket to listen on. Defaults to '
+              '${} or daemon.sock in the configuration directory.'.format(
+                  protocol.SOCKET_ENV_VAR)))
+    parser.add_argument(
+        '--preload',
+        action='store_true',
+        default=True,
+        help='Import every command before serving so that no request pays '
+        'for loading its command. Use --no-preload to load each command when '
+        'it is first requested.')
+
+  def Run(self, args):
+    socket_path = (
+        args.socket or os.environ.get(protocol.SOCKET_ENV_VAR) or
+        os.path.join(config.Paths().global_config_dir, 'daemon.sock'))
+    daemon = server.DaemonServer(socket_path, self._cli_power_users_only)
+    if args.preload:
+      log.status.Print('Loaded {} commands and groups.'.format(
+          daemon.Preload()))
+    daemon.Serve()